@@ -6,9 +6,12 @@ import re
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 from typing import List, Optional
-from openai import OpenAI
 from app.config.settings import settings
 from app.services.rmp_service import format_course_context
+from app.services.chat_session_service import ChatSessionStore
+from app.services.intent_router import route_message
+from app.services.llm_service import chat_completion, get_openai_client, request_key
+from app.services.result_cache import ResultCache
 import logging
 
 logger = logging.getLogger(__name__)
@@ -17,22 +20,42 @@ router = APIRouter()
 
 # Initialize OpenAI client
 if settings.OPENAI_API_KEY:
-    client = OpenAI(api_key=settings.OPENAI_API_KEY)
+    client = get_openai_client()
 else:
     client = None
     logger.warning("OpenAI API key not configured - chat will return placeholder responses")
 
+# Answers keyed by the full completion request (history, context and prompt),
+# so a repeated question in the same situation is answered without the LLM
+chat_cache = ResultCache(
+    namespace="chat",
+    max_entries=settings.CHAT_CACHE_SIZE,
+)
+
 # Regex to extract course codes like "CS 2110" or "MATH 1920"
 COURSE_CODE_PATTERN = re.compile(r'\b(CS|MATH)\s+(\d{4})\b', re.IGNORECASE)
 
+# Maximum number of courses whose review data is injected into one prompt
+MAX_CONTEXT_COURSES = 5
+
+# Server-side conversation history, keyed by session id
+session_store = ChatSessionStore(
+    max_sessions=settings.CHAT_SESSION_MAX_SESSIONS,
+    token_budget=settings.CHAT_HISTORY_TOKEN_BUDGET,
+    summary_budget=settings.CHAT_SUMMARY_TOKEN_BUDGET,
+    db_path=settings.CHAT_SESSION_DB or None,
+)
+
 
 class ChatRequest(BaseModel):
     message: str
-    history: Optional[List[dict]] = []
+    session_id: Optional[str] = None
+    history: Optional[List[dict]] = []  # Only used to seed a new session (legacy clients)
 
 
 class ChatResponse(BaseModel):
     response: str
+    session_id: Optional[str] = None
 
 
 def extract_course_codes(text: str) -> List[str]:
@@ -60,24 +83,42 @@ async def chat(request: ChatRequest):
     Enriches responses with RateMyProfessor and Reddit review data
     when courses are mentioned.
 
+    Simple factual questions about a single course are answered locally
+    from the catalog indexes; only open-ended questions reach the model.
+    Conversation history is kept server-side per session_id and compacted
+    to a fixed token budget, so clients only send the new message.
+
     Args:
-        request: ChatRequest with message and optional history
+        request: ChatRequest with message and optional session_id
 
     Returns:
         ChatResponse with AI-generated advice
     """
+    # Factual lookups (prereqs, unlocks, difficulty, ...) skip the LLM entirely
+    local_answer = route_message(request.message)
+    if local_answer:
+        session = await session_store.get_or_create(request.session_id)
+        await session_store.append_turn(session, "user", request.message)
+        await session_store.append_turn(session, "assistant", local_answer)
+        return ChatResponse(response=local_answer, session_id=session.session_id)
+
     if not client:
         return ChatResponse(
-            response="Chat functionality requires an OpenAI API key. Please configure OPENAI_API_KEY in your .env file."
+            response="Chat functionality requires an OpenAI API key. Please configure OPENAI_API_KEY in your .env file.",
+            session_id=request.session_id
         )
 
     try:
-        # Extract course codes from the user's message and recent history
-        all_text = request.message
-        for msg in (request.history or [])[-3:]:
-            all_text += " " + msg.get('content', '')
+        session = await session_store.get_or_create(request.session_id)
+        if not session.turns and not session.summary and request.history:
+            await session_store.seed_history(session, request.history[-6:])
 
-        course_codes = extract_course_codes(all_text)
+        # Courses in the new message take priority over ones from earlier turns
+        course_codes = extract_course_codes(request.message)
+        for code in reversed(extract_course_codes(session.context_text())):
+            if code not in course_codes:
+                course_codes.append(code)
+        course_codes = course_codes[:MAX_CONTEXT_COURSES]
 
         # Build course context from RMP and Reddit data
         course_context = format_course_context(course_codes)
@@ -108,16 +149,22 @@ Student question: {request.message}
 
 Provide a helpful, concise response."""
 
-        response = client.chat.completions.create(
-            model='gpt-4o-mini',
-            messages=[
-                {"role": "system", "content": "You are a helpful Cornell course advisor assistant."},
-                {"role": "user", "content": prompt}
-            ],
-            temperature=0.7,
-            max_tokens=500
-        )
-        return ChatResponse(response=response.choices[0].message.content)
+        messages = [{"role": "system", "content": "You are a helpful Cornell course advisor assistant."}]
+        messages.extend(session.to_messages())
+        messages.append({"role": "user", "content": prompt})
+
+        params = dict(model='gpt-4o-mini', messages=messages, temperature=0.7, max_tokens=500)
+        cache_key = request_key(**params)
+        answer = await chat_cache.aget(cache_key)
+        if answer is None:
+            answer = await chat_completion(client, **params)
+            await chat_cache.aset(cache_key, answer)
+
+        # Store the raw question (not the context-stuffed prompt) in the history
+        await session_store.append_turn(session, "user", request.message)
+        await session_store.append_turn(session, "assistant", answer)
+
+        return ChatResponse(response=answer, session_id=session.session_id)
 
     except Exception as e:
         logger.error(f"Chat error: {e}")
@@ -0,0 +1,121 @@
+"""
+Courses API endpoint - Server-side course search, typeahead and similar courses
+"""
+
+from fastapi import APIRouter, HTTPException, Query
+from typing import Any, Dict, List, Literal, Optional
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+def _split(values: Optional[List[str]]) -> List[str]:
+    """Accept both repeated (?subject=CS&subject=MATH) and comma-separated values"""
+    return [part for value in values or [] for part in value.split(",") if part.strip()]
+
+
+@router.get("/courses/search")
+async def search_courses(
+    q: Optional[str] = Query(None, max_length=100, description="Code or title text"),
+    subject: Optional[List[str]] = Query(None, description="Subjects, e.g. CS,MATH"),
+    level: Optional[List[str]] = Query(None, description="Levels, e.g. 4000 (or 4)"),
+    min_difficulty: Optional[float] = Query(None, ge=0, le=10),
+    max_difficulty: Optional[float] = Query(None, ge=0, le=10),
+    min_enjoyment: Optional[float] = Query(None, ge=0, le=10),
+    max_enjoyment: Optional[float] = Query(None, ge=0, le=10),
+    min_centrality: Optional[float] = Query(None, ge=0),
+    sort: Literal["relevance", "centrality", "difficulty", "enjoyment", "level", "code"] = "relevance",
+    order: Optional[Literal["asc", "desc"]] = None,
+    limit: int = Query(20, ge=1, le=200),
+) -> Dict[str, Any]:
+    """
+    Filter and sort the catalog, e.g. 4000-level CS courses with difficulty
+    at most 6 and enjoyment at least 7, by centrality:
+    `/api/courses/search?subject=CS&level=4000&max_difficulty=6&min_enjoyment=7&sort=centrality`
+
+    Difficulty and enjoyment are the RMP averages where available, otherwise
+    Reddit sentiment, on a 1-10 scale. Bounds are inclusive.
+
+    Returns:
+        - total: Number of matching courses
+        - results: Course summaries (id, title, subject, level, difficulty_score,
+          enjoyment_score, centrality, and match_score for text queries)
+    """
+    from app.services.course_search import get_course_search
+
+    levels = []
+    for value in _split(level):
+        try:
+            number = int(value.strip().lower().rstrip("x") or 0)
+        except ValueError:
+            continue
+        levels.append(number * 1000 if 0 < number < 10 else number)
+
+    # The first call builds the index; later ones take well under a millisecond
+    search = await asyncio.to_thread(get_course_search)
+    return search.search(
+        query=q,
+        subjects=_split(subject),
+        levels=levels,
+        min_difficulty=min_difficulty,
+        max_difficulty=max_difficulty,
+        min_enjoyment=min_enjoyment,
+        max_enjoyment=max_enjoyment,
+        min_centrality=min_centrality,
+        sort=sort,
+        descending=None if order is None else order == "desc",
+        limit=limit,
+    )
+
+
+@router.get("/courses/suggest")
+async def suggest_courses(
+    q: str = Query(..., max_length=100, description="Text typed so far"),
+    limit: int = Query(8, ge=1, le=20),
+) -> Dict[str, Any]:
+    """
+    Typeahead suggestions for course codes ("cs21", "CS 21", "2110") and
+    title words ("mach", "machine lea"), most central courses first.
+
+    Returns:
+        - suggestions: List of {id, title, match} where match is "code" or "title"
+    """
+    from app.services.course_suggest import get_course_suggester
+
+    suggester = await asyncio.to_thread(get_course_suggester)
+    return {"suggestions": suggester.suggest(q, limit)}
+
+
+@router.get("/courses/{course_id}/similar")
+async def similar_courses(
+    course_id: str,
+    limit: int = Query(5, ge=1, le=10),
+) -> Dict[str, Any]:
+    """
+    Courses most like a given one, from the neighbor table precomputed by
+    build_graph.py (description similarity blended with shared prerequisites).
+
+    Args:
+        course_id: Course code in any spacing or case ("CS 3780", "cs3780")
+
+    Returns:
+        - course: {id, title}
+        - similar: List of {id, title, score} (score 0-1), most similar first
+    """
+    from app.services.course_table import get_course_table
+
+    table = await asyncio.to_thread(get_course_table)
+    course = table.find(course_id)
+    if course is None:
+        raise HTTPException(status_code=404, detail=f"Course {course_id} not found")
+
+    return {
+        "course": {"id": course.id, "title": course.title},
+        "similar": [
+            {"id": other.id, "title": other.title, "score": round(score, 4)}
+            for other, score in table.similar(course.row, limit)
+        ],
+    }
@@ -1,13 +1,21 @@
+import asyncio
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 from typing import Dict, Any, List
-from ..services.job_matcher import JobMatcherService
+from ..config.settings import settings
+from ..services.job_matcher import JobMatcherService, match_postings
 
 router = APIRouter()
 job_matcher = JobMatcherService()
 
 class JobMatchRequest(BaseModel):
     job_description: str
+    explain: bool = True
+    completed_courses: List[str] = []
+
+class BatchJobMatchRequest(BaseModel):
+    postings: List[str]
+    top_k: int = Field(default=5, ge=1, le=50)
 
 @router.post("/match-job")
 async def match_job(request: JobMatchRequest) -> Dict[str, Any]:
@@ -16,12 +24,16 @@ async def match_job(request: JobMatchRequest) -> Dict[str, Any]:
 
     Args:
         job_description: The full job description text
+        explain: Add an LLM-written reason for each matched course
+        completed_courses: Courses already taken (left out of learning paths)
 
     Returns:
         - matched_courses: List of courses with relevance scores
-        - recommended_paths: Suggested learning paths
+        - recommended_paths: Prerequisite-ordered learning paths
         - skill_gaps: Skills mentioned in job but not covered
-        - overall_match_score: Overall match percentage
+        - covered_skills: Skills mentioned in job and taught by the matched courses
+        - gap_courses: Other catalog courses teaching each missing skill
+        - overall_match_score: Share of the job's skills covered (percent)
     """
     if not request.job_description or not request.job_description.strip():
         raise HTTPException(
@@ -30,7 +42,11 @@ async def match_job(request: JobMatchRequest) -> Dict[str, Any]:
         )
 
     try:
-        result = await job_matcher.match_job_to_courses(request.job_description)
+        result = await job_matcher.match_job_to_courses(
+            request.job_description,
+            explain=request.explain,
+            completed_courses=request.completed_courses,
+        )
         return result
 
     except Exception as e:
@@ -38,3 +54,36 @@ async def match_job(request: JobMatchRequest) -> Dict[str, Any]:
             status_code=500,
             detail=f"Failed to match job description: {str(e)}"
         )
+
+
+@router.post("/match-jobs/batch")
+async def match_jobs_batch(request: BatchJobMatchRequest) -> Dict[str, Any]:
+    """
+    Match many job postings against the catalog in one pass (no LLM calls).
+
+    Args:
+        postings: Job description texts
+        top_k: Courses returned per posting
+
+    Returns:
+        - results: Top courses per posting, in input order
+        - course_demand: Courses ranked by how many postings matched them
+        - postings: Number of postings matched
+    """
+    if not request.postings:
+        raise HTTPException(status_code=400, detail="No job postings provided")
+    if len(request.postings) > settings.JOB_BATCH_MAX_POSTINGS:
+        raise HTTPException(
+            status_code=413,
+            detail=f"At most {settings.JOB_BATCH_MAX_POSTINGS} postings per batch"
+        )
+
+    try:
+        # Vectorizing thousands of postings is CPU-bound; keep the event loop free
+        return await asyncio.to_thread(match_postings, request.postings, request.top_k)
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Failed to match job postings: {str(e)}"
+        )
@@ -0,0 +1,138 @@
+"""
+Pipeline API endpoint - Resume upload to timeline in a single request
+"""
+
+import asyncio
+import json
+from fastapi import APIRouter, UploadFile, File, Form, HTTPException
+from fastapi.responses import StreamingResponse
+from typing import Any, Dict, Optional
+from app.api.resume import resume_parser, read_upload_capped, ALLOWED_CONTENT_TYPES
+from app.api.timeline import generate_timelines
+import logging
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# Map academic level (from the resume analysis) to the planning semester
+SEMESTER_BY_LEVEL = {
+    "freshman": "Freshman Spring",
+    "sophomore": "Sophomore Fall",
+    "junior": "Junior Fall",
+    "senior": "Senior Fall",
+    "graduate": "Graduate Fall",
+}
+DEFAULT_SEMESTER = "Sophomore Fall"
+
+
+def _career_goal_from_resume(resume: Dict[str, Any], goal: str = "") -> str:
+    """Career goal text (the student's own, else the resume's) enriched with interests"""
+    goal = goal or resume.get("career_goal", "")
+    if goal and resume.get("interests"):
+        goal += f". Interested in: {', '.join(resume['interests'])}"
+    return goal
+
+
+@router.post("/resume-to-timeline")
+async def resume_to_timeline(
+    file: UploadFile = File(...),
+    career_goal: Optional[str] = Form(None),
+    current_semester: Optional[str] = Form(None),
+) -> StreamingResponse:
+    """
+    Parse a resume and plan timelines server-side as one pipeline.
+
+    Local skill and course extraction is streamed first. If the student
+    provided both a career goal and their current semester, planning starts
+    right away and overlaps the resume's LLM analysis. Otherwise planning
+    waits for the analysis, which supplies the semester (from the student's
+    level), the interests added to the goal, and the goal itself if none
+    was given.
+
+    Returns:
+        NDJSON events, in order:
+        - {"stage": "extracted", "skills": [...], "courses": [...]}
+        - {"stage": "resume", "resume": {...}}  (same shape as /upload-resume)
+        - {"stage": "timeline", "analysis": {...}, "paths": {...}}
+          (omitted when no career goal is given or found in the resume)
+        or {"stage": "error", "detail": "..."} if a step fails
+    """
+    if file.content_type not in ALLOWED_CONTENT_TYPES:
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid file type. Please upload a PDF, DOCX, or TXT file."
+        )
+
+    contents = await read_upload_capped(file)
+    content_type = file.content_type
+    goal = (career_goal or "").strip()
+
+    async def events():
+        tasks = []
+
+        def start_planning(goal_text: str, completed, semester: str) -> asyncio.Task:
+            task = asyncio.create_task(generate_timelines(
+                career_goal=goal_text,
+                completed_courses=completed,
+                current_semester=semester,
+            ))
+            tasks.append(task)
+            return task
+
+        try:
+            plan_task = None
+            file_key = resume_parser.file_cache_key(contents, content_type)
+            resume = await resume_parser.cache.aget(file_key)
+
+            if resume is None:
+                extracted = await resume_parser.extract_local(contents, content_type)
+                yield {"stage": "extracted", "skills": extracted["skills"], "courses": extracted["courses"]}
+
+                # Planning only needs the goal, semester and completed courses, so
+                # it can run alongside the resume analysis when the student gave both
+                if goal and current_semester:
+                    plan_task = start_planning(goal, extracted["courses"], current_semester)
+
+                analysis, analyzed = await resume_parser.analyze(extracted["text"])
+                resume = resume_parser.build_result(extracted, analysis)
+                if analyzed:
+                    await resume_parser.cache.aset(file_key, resume)
+            else:
+                yield {"stage": "extracted", "skills": resume["skills"], "courses": resume["courses"]}
+
+            yield {"stage": "resume", "resume": resume}
+
+            if plan_task is None:
+                goal_text = _career_goal_from_resume(resume, goal)
+                if not goal_text:
+                    # Nothing to plan for; the client shows the parsed resume only
+                    return
+                semester = current_semester or SEMESTER_BY_LEVEL.get(
+                    str(resume.get("current_level", "")).lower(), DEFAULT_SEMESTER
+                )
+                plan_task = start_planning(goal_text, resume["courses"], semester)
+
+            result = await plan_task
+            yield {
+                "stage": "timeline",
+                "analysis": result.get("analysis", {}),
+                "paths": result.get("paths", {}),
+            }
+
+        except ValueError as e:
+            logger.error(f"Resume-to-timeline pipeline error: {e}")
+            yield {"stage": "error", "detail": str(e)}
+        except Exception as e:
+            logger.error(f"Unexpected error in resume-to-timeline pipeline: {e}")
+            yield {"stage": "error", "detail": "Failed to process resume"}
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def ndjson_lines():
+        async for event in events():
+            yield json.dumps(event) + "\n"
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
@@ -1,13 +1,146 @@
 from fastapi import APIRouter, UploadFile, File, HTTPException
-from fastapi.responses import JSONResponse
-import os
+from fastapi.responses import JSONResponse, StreamingResponse
+import json
 import tempfile
-from typing import Dict, Any
+from typing import Dict, Any, BinaryIO
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+from ..config.settings import settings
 from ..services.resume_parser import ResumeParser
+from ..services.text_extraction import extraction_pool, ExtractionQueueFull, ExtractionTimeout
+from ..services.bulk_resume_service import open_archive, analyze_archive
 
 router = APIRouter()
 resume_parser = ResumeParser()
 
+ALLOWED_CONTENT_TYPES = [
+    "application/pdf",
+    "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+    "text/plain"
+]
+MAX_UPLOAD_BYTES = 5 * 1024 * 1024  # 5MB
+UPLOAD_CHUNK_BYTES = 64 * 1024
+ARCHIVE_SPOOL_BYTES = 16 * 1024 * 1024  # Archives larger than this spill to disk
+MULTIPART_OVERHEAD_BYTES = 64 * 1024  # Boundaries and part headers around the file
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Reject oversized upload requests before their body is parsed.
+
+    Starlette reads the whole multipart body into a SpooledTemporaryFile
+    (on disk above 1MB) before an endpoint runs, so checks inside the
+    endpoint come too late to save the read or the temp file. Requests whose
+    Content-Length is over the limit get a 413 without any of the body being
+    read; bodies without one (chunked) are counted as they arrive and cut
+    off with a 413 once they pass it.
+
+    Args:
+        app: ASGI application
+        limits: Request path -> maximum body size in bytes
+    """
+
+    def __init__(self, app: ASGIApp, limits: Dict[str, int]):
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        limit = self.limits.get(scope["path"]) if scope["type"] == "http" else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope["headers"]).get(b"content-length", b"")
+        if content_length.isdigit() and int(content_length) > limit:
+            response = JSONResponse(status_code=413, content={"detail": "Upload exceeds size limit."})
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive() -> Message:
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # FastAPI re-raises HTTPExceptions from body parsing as-is
+                    raise HTTPException(status_code=413, detail="Upload exceeds size limit.")
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+def upload_body_limits(prefix: str = "/api") -> Dict[str, int]:
+    """Body size limits for the upload endpoints, for UploadSizeLimitMiddleware"""
+    archive_bytes = settings.BULK_RESUME_MAX_ARCHIVE_MB * 1024 * 1024
+    return {
+        f"{prefix}/upload-resume": MAX_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES,
+        f"{prefix}/resume-to-timeline": MAX_UPLOAD_BYTES + MULTIPART_OVERHEAD_BYTES,
+        f"{prefix}/upload-resumes/bulk": archive_bytes + MULTIPART_OVERHEAD_BYTES,
+    }
+
+
+async def read_upload_capped(file: UploadFile, max_size: int = MAX_UPLOAD_BYTES) -> bytes:
+    """
+    Read an upload in chunks, rejecting it once it exceeds max_size.
+
+    By now Starlette has already received the whole body; early rejection
+    of large requests is UploadSizeLimitMiddleware's job. This is the exact
+    check on the file itself, which the middleware's limit (whole body plus
+    multipart overhead) only approximates.
+
+    Args:
+        file: Uploaded file
+        max_size: Maximum accepted size in bytes
+
+    Returns:
+        File contents
+    """
+    if file.size is not None and file.size > max_size:
+        raise HTTPException(
+            status_code=400,
+            detail="File size exceeds 5MB limit."
+        )
+
+    buffer = bytearray()
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_BYTES)
+        if not chunk:
+            break
+        buffer += chunk
+        if len(buffer) > max_size:
+            raise HTTPException(
+                status_code=400,
+                detail="File size exceeds 5MB limit."
+            )
+    return bytes(buffer)
+
+
+async def spool_upload_capped(file: UploadFile, max_size: int) -> BinaryIO:
+    """
+    Copy an upload into a spooled file we own, enforcing max_size while copying.
+
+    FastAPI closes the request's UploadFile before a streaming response body
+    runs, so bulk processing needs its own handle to the archive.
+    """
+    if file.size is not None and file.size > max_size:
+        raise HTTPException(status_code=400, detail="Archive exceeds size limit.")
+
+    spool = tempfile.SpooledTemporaryFile(max_size=ARCHIVE_SPOOL_BYTES)
+    total = 0
+    while True:
+        chunk = await file.read(UPLOAD_CHUNK_BYTES)
+        if not chunk:
+            break
+        total += len(chunk)
+        if total > max_size:
+            spool.close()
+            raise HTTPException(status_code=400, detail="Archive exceeds size limit.")
+        spool.write(chunk)
+    spool.seek(0)
+    return spool
+
+
 @router.post("/upload-resume")
 async def upload_resume(file: UploadFile = File(...)) -> Dict[str, Any]:
     """
@@ -20,47 +153,76 @@ async def upload_resume(file: UploadFile = File(...)) -> Dict[str, Any]:
         - raw_text: Extracted text from resume
     """
     # Validate file type
-    allowed_types = [
-        "application/pdf",
-        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-        "text/plain"
-    ]
-
-    if file.content_type not in allowed_types:
+    if file.content_type not in ALLOWED_CONTENT_TYPES:
         raise HTTPException(
             status_code=400,
             detail="Invalid file type. Please upload a PDF, DOCX, or TXT file."
         )
 
-    # Validate file size (max 5MB)
-    max_size = 5 * 1024 * 1024
-    contents = await file.read()
-    if len(contents) > max_size:
-        raise HTTPException(
-            status_code=400,
-            detail="File size exceeds 5MB limit."
-        )
+    # Validate file size (max 5MB) while reading
+    contents = await read_upload_capped(file)
 
     try:
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(delete=False, suffix=os.path.splitext(file.filename)[1]) as tmp_file:
-            tmp_file.write(contents)
-            tmp_file_path = tmp_file.name
-
-        # Parse resume
-        parsed_data = await resume_parser.parse_resume(tmp_file_path, file.content_type)
-
-        # Clean up temporary file
-        os.unlink(tmp_file_path)
+        # Parse resume directly from the in-memory buffer
+        parsed_data = await resume_parser.parse_resume(contents, file.content_type)
 
         return JSONResponse(content=parsed_data)
 
-    except Exception as e:
-        # Clean up on error
-        if 'tmp_file_path' in locals() and os.path.exists(tmp_file_path):
-            os.unlink(tmp_file_path)
+    except (ExtractionQueueFull, ExtractionTimeout) as e:
+        status_code = 503 if isinstance(e, ExtractionQueueFull) else 422
+        raise HTTPException(status_code=status_code, detail=str(e))
 
+    except Exception as e:
         raise HTTPException(
             status_code=500,
             detail=f"Failed to parse resume: {str(e)}"
         )
+
+
+@router.post("/upload-resumes/bulk")
+async def upload_resumes_bulk(file: UploadFile = File(...)) -> StreamingResponse:
+    """
+    Upload a zip archive of resumes (PDF, DOCX, or TXT) and analyze them all.
+
+    Files are de-duplicated by content hash and parsed concurrently; results
+    stream back as NDJSON, one line per file in completion order.
+
+    Returns:
+        NDJSON lines with file, sha256, status ("ok", "duplicate", "skipped",
+        "error") and result or error, then a final {"status": "done"} summary
+    """
+    archive_file = await spool_upload_capped(file, settings.BULK_RESUME_MAX_ARCHIVE_MB * 1024 * 1024)
+    try:
+        archive = open_archive(archive_file)
+    except ValueError as e:
+        archive_file.close()
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def ndjson_lines():
+        try:
+            async for line in analyze_archive(
+                archive,
+                resume_parser,
+                concurrency=settings.BULK_RESUME_CONCURRENCY,
+                max_files=settings.BULK_RESUME_MAX_FILES,
+                max_file_bytes=MAX_UPLOAD_BYTES,
+            ):
+                yield json.dumps(line) + "\n"
+        finally:
+            archive.close()
+            archive_file.close()
+
+    return StreamingResponse(ndjson_lines(), media_type="application/x-ndjson")
+
+
+@router.get("/upload-resume/stats")
+async def resume_extraction_stats() -> Dict[str, Any]:
+    """
+    Resume extraction pool metrics.
+
+    Returns:
+        - queue_depth: Jobs currently queued or running
+        - completed / failed / timed_out / rejected: Job counters
+        - avg_seconds: Mean extraction time
+    """
+    return extraction_pool.stats()
@@ -17,6 +17,9 @@ async def get_study_materials(course_code: str) -> Dict[str, Any]:
         - course_code: Formatted course code
         - course_title: Full course title
         - materials: List of study resources with type, difficulty, etc.
+        - source: "pregenerated", "cache", "generated" (by this request) or
+          "fallback" (placeholder links, served when generation is slow or
+          fails; real materials follow on a later request)
     """
     # Normalize course code (handle both "CS 2110" and "CS2110" formats)
     normalized_code = course_code.upper().replace(" ", "")
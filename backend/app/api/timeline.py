@@ -4,20 +4,27 @@ Timeline API endpoint - Generate personalized course timelines
 
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from typing import TYPE_CHECKING, List, Optional, Dict, Any, Tuple
 from app.services.timeline_planner import TimelinePlanner
-from pathlib import Path
+from app.services.catalog import catalog_version, get_catalog
+from app.services.llm_service import request_key
+from app.services.result_cache import ResultCache
+from app.config.settings import settings
+from app.api.study_materials import materials_service
 import logging
-import json
+
+if TYPE_CHECKING:
+    from app.services.course_table import Course
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# Paths to data files (use relative paths for deployment)
-DATA_DIR = Path(__file__).parent.parent.parent / "data"
-GRAPH_FILE = DATA_DIR / "graph_data.json"
-PREREQ_FILE = DATA_DIR / "prerequisites.json"
+# Planned timelines keyed by goal, completed courses, semester and catalog version
+timeline_cache = ResultCache(
+    namespace="timeline",
+    max_entries=settings.TIMELINE_CACHE_SIZE,
+)
 
 
 class TimelineRequest(BaseModel):
@@ -32,6 +39,75 @@ class TimelineResponse(BaseModel):
     paths: Dict[str, Any]
 
 
+def load_planning_data() -> Tuple[List["Course"], Dict[str, List[str]]]:
+    """
+    Load the courses and prerequisite map used by the planner.
+
+    Returns:
+        (available_courses, prerequisites)
+    """
+    from app.services.course_table import get_course_table
+
+    available_courses = list(get_course_table())
+    prereqs = get_catalog().prerequisite_map()
+    if not prereqs:
+        logger.error("No prerequisite data in the catalog")
+
+    return available_courses, prereqs
+
+
+def timeline_course_codes(paths: Dict[str, Any]) -> List[str]:
+    """Every course code in the planned paths, in plan order"""
+    codes = []
+    for path in paths.values():
+        for semester in (path or {}).get('semesters', []):
+            for course in semester.get('courses', []):
+                if isinstance(course, dict) and course.get('code'):
+                    codes.append(course['code'])
+    return list(dict.fromkeys(codes))
+
+
+async def generate_timelines(
+    career_goal: str,
+    completed_courses: List[str],
+    current_semester: Optional[str],
+) -> Dict[str, Any]:
+    """
+    Run the TimelinePlanner against the catalog (raises ValueError without an API key).
+
+    Results are cached per goal, completed courses, semester and catalog
+    version. Study materials for every planned course are queued for
+    background generation, so they are warm by the time the student opens them.
+    """
+    cache_key = request_key(
+        career_goal=" ".join(career_goal.lower().split()),
+        completed_courses=sorted(set(completed_courses)),
+        current_semester=current_semester,
+        catalog_version=catalog_version(),
+    )
+    result = await timeline_cache.aget(cache_key)
+    if result is None:
+        available_courses, prereqs = load_planning_data()
+        planner = TimelinePlanner()
+        result = await planner.generate_timelines(
+            career_goal=career_goal,
+            completed_courses=completed_courses,
+            current_semester=current_semester,
+            available_courses=available_courses,
+            prerequisites=prereqs
+        )
+        await timeline_cache.aset(cache_key, result)
+
+    try:
+        queued = await materials_service.prefetch(timeline_course_codes(result.get('paths', {})))
+        if queued:
+            logger.info(f"Queued study materials prefetch for {queued} courses")
+    except Exception as e:
+        logger.warning(f"Could not queue study materials prefetch: {e}")
+
+    return result
+
+
 @router.post("/plan-timeline", response_model=TimelineResponse)
 async def plan_timeline(request: TimelineRequest):
     """
@@ -44,37 +120,10 @@ async def plan_timeline(request: TimelineRequest):
         TimelineResponse with analysis and 3 path options (theorist, engineer, balanced)
     """
     try:
-        # Load available courses from graph data
-        available_courses = []
-        if GRAPH_FILE.exists():
-            try:
-                with open(GRAPH_FILE, 'r') as f:
-                    graph_data = json.load(f)
-                    available_courses = graph_data.get('nodes', [])
-            except Exception as e:
-                logger.warning(f"Could not load course data: {e}")
-        else:
-            logger.error(f"Graph file not found: {GRAPH_FILE}")
-
-        # Load prerequisites
-        prereqs = {}
-        if PREREQ_FILE.exists():
-            try:
-                with open(PREREQ_FILE, 'r') as f:
-                    prereqs = json.load(f)
-            except Exception as e:
-                logger.warning(f"Could not load prerequisites: {e}")
-        else:
-            logger.error(f"Prerequisites file not found: {PREREQ_FILE}")
-
-        # Generate timelines
-        planner = TimelinePlanner()
-        result = planner.generate_timelines(
+        result = await generate_timelines(
             career_goal=request.career_goal,
             completed_courses=request.completed_courses,
             current_semester=request.current_semester,
-            available_courses=available_courses,
-            prerequisites=prereqs
         )
 
         return TimelineResponse(
@@ -4,6 +4,7 @@ Application settings and configuration
 
 from pydantic_settings import BaseSettings
 from typing import List
+from pathlib import Path
 import os
 
 
@@ -22,6 +23,56 @@ class Settings(BaseSettings):
     # Cornell API
     CORNELL_ROSTER_SEMESTER: str = "FA25"
 
+    # Startup: heavy imports and data loading happen lazily, then in a
+    # background warm-up shortly after the server starts
+    WARMUP_ON_STARTUP: bool = True
+    WARMUP_DELAY_SECONDS: float = 1.0
+
+    # Chat sessions
+    CHAT_SESSION_MAX_SESSIONS: int = 1000
+    CHAT_HISTORY_TOKEN_BUDGET: int = 1200
+    CHAT_SUMMARY_TOKEN_BUDGET: int = 300
+    CHAT_SESSION_DB: str = ""  # Optional SQLite path; empty keeps sessions in memory only
+
+    # Resume text extraction (process pool)
+    RESUME_EXTRACT_WORKERS: int = 2  # 0 runs extraction in a thread instead
+    RESUME_EXTRACT_TIMEOUT: float = 20.0
+    RESUME_EXTRACT_MAX_QUEUE: int = 16
+    RESUME_EXTRACT_MAX_BULK: int = 4  # Queue slots bulk uploads may use; the rest stay free for interactive ones
+    RESUME_MAX_PDF_PAGES: int = 10
+    RESUME_MAX_TEXT_CHARS: int = 8000  # LLM sees 2000; the rest feeds the course/skill scan
+
+    # Bulk resume ingestion (extraction is further capped by RESUME_EXTRACT_MAX_BULK)
+    BULK_RESUME_CONCURRENCY: int = 8
+    BULK_RESUME_MAX_FILES: int = 1000
+    BULK_RESUME_MAX_ARCHIVE_MB: int = 200
+
+    # Batch job-posting matching
+    JOB_BATCH_MAX_POSTINGS: int = 50000
+
+    # Result caches
+    CACHE_DIR: str = str(Path(__file__).parent.parent.parent / "data" / "cache")
+    CACHE_BACKEND: str = "sqlite"  # Tier shared by all workers: "sqlite", "redis", "memory" or "none"
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_TTL_HOURS: float = 24 * 30  # Default entry lifetime (0 = never expire)
+    CACHE_SHARED_MAX_ENTRIES: int = 5000  # Per cache namespace in the shared tier
+    RESUME_CACHE_SIZE: int = 256
+    MATERIALS_CACHE_SIZE: int = 256
+    CHAT_CACHE_SIZE: int = 512
+    TIMELINE_CACHE_SIZE: int = 256
+    JOB_MATCH_CACHE_SIZE: int = 256
+    MATERIALS_SOFT_TTL_HOURS: float = 24 * 7  # Served as-is, refreshed in the background after this
+    MATERIALS_HARD_TTL_HOURS: float = 24 * 30  # Never served older than this
+    MATERIALS_FIRST_WAIT_SECONDS: float = 15.0  # Wait for a course's first generation before serving fallbacks
+    MATERIALS_PREFETCH_WORKERS: int = 2  # Background generation for courses in planned timelines
+    MATERIALS_PREFETCH_MAX_QUEUE: int = 500
+
+    # Hot cache entries are snapshotted on shutdown and periodically, and
+    # restored on startup (discarded if the catalog data changed)
+    CACHE_SNAPSHOT_ENABLED: bool = True
+    CACHE_SNAPSHOT_INTERVAL_SECONDS: float = 300
+    CACHE_SNAPSHOT_MAX_ENTRIES: int = 500  # Per cache namespace
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -2,18 +2,114 @@
 CourseGraph FastAPI Backend
 """
 
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from pathlib import Path
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.config.settings import settings
-from app.api import graph, chat, timeline, resume, job_matcher, study_materials
+from app.api import graph, chat, timeline, resume, job_matcher, study_materials, pipeline, courses
+from app.services.cache_snapshot import load_snapshot, save_snapshot
+from app.services.result_cache import cache_stats
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def warm_up():
+    """
+    Load data files, build indexes and import heavy dependencies.
+
+    Everything here also happens lazily on first use; warming up just moves
+    the cost off the first user's request.
+    """
+    from app.services.llm_service import get_openai_client
+    from app.services.rmp_service import ensure_loaded
+    from app.services.course_index import get_course_index
+    from app.services.skill_index import get_skill_index
+    from app.services.prereq_graph import get_prerequisite_graph
+    from app.services.course_search import get_course_search
+    from app.services.course_suggest import get_course_suggester
+
+    started = time.perf_counter()
+    if settings.OPENAI_API_KEY:
+        get_openai_client().get()
+    ensure_loaded()
+    get_course_index()
+    get_skill_index()
+    get_prerequisite_graph()
+    get_course_search()
+    get_course_suggester()
+    study_materials.materials_service.ensure_loaded()
+    logger.info(f"Warm-up finished in {time.perf_counter() - started:.2f}s")
+
+
+async def _warm_up_after_start():
+    # Give the server a moment to bind and answer its first health check
+    await asyncio.sleep(settings.WARMUP_DELAY_SECONDS)
+    try:
+        await asyncio.to_thread(warm_up)
+    except Exception as e:
+        logger.warning(f"Warm-up failed (data will load on first use): {e}")
+
+
+SNAPSHOT_FILE = Path(settings.CACHE_DIR) / "cache_snapshot.json.gz"
+
+
+def _save_cache_snapshot():
+    saved = save_snapshot(SNAPSHOT_FILE, settings.CACHE_SNAPSHOT_MAX_ENTRIES)
+    logger.info(f"Saved cache snapshot: {saved}")
+
+
+async def _snapshot_periodically():
+    while True:
+        await asyncio.sleep(settings.CACHE_SNAPSHOT_INTERVAL_SECONDS)
+        try:
+            await asyncio.to_thread(_save_cache_snapshot)
+        except Exception as e:
+            logger.warning(f"Periodic cache snapshot failed: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    background = []
+
+    if settings.CACHE_SNAPSHOT_ENABLED:
+        # Restore before serving so the first requests after a restart hit
+        try:
+            restored = await asyncio.to_thread(load_snapshot, SNAPSHOT_FILE)
+            if restored:
+                logger.info(f"Restored cache snapshot: {restored}")
+        except Exception as e:
+            logger.warning(f"Could not restore cache snapshot: {e}")
+        background.append(asyncio.create_task(_snapshot_periodically()))
+
+    if settings.WARMUP_ON_STARTUP:
+        background.append(asyncio.create_task(_warm_up_after_start()))
+
+    yield
+
+    for task in background:
+        task.cancel()
+    if settings.CACHE_SNAPSHOT_ENABLED:
+        try:
+            await asyncio.to_thread(_save_cache_snapshot)
+        except Exception as e:
+            logger.warning(f"Could not save cache snapshot on shutdown: {e}")
+
 
 # Initialize FastAPI app
 app = FastAPI(
     title="CourseGraph API",
     description="Cornell course prerequisite graph with sentiment analysis",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
+# Oversized uploads are refused before Starlette spools their bodies
+app.add_middleware(resume.UploadSizeLimitMiddleware, limits=resume.upload_body_limits())
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -30,6 +126,8 @@ app.include_router(timeline.router, prefix="/api", tags=["Timeline"])
 app.include_router(resume.router, prefix="/api", tags=["Resume"])
 app.include_router(job_matcher.router, prefix="/api", tags=["Job Matcher"])
 app.include_router(study_materials.router, prefix="/api", tags=["Study Materials"])
+app.include_router(pipeline.router, prefix="/api", tags=["Pipeline"])
+app.include_router(courses.router, prefix="/api", tags=["Courses"])
 
 
 @app.get("/")
@@ -42,6 +140,12 @@ async def root():
     }
 
 
+@app.get("/api/cache/stats")
+async def get_cache_stats():
+    """Hit/miss counters for every result cache in this worker"""
+    return {"caches": cache_stats()}
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run("app.main:app", host="0.0.0.0", port=8000, reload=True)
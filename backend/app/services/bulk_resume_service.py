@@ -0,0 +1,145 @@
+"""
+Bulk Resume Service - Analyze a zip archive of resumes
+
+Entries are read lazily from the archive, de-duplicated by SHA-256, and
+parsed with bounded concurrency (text extraction runs in the process pool
+within its bulk admission limit, LLM analyses are capped by `concurrency`). Results are yielded one per
+file as soon as each completes, ready to be streamed as NDJSON.
+"""
+
+import asyncio
+import hashlib
+import zipfile
+from pathlib import PurePosixPath
+from typing import Any, AsyncIterator, BinaryIO, Dict, List
+import logging
+
+from app.services.resume_parser import ResumeParser
+from app.services.text_extraction import PDF_CONTENT_TYPE, DOCX_CONTENT_TYPE
+
+logger = logging.getLogger(__name__)
+
+CONTENT_TYPES_BY_EXTENSION = {
+    ".pdf": PDF_CONTENT_TYPE,
+    ".docx": DOCX_CONTENT_TYPE,
+    ".txt": "text/plain",
+}
+
+
+def open_archive(fileobj: BinaryIO) -> zipfile.ZipFile:
+    """
+    Open an uploaded zip archive.
+
+    Raises:
+        ValueError: If the upload is not a valid zip file
+    """
+    try:
+        return zipfile.ZipFile(fileobj)
+    except zipfile.BadZipFile:
+        raise ValueError("Uploaded file is not a valid zip archive")
+
+
+def _is_ignored(info: zipfile.ZipInfo) -> bool:
+    """Directories and OS metadata (__MACOSX/, .DS_Store, ._foo.pdf)"""
+    if info.is_dir():
+        return True
+    path = PurePosixPath(info.filename)
+    return path.parts[0] == "__MACOSX" or path.name.startswith(".")
+
+
+async def analyze_archive(
+    archive: zipfile.ZipFile,
+    parser: ResumeParser,
+    concurrency: int,
+    max_files: int,
+    max_file_bytes: int,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Parse every resume in an archive, yielding results as they complete.
+
+    At most `concurrency` files are being read or parsed at once, so memory
+    stays bounded no matter how large the archive is.
+
+    Args:
+        archive: Open zip archive
+        parser: ResumeParser used for each file
+        concurrency: Maximum files parsed concurrently
+        max_files: Maximum resume files processed from the archive
+        max_file_bytes: Per-file uncompressed size limit
+
+    Yields:
+        One dict per archive entry ("ok", "duplicate", "skipped" or "error"),
+        followed by a final "done" summary
+    """
+    results: asyncio.Queue = asyncio.Queue()
+    slots = asyncio.Semaphore(concurrency)
+    seen: Dict[str, str] = {}
+    tasks: List[asyncio.Task] = []
+    counts = {"files": 0, "parsed": 0, "duplicates": 0, "skipped": 0, "errors": 0}
+
+    async def parse(name: str, digest: str, data: bytes, content_type: str):
+        try:
+            result = await parser.parse_resume(data, content_type, bulk=True)
+            await results.put({"file": name, "sha256": digest, "status": "ok", "result": result})
+        except Exception as e:
+            logger.warning(f"Bulk resume parse failed for {name}: {e}")
+            await results.put({"file": name, "sha256": digest, "status": "error", "error": str(e)})
+        finally:
+            slots.release()
+
+    def record(line: Dict[str, Any]) -> Dict[str, Any]:
+        status = line["status"]
+        key = {"ok": "parsed", "duplicate": "duplicates", "skipped": "skipped"}.get(status, "errors")
+        counts[key] += 1
+        return line
+
+    try:
+        for info in archive.infolist():
+            if _is_ignored(info):
+                continue
+
+            name = info.filename
+            content_type = CONTENT_TYPES_BY_EXTENSION.get(PurePosixPath(name).suffix.lower())
+            if content_type is None:
+                yield record({"file": name, "status": "skipped", "error": "Unsupported file type"})
+                continue
+            if counts["files"] >= max_files:
+                yield record({"file": name, "status": "skipped", "error": f"Archive limit of {max_files} files reached"})
+                continue
+            if info.file_size > max_file_bytes:
+                yield record({"file": name, "status": "error", "error": f"File size exceeds {max_file_bytes // (1024 * 1024)}MB limit."})
+                continue
+            counts["files"] += 1
+
+            # Backpressure: don't read the next entry until a slot frees up
+            await slots.acquire()
+            while not results.empty():
+                yield record(results.get_nowait())
+
+            try:
+                data = await asyncio.to_thread(archive.read, info)
+            except Exception as e:
+                slots.release()
+                yield record({"file": name, "status": "error", "error": f"Failed to read from archive: {e}"})
+                continue
+
+            digest = hashlib.sha256(data).hexdigest()
+            if digest in seen:
+                slots.release()
+                yield record({"file": name, "sha256": digest, "status": "duplicate", "duplicate_of": seen[digest]})
+                continue
+            seen[digest] = name
+
+            tasks.append(asyncio.create_task(parse(name, digest, data, content_type)))
+
+        # Drain the remaining results in completion order
+        while any(not t.done() for t in tasks) or not results.empty():
+            yield record(await results.get())
+
+        yield {"status": "done", "summary": counts}
+
+    finally:
+        # Client disconnected or generator closed early: stop outstanding work
+        for task in tasks:
+            if not task.done():
+                task.cancel()
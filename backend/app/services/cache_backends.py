@@ -0,0 +1,310 @@
+"""
+Cache Backends - Shared storage tier behind every ResultCache
+
+ResultCache keeps a small LRU in each process; the backend is the tier all
+workers share, so an answer paid for by one worker is a hit in the others.
+Values arrive already JSON-encoded. Every backend namespaces keys per
+service, honours per-entry TTLs and keeps at most `max_entries` per
+namespace, dropping the least recently used.
+
+Backend calls block, so ResultCache makes them from a worker thread when
+called from async code. After a failure a backend reports itself
+unavailable for RETRY_AFTER seconds and is skipped, so an unreachable
+server costs one timeout rather than one per lookup.
+
+Backends (CACHE_BACKEND setting):
+    sqlite  One WAL-mode database file in CACHE_DIR (default)
+    redis   Any Redis-protocol server at CACHE_REDIS_URL
+    memory  Process-local dict - a stand-in for tests and single-worker runs
+    none    No shared tier
+"""
+
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+import logging
+
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class CacheBackend:
+    """Interface for a shared cache tier. Failures should be logged and treated as misses."""
+
+    name = "base"
+
+    # Seconds a backend is skipped after a failed call
+    RETRY_AFTER = 30.0
+
+    def __init__(self):
+        self._down_until = 0.0
+
+    @property
+    def available(self) -> bool:
+        """False while backing off after a failure"""
+        return time.monotonic() >= self._down_until
+
+    def _failed(self, action: str, namespace: str, error: Exception):
+        self._down_until = time.monotonic() + self.RETRY_AFTER
+        logger.warning(
+            f"Cache {action} failed ({namespace}), skipping {self.name} cache "
+            f"for {self.RETRY_AFTER:.0f}s: {error}"
+        )
+
+    def get(self, namespace: str, key: str) -> Optional[str]:
+        """Encoded value, or None if missing or expired"""
+        raise NotImplementedError
+
+    def set(self, namespace: str, key: str, value: str, ttl: Optional[float], max_entries: int):
+        """Store an encoded value, expiring after `ttl` seconds (None = never)"""
+        raise NotImplementedError
+
+    def clear(self, namespace: str):
+        """Drop every entry in a namespace"""
+        raise NotImplementedError
+
+
+class MemoryBackend(CacheBackend):
+    """In-process dict with the same TTL and eviction rules as the shared backends"""
+
+    name = "memory"
+
+    def __init__(self):
+        super().__init__()
+        self._namespaces: Dict[str, "OrderedDict[str, Tuple[str, Optional[float]]]"] = {}
+        self._lock = threading.Lock()
+
+    def get(self, namespace: str, key: str) -> Optional[str]:
+        with self._lock:
+            entries = self._namespaces.get(namespace, {})
+            entry = entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= time.time():
+                del entries[key]
+                return None
+            entries.move_to_end(key)
+            return value
+
+    def set(self, namespace: str, key: str, value: str, ttl: Optional[float], max_entries: int):
+        with self._lock:
+            entries = self._namespaces.setdefault(namespace, OrderedDict())
+            entries[key] = (value, time.time() + ttl if ttl else None)
+            entries.move_to_end(key)
+            while len(entries) > max_entries:
+                entries.popitem(last=False)
+
+    def clear(self, namespace: str):
+        with self._lock:
+            self._namespaces.pop(namespace, None)
+
+
+class SQLiteBackend(CacheBackend):
+    """
+    One SQLite file in WAL mode, shared by all workers on the host.
+
+    Args:
+        path: Database file (created if missing)
+    """
+
+    name = "sqlite"
+
+    # Prune expired and least recently used rows every this many writes
+    PRUNE_EVERY = 64
+
+    # Hits refresh a row's access time at most this often, so most reads
+    # never take the write lock
+    TOUCH_INTERVAL = 60.0
+
+    def __init__(self, path: str):
+        super().__init__()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(path, timeout=1.0, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS cache_entries ("
+            "namespace TEXT NOT NULL, key TEXT NOT NULL, value TEXT NOT NULL, "
+            "expires_at REAL, accessed_at REAL NOT NULL, PRIMARY KEY (namespace, key))"
+        )
+        self._db.commit()
+        self._lock = threading.Lock()
+        self._writes = 0
+
+    def get(self, namespace: str, key: str) -> Optional[str]:
+        if not self.available:
+            return None
+        now = time.time()
+        try:
+            with self._lock:
+                row = self._db.execute(
+                    "SELECT value, accessed_at FROM cache_entries WHERE namespace = ? AND key = ? "
+                    "AND (expires_at IS NULL OR expires_at > ?)",
+                    (namespace, key, now)
+                ).fetchone()
+                if not row:
+                    return None
+                if row[1] < now - self.TOUCH_INTERVAL:
+                    self._db.execute(
+                        "UPDATE cache_entries SET accessed_at = ? WHERE namespace = ? AND key = ?",
+                        (now, namespace, key)
+                    )
+                    self._db.commit()
+                return row[0]
+        except Exception as e:
+            self._failed("read", namespace, e)
+            return None
+
+    def set(self, namespace: str, key: str, value: str, ttl: Optional[float], max_entries: int):
+        if not self.available:
+            return
+        now = time.time()
+        try:
+            with self._lock:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO cache_entries (namespace, key, value, expires_at, accessed_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (namespace, key, value, now + ttl if ttl else None, now)
+                )
+                self._writes += 1
+                if self._writes % self.PRUNE_EVERY == 0:
+                    self._db.execute(
+                        "DELETE FROM cache_entries WHERE expires_at IS NOT NULL AND expires_at <= ?", (now,)
+                    )
+                    self._db.execute(
+                        "DELETE FROM cache_entries WHERE namespace = ? AND key NOT IN ("
+                        "SELECT key FROM cache_entries WHERE namespace = ? "
+                        "ORDER BY accessed_at DESC LIMIT ?)",
+                        (namespace, namespace, max_entries)
+                    )
+                self._db.commit()
+        except Exception as e:
+            self._failed("write", namespace, e)
+
+    def clear(self, namespace: str):
+        if not self.available:
+            return
+        try:
+            with self._lock:
+                self._db.execute("DELETE FROM cache_entries WHERE namespace = ?", (namespace,))
+                self._db.commit()
+        except Exception as e:
+            self._failed("clear", namespace, e)
+
+
+class RedisBackend(CacheBackend):
+    """
+    Redis-protocol server (Redis, Valkey, KeyDB, ...).
+
+    Entries are plain keys with native expiry. A sorted set per namespace
+    tracks access times so each namespace can be trimmed to its own size.
+
+    Args:
+        url: Server URL, e.g. redis://localhost:6379/0
+        prefix: Prefix for every key this app writes
+    """
+
+    name = "redis"
+
+    def __init__(self, url: str, prefix: str = "coursegraph:"):
+        super().__init__()
+        # Imported here so the redis package stays optional; a missing
+        # package makes create_backend fall back to process-local caches
+        import redis
+
+        self.url = url
+        self.prefix = prefix
+        # Connects lazily, on the first command
+        self._client = redis.Redis.from_url(url, socket_timeout=1.0, socket_connect_timeout=1.0)
+
+    def _key(self, namespace: str, key: str) -> str:
+        return f"{self.prefix}{namespace}:{key}"
+
+    def _lru_key(self, namespace: str) -> str:
+        return f"{self.prefix}{namespace}:__lru__"
+
+    def get(self, namespace: str, key: str) -> Optional[str]:
+        if not self.available:
+            return None
+        try:
+            client = self._client
+            value = client.get(self._key(namespace, key))
+            if value is None:
+                return None
+            client.zadd(self._lru_key(namespace), {key: time.time()})
+            return value.decode("utf-8")
+        except Exception as e:
+            self._failed("read", namespace, e)
+            return None
+
+    def set(self, namespace: str, key: str, value: str, ttl: Optional[float], max_entries: int):
+        if not self.available:
+            return
+        try:
+            client = self._client
+            lru_key = self._lru_key(namespace)
+            pipe = client.pipeline()
+            pipe.set(self._key(namespace, key), value, px=int(ttl * 1000) if ttl else None)
+            pipe.zadd(lru_key, {key: time.time()})
+            pipe.zcard(lru_key)
+            size = pipe.execute()[-1]
+
+            if size > max_entries:
+                evicted = client.zpopmin(lru_key, size - max_entries)
+                if evicted:
+                    client.delete(*(self._key(namespace, k.decode("utf-8")) for k, _ in evicted))
+        except Exception as e:
+            self._failed("write", namespace, e)
+
+    def clear(self, namespace: str):
+        if not self.available:
+            return
+        try:
+            client = self._client
+            keys = list(client.scan_iter(match=f"{self.prefix}{namespace}:*"))
+            if keys:
+                client.delete(*keys)
+        except Exception as e:
+            self._failed("clear", namespace, e)
+
+
+_backend: Optional[CacheBackend] = None
+_backend_resolved = False
+_backend_lock = threading.Lock()
+
+
+def create_backend(kind: str) -> Optional[CacheBackend]:
+    """
+    Backend for a CACHE_BACKEND value.
+
+    Returns:
+        The backend, or None for "none" or if it could not be opened
+    """
+    kind = kind.lower()
+    try:
+        if kind == "sqlite":
+            return SQLiteBackend(str(Path(settings.CACHE_DIR) / "shared_cache.sqlite3"))
+        if kind == "redis":
+            return RedisBackend(settings.CACHE_REDIS_URL)
+        if kind == "memory":
+            return MemoryBackend()
+        if kind != "none":
+            logger.warning(f"Unknown CACHE_BACKEND {kind!r} - caches are per-process only")
+    except Exception as e:
+        logger.warning(f"Could not open {kind} cache backend - caches are per-process only: {e}")
+    return None
+
+
+def get_shared_backend() -> Optional[CacheBackend]:
+    """Shared tier configured by CACHE_BACKEND, opened on first use"""
+    global _backend, _backend_resolved
+    if not _backend_resolved:
+        with _backend_lock:
+            if not _backend_resolved:
+                _backend = create_backend(settings.CACHE_BACKEND)
+                _backend_resolved = True
+    return _backend
@@ -0,0 +1,154 @@
+"""
+Cache Snapshot - Carry hot cache entries across restarts
+
+The hottest in-memory entries of every ResultCache are written to one
+gzip-compressed JSON file on shutdown and periodically while running, and
+loaded back before the app starts serving. Entries keep their original
+expiry, so restarts never extend their lifetime. A snapshot taken against
+a different catalog (see catalog.catalog_version) is discarded.
+
+The snapshot is shared by all workers: each save merges the worker's
+entries into what is already on disk (its own win on conflicts) under a
+file lock, and every worker restores the merged file on startup.
+"""
+
+import gzip
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+import logging
+
+try:
+    import fcntl
+except ImportError:  # Windows: saves are not serialized across workers
+    fcntl = None
+
+from app.services.catalog import catalog_version
+from app.services.result_cache import registered_caches
+
+logger = logging.getLogger(__name__)
+
+# Bump when the snapshot layout changes
+SNAPSHOT_FORMAT = 2
+
+
+@contextmanager
+def _locked(path: Path) -> Iterator[None]:
+    """Exclusive lock serializing snapshot saves across worker processes"""
+    if fcntl is None:
+        yield
+        return
+    with open(path.with_name(path.name + ".lock"), "a") as lock_file:
+        fcntl.flock(lock_file, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _read_snapshot(path: Path) -> Dict[str, Any]:
+    """
+    Snapshot contents, or {} if missing.
+
+    Raises:
+        ValueError: If the file is unreadable or from another format or catalog version
+    """
+    if not path.exists():
+        return {}
+    try:
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            snapshot = json.load(f)
+    except Exception as e:
+        raise ValueError(f"unreadable cache snapshot: {e}")
+    if snapshot.get("format") != SNAPSHOT_FORMAT or snapshot.get("catalog_version") != catalog_version():
+        raise ValueError("cache snapshot from a different catalog version")
+    return snapshot
+
+
+def _merge(saved: List[List[Any]], ours: List[List[Any]], max_entries: int, now: float) -> List[List[Any]]:
+    """Other workers' unexpired entries (colder) followed by ours, trimmed to max_entries"""
+    our_keys = {entry[0] for entry in ours}
+    merged = [
+        entry for entry in saved
+        if entry[0] not in our_keys and (entry[2] is None or entry[2] > now)
+    ]
+    merged.extend(ours)
+    return merged[-max_entries:] if max_entries > 0 else []
+
+
+def save_snapshot(path: Path, max_entries: int) -> Dict[str, int]:
+    """
+    Merge the hottest entries of every registered cache into `path`.
+
+    Args:
+        path: Snapshot file shared by all workers (replaced atomically)
+        max_entries: Entries kept per cache namespace
+
+    Returns:
+        Entries written per namespace
+    """
+    now = time.time()
+    ours = {
+        namespace: [list(entry) for entry in cache.export_entries(max_entries)]
+        for namespace, cache in registered_caches().items()
+    }
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _locked(path):
+        try:
+            saved = _read_snapshot(path).get("caches", {})
+        except ValueError as e:
+            logger.info(f"Replacing {e}")
+            saved = {}
+        caches = {
+            namespace: _merge(saved.get(namespace, []), ours.get(namespace, []), max_entries, now)
+            for namespace in set(saved) | set(ours)
+        }
+        snapshot = {
+            "format": SNAPSHOT_FORMAT,
+            "catalog_version": catalog_version(),
+            "saved_at": now,
+            "caches": caches,
+        }
+
+        # A unique temp file per save, so concurrent writers never share one
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'wb') as raw, gzip.open(raw, 'wt', encoding='utf-8') as f:
+                json.dump(snapshot, f, separators=(',', ':'))
+            os.replace(tmp_name, path)
+        except BaseException:
+            Path(tmp_name).unlink(missing_ok=True)
+            raise
+
+    return {namespace: len(entries) for namespace, entries in caches.items()}
+
+
+def load_snapshot(path: Path) -> Dict[str, int]:
+    """
+    Restore cache entries from `path` into the registered caches.
+
+    Unreadable snapshots and those with another format or catalog version
+    are deleted instead.
+
+    Returns:
+        Entries restored per namespace
+    """
+    try:
+        snapshot = _read_snapshot(path)
+    except ValueError as e:
+        logger.info(f"Discarding {e}")
+        path.unlink(missing_ok=True)
+        return {}
+
+    caches = registered_caches()
+    restored = {}
+    for namespace, entries in snapshot.get("caches", {}).items():
+        cache = caches.get(namespace)
+        if cache is not None:
+            restored[namespace] = cache.import_entries([tuple(entry) for entry in entries])
+    return restored
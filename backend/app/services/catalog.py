@@ -0,0 +1,122 @@
+"""
+Course Catalog - Loads course nodes from the built graph artifact
+
+The JSON files written by the scrapers and build_graph.py are the source
+of truth. build_catalog_file() packs them into catalog.bin, which every
+worker memory-maps instead of parsing JSON (see catalog_file.py).
+"""
+
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, List, Optional
+import logging
+
+if TYPE_CHECKING:
+    from app.services.catalog_file import CatalogFile
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).parent.parent.parent / "data"
+GRAPH_FILE = DATA_DIR / "graph_data.json"
+PREREQ_FILE = DATA_DIR / "prerequisites.json"
+RMP_FILE = DATA_DIR / "rmp_data.json"
+CATALOG_BIN = DATA_DIR / "catalog.bin"
+
+# Files whose contents feed cached results
+CATALOG_FILES = (GRAPH_FILE, PREREQ_FILE, RMP_FILE)
+
+_catalog_version: Optional[str] = None
+_catalog: Optional["CatalogFile"] = None
+_catalog_lock = threading.Lock()
+
+
+def catalog_version() -> str:
+    """
+    Short content hash of the catalog data files.
+
+    Changes whenever build_graph.py or the scrapers produce new data, so
+    anything derived from the old catalog can be recognized as stale.
+    """
+    global _catalog_version
+    if _catalog_version is None:
+        digest = hashlib.sha256()
+        for path in CATALOG_FILES:
+            digest.update(path.name.encode())
+            if path.exists():
+                digest.update(path.read_bytes())
+        _catalog_version = digest.hexdigest()[:16]
+    return _catalog_version
+
+
+def _read_json(path: Path, default):
+    if not path.exists():
+        logger.warning(f"{path.name} not found")
+        return default
+    try:
+        with open(path, 'r') as f:
+            return json.load(f)
+    except Exception as e:
+        logger.warning(f"Failed to load {path.name}: {e}")
+        return default
+
+
+def _read_sources():
+    graph = _read_json(GRAPH_FILE, {})
+    return graph.get('nodes', []), _read_json(PREREQ_FILE, {}), _read_json(RMP_FILE, {}), catalog_version()
+
+
+def build_catalog_file(path: Path = CATALOG_BIN) -> int:
+    """
+    Pack graph_data.json, prerequisites.json and rmp_data.json into catalog.bin.
+
+    Returns:
+        File size in bytes
+    """
+    from app.services.catalog_file import write_catalog
+
+    size = write_catalog(path, *_read_sources())
+    logger.info(f"Wrote {path} ({size / 1024:.1f} KB)")
+    return size
+
+
+def get_catalog() -> "CatalogFile":
+    """
+    Shared read-only catalog.
+
+    Maps catalog.bin when it was built from the current JSON files. A missing
+    or stale file falls back to encoding the JSON in memory, so the server
+    still starts (with a private copy per worker) until the build step reruns.
+    """
+    global _catalog
+    if _catalog is None:
+        with _catalog_lock:
+            if _catalog is None:
+                from app.services.catalog_file import CatalogFile, encode_catalog
+
+                catalog = None
+                if CATALOG_BIN.exists():
+                    try:
+                        catalog = CatalogFile.open(CATALOG_BIN)
+                    except Exception as e:
+                        logger.warning(f"Could not map {CATALOG_BIN.name}: {e}")
+                    if catalog is not None and catalog.source_version != catalog_version():
+                        logger.warning(f"{CATALOG_BIN.name} is stale - run scripts/build_catalog.py")
+                        catalog = None
+                else:
+                    logger.info(f"{CATALOG_BIN.name} not found - run scripts/build_catalog.py")
+
+                if catalog is None:
+                    catalog = CatalogFile(encode_catalog(*_read_sources()))
+                logger.info(f"Loaded catalog with {len(catalog)} courses")
+                _catalog = catalog
+    return _catalog
+
+
+def load_catalog_nodes() -> List[Dict]:
+    """Course nodes from the catalog (empty if the graph is missing)"""
+    nodes = get_catalog().nodes()
+    if not nodes:
+        logger.warning("Course catalog is empty - run build_graph.py first")
+    return nodes
@@ -0,0 +1,335 @@
+"""
+Catalog File - Read-only binary course catalog shared across workers
+
+The build step packs graph nodes, prerequisites and RMP averages into one
+file of fixed-layout arrays followed by a string table. Workers memory-map
+it read-only, so the operating system keeps a single physical copy of the
+catalog no matter how many uvicorn/gunicorn workers are running, and
+opening it is an mmap call instead of JSON parsing.
+
+Layout (little-endian, every section 8-byte aligned):
+    header          magic, format, course / edge / string counts, source version
+    float columns   float64[courses] per field, NaN where the field is missing
+    int columns     int32[courses] per field, -1 where the field is missing
+    string columns  uint32[courses] per field, indexes into the string table
+    flags           uint8[courses]
+    prerequisites   uint32[courses + 1] offsets, uint32[edges] string indexes
+    unlocks         uint32[courses + 1] offsets, uint32[edges] string indexes
+    similar         uint32[courses + 1] offsets, uint32[edges] rows, float32[edges] scores
+    string table    uint32[strings + 1] byte offsets, then the UTF-8 bytes
+"""
+
+import json
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import logging
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"CGCATLG\x00"
+FORMAT_VERSION = 2
+
+# magic, format, courses, prerequisite / unlock / similar-course edges, strings, source version
+_HEADER = struct.Struct("<8sIIIIII16s")
+_ALIGN = 8
+
+# Graph node fields, in the order build_graph.py writes them
+NODE_FIELDS = (
+    "title", "description", "subject", "catalog_number", "difficulty_score",
+    "enjoyment_score", "comment_count", "confidence", "in_degree", "out_degree",
+    "centrality", "id",
+)
+FLOAT_FIELDS = ("difficulty_score", "enjoyment_score", "centrality", "rmp_difficulty", "rmp_enjoyment")
+INT_FIELDS = ("comment_count", "in_degree", "out_degree")
+STRING_FIELDS = ("id", "title", "description", "subject", "catalog_number", "confidence", "rmp_professors")
+
+# Per-course flags
+HAS_RMP = 1
+HAS_PREREQ_ENTRY = 2
+
+_INT_MISSING = -1
+
+
+def _layout(
+    courses: int, prereq_edges: int, unlock_edges: int, similar_edges: int, strings: int
+) -> Tuple[Dict[str, Tuple[int, np.dtype, int]], int]:
+    """Byte offset, dtype and length of every section, and where the string bytes start"""
+    sections = [(f, np.float64, courses) for f in FLOAT_FIELDS]
+    sections += [(f, np.int32, courses) for f in INT_FIELDS]
+    sections += [(f, np.uint32, courses) for f in STRING_FIELDS]
+    sections += [
+        ("flags", np.uint8, courses),
+        ("prereq_offsets", np.uint32, courses + 1),
+        ("prereq_refs", np.uint32, prereq_edges),
+        ("unlock_offsets", np.uint32, courses + 1),
+        ("unlock_refs", np.uint32, unlock_edges),
+        ("similar_offsets", np.uint32, courses + 1),
+        ("similar_rows", np.uint32, similar_edges),
+        ("similar_scores", np.float32, similar_edges),
+        ("string_offsets", np.uint32, strings + 1),
+    ]
+
+    layout = {}
+    offset = _HEADER.size
+    for name, dtype, count in sections:
+        offset += -offset % _ALIGN
+        layout[name] = (offset, np.dtype(dtype), count)
+        offset += np.dtype(dtype).itemsize * count
+    return layout, offset
+
+
+class _StringTable:
+    """Interns strings while encoding; index 0 is always the empty string"""
+
+    def __init__(self):
+        self.index: Dict[str, int] = {"": 0}
+        self.strings: List[str] = [""]
+
+    def ref(self, value) -> int:
+        value = "" if value is None else str(value)
+        ref = self.index.get(value)
+        if ref is None:
+            ref = self.index[value] = len(self.strings)
+            self.strings.append(value)
+        return ref
+
+
+def encode_catalog(nodes: List[Dict], prereqs: Dict[str, List[str]], rmp_data: Dict[str, Dict], source_version: str) -> bytes:
+    """
+    Pack the catalog into the binary layout.
+
+    Args:
+        nodes: Graph nodes from graph_data.json (with their "similar" neighbor lists)
+        prereqs: prerequisites.json contents
+        rmp_data: rmp_data.json contents
+        source_version: catalog_version() of the JSON files this was built from
+
+    Returns:
+        File contents
+    """
+    nodes = [n for n in nodes if n.get("id")]
+    rows = {n["id"]: i for i, n in enumerate(nodes)}
+    n = len(nodes)
+    strings = _StringTable()
+
+    unlocks: Dict[str, List[str]] = {}
+    for course_id, prereq_list in prereqs.items():
+        for prereq in prereq_list:
+            unlocks.setdefault(prereq, []).append(course_id)
+
+    dropped = (set(prereqs) | set(rmp_data)) - set(rows)
+    if dropped:
+        logger.warning(f"{len(dropped)} courses have prerequisite or RMP data but no graph node: {sorted(dropped)[:5]}")
+
+    columns = {f: np.full(n, np.nan) for f in FLOAT_FIELDS}
+    columns.update({f: np.full(n, _INT_MISSING, dtype=np.int32) for f in INT_FIELDS})
+    columns.update({f: np.zeros(n, dtype=np.uint32) for f in STRING_FIELDS})
+    columns["flags"] = np.zeros(n, dtype=np.uint8)
+    prereq_refs, unlock_refs, similar_rows, similar_scores = [], [], [], []
+    for name in ("prereq_offsets", "unlock_offsets", "similar_offsets"):
+        columns[name] = np.zeros(n + 1, dtype=np.uint32)
+
+    for row, node in enumerate(nodes):
+        course_id = node["id"]
+        for field in ("difficulty_score", "enjoyment_score", "centrality"):
+            if node.get(field) is not None:
+                columns[field][row] = node[field]
+        for field in INT_FIELDS:
+            if node.get(field) is not None:
+                columns[field][row] = node[field]
+        for field in ("id", "title", "description", "subject", "catalog_number", "confidence"):
+            if field in node:
+                columns[field][row] = strings.ref(node[field])
+
+        rmp = rmp_data.get(course_id)
+        if rmp is not None:
+            columns["flags"][row] |= HAS_RMP
+            for field, source in (("rmp_difficulty", "avg_difficulty"), ("rmp_enjoyment", "avg_enjoyment")):
+                if rmp.get(source) is not None:
+                    columns[field][row] = rmp[source]
+            if rmp.get("professors"):
+                columns["rmp_professors"][row] = strings.ref(json.dumps(rmp["professors"]))
+
+        if course_id in prereqs:
+            columns["flags"][row] |= HAS_PREREQ_ENTRY
+        prereq_refs.extend(strings.ref(p) for p in prereqs.get(course_id, []))
+        unlock_refs.extend(strings.ref(c) for c in unlocks.get(course_id, []))
+        columns["prereq_offsets"][row + 1] = len(prereq_refs)
+        columns["unlock_offsets"][row + 1] = len(unlock_refs)
+
+        for neighbor in node.get("similar") or []:
+            if neighbor.get("id") in rows:
+                similar_rows.append(rows[neighbor["id"]])
+                similar_scores.append(neighbor.get("score", 0.0))
+        columns["similar_offsets"][row + 1] = len(similar_rows)
+
+    columns["prereq_refs"] = np.array(prereq_refs, dtype=np.uint32)
+    columns["unlock_refs"] = np.array(unlock_refs, dtype=np.uint32)
+    columns["similar_rows"] = np.array(similar_rows, dtype=np.uint32)
+    columns["similar_scores"] = np.array(similar_scores, dtype=np.float32)
+    encoded = [s.encode("utf-8") for s in strings.strings]
+    columns["string_offsets"] = np.concatenate(([0], np.cumsum([len(b) for b in encoded]))).astype(np.uint32)
+
+    layout, strings_start = _layout(n, len(prereq_refs), len(unlock_refs), len(similar_rows), len(encoded))
+    buffer = bytearray(strings_start)
+    _HEADER.pack_into(
+        buffer, 0, MAGIC, FORMAT_VERSION, n, len(prereq_refs), len(unlock_refs),
+        len(similar_rows), len(encoded), source_version.encode("ascii")[:16],
+    )
+    for name, (offset, dtype, count) in layout.items():
+        data = np.ascontiguousarray(columns[name], dtype=dtype).tobytes()
+        buffer[offset:offset + len(data)] = data
+    return bytes(buffer) + b"".join(encoded)
+
+
+def write_catalog(path: Path, nodes: List[Dict], prereqs: Dict[str, List[str]], rmp_data: Dict[str, Dict], source_version: str) -> int:
+    """
+    Encode the catalog and replace `path` atomically.
+
+    Workers that still map the previous file keep reading it safely; they
+    pick up the new one when they restart.
+
+    Returns:
+        File size in bytes
+    """
+    data = encode_catalog(nodes, prereqs, rmp_data, source_version)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+    return len(data)
+
+
+class CatalogFile:
+    """
+    Zero-copy view of an encoded catalog.
+
+    Numeric columns are NumPy arrays backed directly by the buffer; strings
+    are decoded only when asked for.
+
+    Args:
+        buffer: Encoded catalog - an mmap for a shared file, or bytes
+    """
+
+    def __init__(self, buffer):
+        self._buffer = buffer
+        magic, version = struct.unpack_from("<8sI", buffer, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise ValueError(f"Not a format {FORMAT_VERSION} catalog file")
+        _, _, courses, prereq_edges, unlock_edges, similar_edges, strings, source = _HEADER.unpack_from(buffer, 0)
+        self.source_version = source.rstrip(b"\x00").decode("ascii")
+
+        layout, strings_start = _layout(courses, prereq_edges, unlock_edges, similar_edges, strings)
+        self._columns: Dict[str, np.ndarray] = {
+            name: np.frombuffer(buffer, dtype=dtype, count=count, offset=offset)
+            for name, (offset, dtype, count) in layout.items()
+        }
+        self._string_offsets = self._columns["string_offsets"]
+        self._strings_start = strings_start
+
+        self.ids: List[str] = [self.string(ref) for ref in self._columns["id"]]
+        self._rows: Dict[str, int] = {course_id: row for row, course_id in enumerate(self.ids)}
+
+    @classmethod
+    def open(cls, path: Path) -> "CatalogFile":
+        """Memory-map a catalog file read-only"""
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, course_id: str) -> bool:
+        return course_id in self._rows
+
+    def row(self, course_id: str) -> Optional[int]:
+        """Row index of a course, or None if it is not in the catalog"""
+        return self._rows.get(course_id)
+
+    def column(self, name: str) -> np.ndarray:
+        """Read-only array for a float, int or string-index column"""
+        return self._columns[name]
+
+    def string(self, ref: int) -> str:
+        """Entry `ref` of the string table"""
+        start = self._strings_start + int(self._string_offsets[ref])
+        end = self._strings_start + int(self._string_offsets[ref + 1])
+        return str(self._buffer[start:end], "utf-8")
+
+    def text(self, field: str, row: int) -> str:
+        """String field of one course"""
+        return self.string(self._columns[field][row])
+
+    def value(self, field: str, row: int):
+        """Float or int field of one course as a Python number (None if missing)"""
+        value = self._columns[field][row]
+        if field in FLOAT_FIELDS:
+            return None if np.isnan(value) else float(value)
+        return None if value == _INT_MISSING else int(value)
+
+    def has(self, row: int, flag: int) -> bool:
+        return bool(self._columns["flags"][row] & flag)
+
+    def node(self, row: int) -> Dict:
+        """Graph node dict for one course, as in graph_data.json"""
+        node = {}
+        for field in NODE_FIELDS:
+            if field in STRING_FIELDS:
+                node[field] = self.text(field, row)
+            else:
+                value = self.value(field, row)
+                if value is not None:
+                    node[field] = value
+        return node
+
+    def nodes(self) -> List[Dict]:
+        """Graph node dicts for every course (fresh copies)"""
+        return [self.node(row) for row in range(len(self))]
+
+    def rmp(self, row: int) -> Optional[Dict]:
+        """RMP entry for one course, as in rmp_data.json (None if not scraped)"""
+        if not self.has(row, HAS_RMP):
+            return None
+        professors = self.text("rmp_professors", row)
+        return {
+            "course_id": self.ids[row],
+            "subject": self.text("subject", row),
+            "title": self.text("title", row),
+            "avg_difficulty": self.value("rmp_difficulty", row),
+            "avg_enjoyment": self.value("rmp_enjoyment", row),
+            "professors": json.loads(professors) if professors else [],
+        }
+
+    def _edges(self, kind: str, row: int) -> List[str]:
+        offsets = self._columns[f"{kind}_offsets"]
+        refs = self._columns[f"{kind}_refs"][offsets[row]:offsets[row + 1]]
+        return [self.string(ref) for ref in refs]
+
+    def prerequisites(self, row: int) -> List[str]:
+        """Direct prerequisites of one course"""
+        return self._edges("prereq", row)
+
+    def unlocks(self, row: int) -> List[str]:
+        """Courses that list this course as a direct prerequisite"""
+        return self._edges("unlock", row)
+
+    def similar(self, row: int) -> List[Tuple[int, float]]:
+        """Precomputed (row, score) neighbors of one course, most similar first"""
+        offsets = self._columns["similar_offsets"]
+        start, end = offsets[row], offsets[row + 1]
+        return [
+            (int(neighbor), float(score)) for neighbor, score in
+            zip(self._columns["similar_rows"][start:end], self._columns["similar_scores"][start:end])
+        ]
+
+    def prerequisite_map(self) -> Dict[str, List[str]]:
+        """Course ID -> prerequisites, for courses listed in prerequisites.json"""
+        return {
+            self.ids[row]: self.prerequisites(row)
+            for row in range(len(self)) if self.has(row, HAS_PREREQ_ENTRY)
+        }
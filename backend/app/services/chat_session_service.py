@@ -0,0 +1,249 @@
+"""
+Chat Session Service
+Server-side conversation storage with token-budgeted history compaction
+"""
+
+import asyncio
+import json
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Rough heuristic for English text with the OpenAI tokenizers
+CHARS_PER_TOKEN = 4
+
+# Used to carry course mentions from compacted turns into the summary
+COURSE_CODE_PATTERN = re.compile(r'\b(CS|MATH)\s*(\d{4})\b', re.IGNORECASE)
+
+
+def estimate_tokens(text: str) -> int:
+    """Cheap token estimate used for budgeting (no tokenizer dependency)"""
+    if not text:
+        return 0
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+@dataclass
+class ChatSession:
+    """A single conversation: rolling summary plus the most recent turns"""
+
+    session_id: str
+    summary: str = ""
+    summary_courses: List[str] = field(default_factory=list)
+    turns: List[Dict[str, str]] = field(default_factory=list)
+    updated_at: float = field(default_factory=time.time)
+
+    def to_messages(self) -> List[Dict[str, str]]:
+        """History as OpenAI chat messages (summary first, then recent turns)"""
+        messages = []
+        summary = self.summary
+        if self.summary_courses:
+            summary = f"{summary} Courses discussed: {', '.join(self.summary_courses)}.".strip()
+        if summary:
+            messages.append({
+                "role": "system",
+                "content": f"Summary of the earlier conversation: {summary}"
+            })
+        messages.extend({"role": t["role"], "content": t["content"]} for t in self.turns)
+        return messages
+
+    def context_text(self) -> str:
+        """All text still in context, used for course code extraction"""
+        parts = [" ".join(self.summary_courses)]
+        parts.extend(t["content"] for t in self.turns)
+        return " ".join(parts)
+
+
+class ChatSessionStore:
+    """
+    In-memory LRU of chat sessions with optional SQLite write-through.
+
+    Each session keeps its recent turns within `token_budget`. When a new turn
+    pushes it over, the oldest turns are folded into a short extractive summary
+    (questions asked and courses discussed), itself capped at `summary_budget`.
+    Prompt size therefore stays bounded regardless of conversation length.
+
+    SQLite reads and writes run on a single background thread, so they never
+    block the event loop and a session's writes land in the order they were made.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = 1000,
+        token_budget: int = 1200,
+        summary_budget: int = 300,
+        min_recent_turns: int = 2,
+        db_path: Optional[str] = None,
+    ):
+        self.max_sessions = max_sessions
+        self.token_budget = token_budget
+        self.summary_budget = summary_budget
+        self.min_recent_turns = min_recent_turns
+        self._sessions: "OrderedDict[str, ChatSession]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_thread: Optional[ThreadPoolExecutor] = None
+
+        if db_path:
+            try:
+                Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+                self._db = sqlite3.connect(db_path, check_same_thread=False)
+                self._db.execute(
+                    "CREATE TABLE IF NOT EXISTS chat_sessions ("
+                    "session_id TEXT PRIMARY KEY, data TEXT NOT NULL, updated_at REAL NOT NULL)"
+                )
+                self._db.commit()
+                self._db_thread = ThreadPoolExecutor(max_workers=1, thread_name_prefix="chat-sessions")
+                logger.info(f"Chat sessions persisted to {db_path}")
+            except Exception as e:
+                logger.warning(f"Failed to open chat session database: {e}")
+                self._db = None
+
+    async def _run_db(self, func, *args):
+        """Run a SQLite call on the session database thread"""
+        return await asyncio.get_running_loop().run_in_executor(self._db_thread, func, *args)
+
+    async def get_or_create(self, session_id: Optional[str] = None) -> ChatSession:
+        """
+        Fetch a session by id, falling back to SQLite, or start a new one.
+
+        Args:
+            session_id: Client-provided session id (None starts a new session)
+
+        Returns:
+            The ChatSession (most recently used in the LRU)
+        """
+        with self._lock:
+            if session_id and session_id in self._sessions:
+                self._sessions.move_to_end(session_id)
+                return self._sessions[session_id]
+
+        session = await self._run_db(self._load, session_id) if session_id and self._db else None
+
+        with self._lock:
+            # Another request may have loaded the same session meanwhile
+            if session_id and session_id in self._sessions:
+                self._sessions.move_to_end(session_id)
+                return self._sessions[session_id]
+            if session is None:
+                session = ChatSession(session_id=session_id or uuid.uuid4().hex)
+            self._remember(session)
+            return session
+
+    async def append_turn(self, session: ChatSession, role: str, content: str):
+        """Add a turn, compact the history to the budget and persist"""
+        with self._lock:
+            session.turns.append({"role": role, "content": content})
+            session.updated_at = time.time()
+            self._compact(session)
+            self._remember(session)
+            data = self._encode(session) if self._db else None
+        if data is not None:
+            await self._run_db(self._save, session.session_id, data, session.updated_at)
+
+    async def seed_history(self, session: ChatSession, history: List[dict]):
+        """Import client-sent history for a brand-new session (legacy clients)"""
+        for msg in history:
+            role = msg.get('role')
+            content = msg.get('content', '')
+            if role in ("user", "assistant") and content:
+                await self.append_turn(session, role, content)
+
+    def _remember(self, session: ChatSession):
+        self._sessions[session.session_id] = session
+        self._sessions.move_to_end(session.session_id)
+        while len(self._sessions) > self.max_sessions:
+            self._sessions.popitem(last=False)
+
+    def _compact(self, session: ChatSession):
+        """Fold the oldest turns into the summary until the turns fit the budget"""
+        used = sum(estimate_tokens(t["content"]) for t in session.turns)
+        evicted = []
+        while used > self.token_budget and len(session.turns) > self.min_recent_turns:
+            turn = session.turns.pop(0)
+            used -= estimate_tokens(turn["content"])
+            evicted.append(turn)
+
+        # A single oversized turn is truncated rather than sent whole
+        max_chars = self.token_budget * CHARS_PER_TOKEN
+        for turn in session.turns:
+            if len(turn["content"]) > max_chars:
+                turn["content"] = turn["content"][:max_chars]
+
+        if evicted:
+            self._summarize(session, evicted)
+
+    def _summarize(self, session: ChatSession, turns: List[Dict[str, str]]):
+        """Extractive rolling summary: earlier questions and courses discussed"""
+        courses = list(session.summary_courses)
+        questions = []
+        for turn in turns:
+            for subject, number in COURSE_CODE_PATTERN.findall(turn["content"]):
+                code = f"{subject.upper()} {number}"
+                if code not in courses:
+                    courses.append(code)
+            if turn["role"] == "user":
+                questions.append(turn["content"].strip().replace("\n", " ")[:160])
+
+        session.summary_courses = courses[-20:]
+
+        pieces = [session.summary] if session.summary else []
+        if questions:
+            pieces.append("Student asked: " + " | ".join(questions) + ".")
+        summary = " ".join(pieces)
+
+        # Keep the newest part of the summary when it outgrows its budget
+        max_chars = self.summary_budget * CHARS_PER_TOKEN
+        if len(summary) > max_chars:
+            summary = "..." + summary[-max_chars:]
+        session.summary = summary
+
+    def _load(self, session_id: str) -> Optional[ChatSession]:
+        if not self._db:
+            return None
+        try:
+            row = self._db.execute(
+                "SELECT data FROM chat_sessions WHERE session_id = ?", (session_id,)
+            ).fetchone()
+        except Exception as e:
+            logger.warning(f"Failed to load chat session {session_id}: {e}")
+            return None
+        if not row:
+            return None
+        data = json.loads(row[0])
+        return ChatSession(
+            session_id=session_id,
+            summary=data.get('summary', ''),
+            summary_courses=data.get('summary_courses', []),
+            turns=data.get('turns', []),
+            updated_at=data.get('updated_at', time.time()),
+        )
+
+    def _encode(self, session: ChatSession) -> str:
+        # Serialized under the lock so the database thread gets a consistent copy
+        return json.dumps({
+            "summary": session.summary,
+            "summary_courses": session.summary_courses,
+            "turns": session.turns,
+            "updated_at": session.updated_at,
+        })
+
+    def _save(self, session_id: str, data: str, updated_at: float):
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO chat_sessions (session_id, data, updated_at) VALUES (?, ?, ?)",
+                (session_id, data, updated_at)
+            )
+            self._db.commit()
+        except Exception as e:
+            logger.warning(f"Failed to persist chat session {session_id}: {e}")
@@ -0,0 +1,249 @@
+"""
+Course Index - TF-IDF vectors over the full course catalog
+
+Every graph node's title and description (plus the taxonomy skills found in
+them) is embedded into an L2-normalized TF-IDF matrix, one row per course.
+Scoring a job posting against the whole catalog is then a single
+matrix-vector product.
+"""
+
+import math
+import re
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+import logging
+
+import numpy as np
+
+from app.services.catalog import load_catalog_nodes
+from app.services.skill_extractor import get_skill_extractor
+
+logger = logging.getLogger(__name__)
+
+SKILL_PREFIX = "skill:"
+
+# Title words count this many times relative to description words
+TITLE_WEIGHT = 2
+
+_WORD_PATTERN = re.compile(r"[a-z][a-z0-9+#]*")
+
+# Generic English plus boilerplate common to course listings and job postings
+STOPWORDS = frozenset("""
+a about above after all also an and any are as at be been being between both but by can
+could do does each either etc for from has have how if in include includes including into
+is it its may more most must new not of on one or other our over per such than that the
+their them then there these they this those through to two under up upon us use used
+using via was we well were what when where which while who will with within without
+would you your
+course courses student students topic topics introduction intro lecture lectures class
+classes semester credit credits instructor permission prerequisite prerequisites enrollment
+graduate undergraduate level study studies emphasis focus cover covers covered covering
+basic advanced fundamental fundamentals principle principles overview selected various
+experience experienced year years team teams work working role job candidate candidates
+company looking ideal strong ability able skill skills knowledge requirement requirements
+required preferred plus bonus responsibility responsibilities opportunity opportunities
+engineer engineers developer developers hiring position need needs someone want
+""".split())
+
+
+def _stem(word: str) -> str:
+    """Fold simple plurals so "algorithms" matches "algorithm"."""
+    if len(word) > 4 and word.endswith("s") and not word.endswith(("ss", "us", "is")):
+        return word[:-1]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into index terms.
+
+    Words are lower-cased, stop-listed and plural-folded; every taxonomy
+    skill found in the text is added as a "skill:<name>" term so aliases
+    ("k8s", "Kubernetes") land on the same dimension.
+    """
+    terms = [
+        _stem(word) for word in _WORD_PATTERN.findall(text.lower())
+        if len(word) > 2 and word not in STOPWORDS
+    ]
+    terms.extend(SKILL_PREFIX + skill.lower() for skill in get_skill_extractor().extract(text))
+    return terms
+
+
+class CourseIndex:
+    """
+    TF-IDF matrix over the course catalog.
+
+    Args:
+        courses: Graph nodes with at least "id", "title" and "description"
+    """
+
+    def __init__(self, courses: List[Dict]):
+        self.course_ids: List[str] = [c["id"] for c in courses]
+        self.titles: List[str] = [c.get("title", "") for c in courses]
+        self._labels: Dict[str, str] = {}
+
+        documents = []
+        for course in courses:
+            title_terms = tokenize(course.get("title", ""))
+            terms = title_terms * TITLE_WEIGHT + tokenize(course.get("description", ""))
+            documents.append(Counter(terms))
+            for skill in get_skill_extractor().extract(f"{course.get('title', '')}\n{course.get('description', '')}"):
+                self._labels[SKILL_PREFIX + skill.lower()] = skill
+
+        document_frequency = Counter(term for doc in documents for term in doc)
+        self.terms: List[str] = sorted(document_frequency)
+        self.vocabulary: Dict[str, int] = {term: i for i, term in enumerate(self.terms)}
+
+        # Smoothed idf, as in scikit-learn's TfidfVectorizer
+        n = len(documents)
+        self.idf = np.array(
+            [math.log((1 + n) / (1 + document_frequency[t])) + 1.0 for t in self.terms],
+            dtype=np.float32,
+        )
+
+        self.matrix = np.zeros((n, len(self.terms)), dtype=np.float32)
+        for row, doc in enumerate(documents):
+            for term, count in doc.items():
+                self.matrix[row, self.vocabulary[term]] = 1.0 + math.log(count)
+        self.matrix *= self.idf
+        norms = np.linalg.norm(self.matrix, axis=1, keepdims=True)
+        self.matrix /= np.where(norms == 0, 1.0, norms)
+
+        logger.info(f"Built course index: {n} courses x {len(self.terms)} terms")
+
+    def __len__(self) -> int:
+        return len(self.course_ids)
+
+    def vectorize(self, text: str) -> np.ndarray:
+        """L2-normalized TF-IDF vector for free text (unknown terms are dropped)."""
+        vector = np.zeros(len(self.terms), dtype=np.float32)
+        for term, count in Counter(tokenize(text)).items():
+            column = self.vocabulary.get(term)
+            if column is not None:
+                vector[column] = 1.0 + math.log(count)
+        vector *= self.idf
+        norm = np.linalg.norm(vector)
+        if norm > 0:
+            vector /= norm
+        return vector
+
+    def vectorize_many(self, texts: List[str]):
+        """
+        L2-normalized TF-IDF vectors for many texts at once.
+
+        Returns:
+            scipy.sparse CSR matrix of shape (len(texts), vocabulary size)
+        """
+        from scipy import sparse
+
+        indptr = [0]
+        indices: List[int] = []
+        counts: List[float] = []
+        for text in texts:
+            for term, count in Counter(tokenize(text)).items():
+                column = self.vocabulary.get(term)
+                if column is not None:
+                    indices.append(column)
+                    counts.append(1.0 + math.log(count))
+            indptr.append(len(indices))
+
+        indices_array = np.array(indices, dtype=np.int32)
+        data = np.array(counts, dtype=np.float32) * self.idf[indices_array]
+        rows = np.repeat(np.arange(len(texts)), np.diff(indptr))
+        norms = np.sqrt(np.bincount(rows, weights=data * data, minlength=len(texts))).astype(np.float32)
+        data /= norms[rows]
+
+        return sparse.csr_matrix(
+            (data, indices_array, np.array(indptr, dtype=np.int64)),
+            shape=(len(texts), len(self.terms)),
+        )
+
+    def search_many(
+        self, texts: List[str], top_k: int = 5, chunk_size: int = 4096
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Rank courses for many texts with sparse-dense matrix products.
+
+        Identical texts are vectorized once, and texts are scored in chunks so
+        the dense score block stays at `chunk_size` x courses.
+
+        Args:
+            texts: Job descriptions or other free text
+            top_k: Courses kept per text
+            chunk_size: Texts scored per matrix product
+
+        Returns:
+            (rows, scores) arrays of shape (len(texts), k): course row indices
+            into `course_ids` and their cosine similarities, best first
+        """
+        k = min(top_k, len(self.course_ids))
+        unique_texts = list(dict.fromkeys(texts))
+        position = {text: i for i, text in enumerate(unique_texts)}
+
+        top_rows = np.zeros((len(unique_texts), k), dtype=np.int32)
+        top_scores = np.zeros((len(unique_texts), k), dtype=np.float32)
+        if k > 0:
+            for start in range(0, len(unique_texts), chunk_size):
+                vectors = self.vectorize_many(unique_texts[start:start + chunk_size])
+                scores = np.asarray(vectors @ self.matrix.T)
+                rows = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+                block = np.take_along_axis(scores, rows, axis=1)
+                order = np.argsort(-block, axis=1, kind="stable")
+                top_rows[start:start + len(scores)] = np.take_along_axis(rows, order, axis=1)
+                top_scores[start:start + len(scores)] = np.take_along_axis(block, order, axis=1)
+
+        lookup = np.array([position[text] for text in texts], dtype=np.int64)
+        return top_rows[lookup], top_scores[lookup]
+
+    def label(self, term: str) -> str:
+        """Human-readable form of an index term."""
+        return self._labels.get(term, term)
+
+    def search(self, text: str, top_k: int = 8, min_score: float = 0.0) -> List[Tuple[str, float, List[str]]]:
+        """
+        Rank courses by cosine similarity to `text`.
+
+        Args:
+            text: Job description or other free text
+            top_k: Maximum results
+            min_score: Drop courses scoring at or below this similarity
+
+        Returns:
+            (course_id, score, top shared terms) tuples, best first
+        """
+        query = self.vectorize(text)
+        scores = self.matrix @ query
+
+        k = min(top_k, len(scores))
+        if k <= 0:
+            return []
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        results = []
+        for row in top:
+            score = float(scores[row])
+            if score <= min_score:
+                break
+            contributions = self.matrix[row] * query
+            shared = [self.terms[c] for c in np.argsort(-contributions)[:6] if contributions[c] > 0]
+            results.append((self.course_ids[row], score, self._explain(shared)))
+        return results
+
+    def _explain(self, terms: List[str], limit: int = 3) -> List[str]:
+        """Prefer skill names over the single words they are made of."""
+        skills = [self.label(t) for t in terms if t.startswith(SKILL_PREFIX)]
+        covered = {_stem(word) for skill in skills for word in _WORD_PATTERN.findall(skill.lower())}
+        words = [t for t in terms if not t.startswith(SKILL_PREFIX) and t not in covered]
+        return (skills + words)[:limit]
+
+
+_index: Optional[CourseIndex] = None
+
+
+def get_course_index() -> CourseIndex:
+    """Shared CourseIndex, built from graph_data.json on first use"""
+    global _index
+    if _index is None:
+        _index = CourseIndex(load_catalog_nodes())
+    return _index
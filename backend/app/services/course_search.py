@@ -0,0 +1,223 @@
+"""
+Course Search - Vectorized filtering and ranking over the course table
+
+Every filter is a boolean mask over CourseTable's columns, and the top
+results come from argpartition, so a query costs a few array passes no
+matter how many courses match. Text queries match course codes by prefix
+("cs 21", "cs21", or just the number "21") and title words by prefix,
+with a close-spelling fallback for typos ("algoritms").
+"""
+
+import bisect
+import difflib
+import re
+import threading
+from typing import Dict, Iterable, List, Optional
+import logging
+
+import numpy as np
+
+from app.services.course_table import CourseTable, get_course_table, normalize_code
+
+logger = logging.getLogger(__name__)
+
+SORT_FIELDS = ("relevance", "centrality", "difficulty", "enjoyment", "level", "code")
+
+# Text match weights: a code hit outranks any number of title-word hits
+CODE_EXACT_SCORE = 8.0
+CODE_PREFIX_SCORE = 4.0
+WORD_PREFIX_SCORE = 1.0
+WORD_FUZZY_SCORE = 0.5
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def title_words(text: str) -> List[str]:
+    """Lower-cased alphanumeric words of a title"""
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+class CourseSearch:
+    """
+    Search index over a CourseTable.
+
+    Args:
+        table: Course table to search
+    """
+
+    def __init__(self, table: CourseTable):
+        self.table = table
+        n = len(table)
+
+        self.codes = np.array([normalize_code(course_id) for course_id in table.ids])
+        # Catalog number part of each code ("2110"), so bare numbers match like in suggest
+        self.numbers = np.array([course_id.rpartition(" ")[2].lower() for course_id in table.ids])
+
+        # Row rank in code order, for sorting by code
+        self.code_rank = np.argsort(np.argsort(self.codes, kind="stable"), kind="stable").astype(np.int32)
+
+        # Subjects as small integer categories
+        self.subject_names: List[str] = sorted(set(table.subjects))
+        subject_ids = {name: i for i, name in enumerate(self.subject_names)}
+        self.subject_index = np.array([subject_ids[s] for s in table.subjects], dtype=np.int16)
+
+        # Title word -> rows containing it, plus the sorted vocabulary for prefix lookups
+        rows_by_word: Dict[str, List[int]] = {}
+        for row, title in enumerate(table.titles):
+            for word in set(title_words(title)):
+                rows_by_word.setdefault(word, []).append(row)
+        self.vocabulary: List[str] = sorted(rows_by_word)
+        self._word_rows: Dict[str, np.ndarray] = {
+            word: np.array(rows, dtype=np.int32) for word, rows in rows_by_word.items()
+        }
+
+        logger.info(f"Built course search index: {n} courses, {len(self.vocabulary)} title words")
+
+    def _words_with_prefix(self, prefix: str) -> List[str]:
+        start = bisect.bisect_left(self.vocabulary, prefix)
+        end = bisect.bisect_left(self.vocabulary, prefix + "\uffff")
+        return self.vocabulary[start:end]
+
+    def text_scores(self, query: str) -> np.ndarray:
+        """
+        Relevance of every course to a text query (0 = no match).
+
+        A course matches if its code or catalog number starts with the query,
+        or if every query word is a prefix of (or close to) some word in its title.
+        """
+        n = len(self.table)
+        scores = np.zeros(n, dtype=np.float32)
+        code = normalize_code(query)
+        if not code:
+            return scores
+
+        scores[self.codes == code] = CODE_EXACT_SCORE
+        scores[(scores == 0) & np.char.startswith(self.codes, code)] = CODE_PREFIX_SCORE
+        scores[(scores == 0) & np.char.startswith(self.numbers, code)] = CODE_PREFIX_SCORE
+
+        words = title_words(query)
+        if words:
+            title_scores = np.zeros(n, dtype=np.float32)
+            matched_all = np.ones(n, dtype=bool)
+            for word in words:
+                word_scores = np.zeros(n, dtype=np.float32)
+                for match in self._words_with_prefix(word):
+                    word_scores[self._word_rows[match]] = WORD_PREFIX_SCORE
+                if len(word) >= 4:
+                    for match in difflib.get_close_matches(word, self.vocabulary, n=3, cutoff=0.8):
+                        rows = self._word_rows[match]
+                        word_scores[rows] = np.maximum(word_scores[rows], WORD_FUZZY_SCORE)
+                matched_all &= word_scores > 0
+                title_scores += word_scores
+            scores += np.where(matched_all, title_scores, 0)
+        return scores
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        subjects: Iterable[str] = (),
+        levels: Iterable[int] = (),
+        min_difficulty: Optional[float] = None,
+        max_difficulty: Optional[float] = None,
+        min_enjoyment: Optional[float] = None,
+        max_enjoyment: Optional[float] = None,
+        min_centrality: Optional[float] = None,
+        sort: str = "relevance",
+        descending: Optional[bool] = None,
+        limit: int = 20,
+    ) -> Dict:
+        """
+        Filter and rank courses.
+
+        Args:
+            query: Code or title text (prefix and typo tolerant)
+            subjects: Keep these subjects, e.g. ["CS"] (empty keeps all)
+            levels: Keep these levels, e.g. [4000] (empty keeps all)
+            min_difficulty / max_difficulty: Inclusive difficulty bounds (1-10)
+            min_enjoyment / max_enjoyment: Inclusive enjoyment bounds (1-10)
+            min_centrality: Inclusive lower bound on PageRank centrality
+            sort: One of SORT_FIELDS; "relevance" falls back to centrality
+                without a query
+            descending: Largest values first (default: true except for "code")
+            limit: Maximum results
+
+        Returns:
+            - total: Number of matching courses
+            - results: Course summaries, best first
+        """
+        table = self.table
+        mask = np.ones(len(table), dtype=bool)
+
+        subjects = {s.strip().upper() for s in subjects if s and s.strip()}
+        if subjects:
+            wanted = [i for i, name in enumerate(self.subject_names) if name in subjects]
+            mask &= np.isin(self.subject_index, wanted)
+        levels = {int(level) for level in levels}
+        if levels:
+            mask &= np.isin(table.level, list(levels))
+
+        for column, low, high in (
+            (table.difficulty, min_difficulty, max_difficulty),
+            (table.enjoyment, min_enjoyment, max_enjoyment),
+            (table.centrality, min_centrality, None),
+        ):
+            if low is not None:
+                mask &= column >= low
+            if high is not None:
+                mask &= column <= high
+
+        scores = None
+        if query and query.strip():
+            scores = self.text_scores(query)
+            mask &= scores > 0
+
+        rows = np.flatnonzero(mask)
+        total = len(rows)
+
+        if sort == "relevance":
+            # Centrality (< 1) breaks ties between equal text scores
+            key = table.centrality if scores is None else scores + table.centrality
+        else:
+            key = {"centrality": table.centrality, "difficulty": table.difficulty,
+                   "enjoyment": table.enjoyment, "level": table.level, "code": self.code_rank}[sort]
+        if descending is None:
+            descending = sort != "code"
+        keys = -key[rows] if descending else key[rows]
+
+        k = min(limit, total)
+        if 0 < k < total:
+            top = np.argpartition(keys, k - 1)[:k]
+            rows, keys = rows[top], keys[top]
+        rows = rows[np.argsort(keys, kind="stable")][:k]
+
+        results = []
+        for row in rows:
+            course = table.course(int(row))
+            result = {
+                "id": course.id,
+                "title": course.title,
+                "subject": course.subject,
+                "level": course.level,
+                "difficulty_score": course.difficulty,
+                "enjoyment_score": course.enjoyment,
+                "centrality": course.centrality,
+            }
+            if scores is not None:
+                result["match_score"] = round(float(scores[row]), 2)
+            results.append(result)
+
+        return {"total": int(total), "results": results}
+
+
+_search: Optional[CourseSearch] = None
+_search_lock = threading.Lock()
+
+
+def get_course_search() -> CourseSearch:
+    """Shared CourseSearch, built from the course table on first use"""
+    global _search
+    if _search is None:
+        with _search_lock:
+            if _search is None:
+                _search = CourseSearch(get_course_table())
+    return _search
@@ -0,0 +1,196 @@
+"""
+Course Suggest - Typeahead over course codes and title words
+
+A prefix trie holds every course code in its common spellings ("cs2110",
+"cs 2110", "2110") and every title word. Each trie node stores its best
+few courses, ranked ahead of time (code matches first, then centrality),
+so answering a keystroke is a walk down the query's characters. Recent
+answers are kept in a small per-prefix LRU.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+import logging
+
+import numpy as np
+
+from app.services.course_search import title_words
+from app.services.course_table import CourseTable, get_course_table
+
+logger = logging.getLogger(__name__)
+
+# Courses stored per trie node (the most a request can ask for)
+MAX_SUGGESTIONS = 20
+
+CODE_MATCH = 0
+TITLE_MATCH = 1
+
+
+def normalize_query(text: str) -> str:
+    """Lower-case and collapse whitespace ("  CS   2110 " -> "cs 2110")"""
+    return " ".join(text.lower().split())
+
+
+class _Node:
+    __slots__ = ("children", "top", "rows")
+
+    def __init__(self):
+        self.children: Dict[str, "_Node"] = {}
+        # Best (kind, rank, row) entries in this subtree
+        self.top: List[Tuple[int, int, int]] = []
+        # (kind, row) entries for keys ending exactly here
+        self.rows: Set[Tuple[int, int]] = set()
+
+
+class CourseSuggester:
+    """
+    Prefix trie over a CourseTable.
+
+    Args:
+        table: Course table to suggest from
+        cache_size: Answers remembered per (prefix, limit)
+    """
+
+    def __init__(self, table: CourseTable, cache_size: int = 2048):
+        self.table = table
+        self.root = _Node()
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, int], List[Dict]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Rank 0 is the most central course; ties go to the lower code
+        order = np.lexsort((np.array(table.ids), -table.centrality))
+        self.rank = np.empty(len(table), dtype=np.int32)
+        self.rank[order] = np.arange(len(table), dtype=np.int32)
+
+        for row, course_id in enumerate(table.ids):
+            code = course_id.lower()
+            number = code.rpartition(" ")[2]
+            for key in {code, code.replace(" ", ""), number}:
+                self._insert(key, CODE_MATCH, row)
+            for word in set(title_words(table.titles[row])):
+                self._insert(word, TITLE_MATCH, row)
+
+        self._rank_subtrees(self.root)
+        logger.info(f"Built course suggestion trie for {len(table)} courses")
+
+    def _insert(self, key: str, kind: int, row: int):
+        node = self.root
+        for char in key:
+            node = node.children.setdefault(char, _Node())
+        node.rows.add((kind, row))
+
+    def _rank_subtrees(self, root: _Node):
+        """Fill every node's `top` with the best entries of its subtree (post-order)"""
+        stack = [(root, False)]
+        while stack:
+            node, children_done = stack.pop()
+            if not children_done:
+                stack.append((node, True))
+                stack.extend((child, False) for child in node.children.values())
+                continue
+
+            best: Dict[int, Tuple[int, int, int]] = {}
+            candidates = [(kind, int(self.rank[row]), row) for kind, row in node.rows]
+            for child in node.children.values():
+                candidates.extend(child.top)
+            for entry in sorted(candidates):
+                if entry[2] not in best:
+                    best[entry[2]] = entry
+                    if len(best) == MAX_SUGGESTIONS:
+                        break
+            node.top = list(best.values())
+
+    def _find(self, prefix: str) -> Optional[_Node]:
+        node = self.root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return None
+        return node
+
+    def _subtree_rows(self, node: _Node) -> Dict[int, int]:
+        """Row -> best match kind for every key under a node"""
+        rows: Dict[int, int] = {}
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            for kind, row in current.rows:
+                rows[row] = min(kind, rows.get(row, kind))
+            stack.extend(current.children.values())
+        return rows
+
+    def _lookup(self, query: str, limit: int) -> List[Tuple[int, int, int]]:
+        node = self._find(query)
+        if node is not None:
+            return node.top[:limit]
+
+        # Several words ("machine lea"): courses matching every word by prefix
+        words = query.split()
+        if len(words) < 2:
+            return []
+        matches: Optional[Dict[int, int]] = None
+        for word in words:
+            node = self._find(word)
+            if node is None:
+                return []
+            rows = self._subtree_rows(node)
+            matches = rows if matches is None else {
+                row: max(kind, matches[row]) for row, kind in rows.items() if row in matches
+            }
+            if not matches:
+                return []
+        return sorted((kind, int(self.rank[row]), row) for row, kind in matches.items())[:limit]
+
+    def suggest(self, query: str, limit: int = 8) -> List[Dict]:
+        """
+        Courses whose code or title words start with `query`.
+
+        Args:
+            query: What the user has typed so far
+            limit: Maximum suggestions (at most MAX_SUGGESTIONS)
+
+        Returns:
+            Suggestions with id, title and whether the code or title matched
+        """
+        query = normalize_query(query)
+        limit = max(0, min(limit, MAX_SUGGESTIONS))
+        if not query or not limit:
+            return []
+
+        key = (query, limit)
+        with self._lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return [dict(s) for s in cached]
+
+        suggestions = [
+            {
+                "id": self.table.ids[row],
+                "title": self.table.titles[row],
+                "match": "code" if kind == CODE_MATCH else "title",
+            }
+            for kind, _, row in self._lookup(query, limit)
+        ]
+
+        with self._lock:
+            self._cache[key] = suggestions
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+        return [dict(s) for s in suggestions]
+
+
+_suggester: Optional[CourseSuggester] = None
+_suggester_lock = threading.Lock()
+
+
+def get_course_suggester() -> CourseSuggester:
+    """Shared CourseSuggester, built from the course table on first use"""
+    global _suggester
+    if _suggester is None:
+        with _suggester_lock:
+            if _suggester is None:
+                _suggester = CourseSuggester(get_course_table())
+    return _suggester
@@ -0,0 +1,214 @@
+"""
+Course Table - Struct-of-arrays view of the course catalog
+
+One row per course. Numeric fields live in typed NumPy arrays so filters,
+scans and sorts run vectorized; IDs, titles and subjects are decoded once
+and interned, and descriptions stay in the memory-mapped catalog until
+someone asks for them. A `Course` is a two-slot handle (table, row) rather
+than a dict, so holding or passing courses around copies nothing.
+"""
+
+import sys
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+import logging
+
+import numpy as np
+
+from app.services.catalog import get_catalog
+from app.services.catalog_file import HAS_PREREQ_ENTRY, CatalogFile
+
+logger = logging.getLogger(__name__)
+
+# Score used for courses with neither RMP nor Reddit data
+NEUTRAL_SCORE = 5.0
+
+
+def normalize_code(text: str) -> str:
+    """Course code or code prefix without case or spaces ("CS 2110" -> "cs2110")"""
+    return "".join(text.lower().split())
+
+
+def _score(value) -> float:
+    # Scores are stored as float32; the source data has at most 4 decimals
+    return round(float(value), 4)
+
+
+class Course:
+    """Lightweight handle to one row of a CourseTable"""
+
+    __slots__ = ("table", "row")
+
+    def __init__(self, table: "CourseTable", row: int):
+        self.table = table
+        self.row = row
+
+    def __repr__(self) -> str:
+        return f"Course({self.id!r})"
+
+    @property
+    def id(self) -> str:
+        return self.table.ids[self.row]
+
+    @property
+    def title(self) -> str:
+        return self.table.titles[self.row]
+
+    @property
+    def subject(self) -> str:
+        return self.table.subjects[self.row]
+
+    @property
+    def description(self) -> str:
+        return self.table.catalog.text("description", self.row)
+
+    @property
+    def catalog_number(self) -> int:
+        return int(self.table.catalog_number[self.row])
+
+    @property
+    def level(self) -> int:
+        return int(self.table.level[self.row])
+
+    @property
+    def difficulty(self) -> float:
+        return _score(self.table.difficulty[self.row])
+
+    @property
+    def enjoyment(self) -> float:
+        return _score(self.table.enjoyment[self.row])
+
+    @property
+    def centrality(self) -> float:
+        return _score(self.table.centrality[self.row])
+
+    @property
+    def in_degree(self) -> int:
+        return int(self.table.in_degree[self.row])
+
+    @property
+    def out_degree(self) -> int:
+        return int(self.table.out_degree[self.row])
+
+    def to_node(self) -> Dict:
+        """Graph node dict as served by /api/graph"""
+        return self.table.node(self.row)
+
+
+class CourseTable:
+    """
+    Columnar course catalog.
+
+    Difficulty and enjoyment are the RMP averages where scraped, otherwise
+    the Reddit sentiment scores from the graph (the same precedence as
+    /api/graph). Degrees come from prerequisites.json when it is present.
+
+    Args:
+        catalog: Mapped catalog file
+    """
+
+    def __init__(self, catalog: CatalogFile):
+        self.catalog = catalog
+        n = len(catalog)
+
+        self.ids: List[str] = [sys.intern(course_id) for course_id in catalog.ids]
+        self.titles: List[str] = [sys.intern(catalog.text("title", row)) for row in range(n)]
+        self.subjects: List[str] = [sys.intern(catalog.text("subject", row)) for row in range(n)]
+        self._rows: Dict[str, int] = {course_id: row for row, course_id in enumerate(self.ids)}
+        self._rows_by_code: Dict[str, int] = {normalize_code(course_id): row for row, course_id in enumerate(self.ids)}
+
+        numbers = [catalog.text("catalog_number", row) for row in range(n)]
+        self.catalog_number = np.array([int(x) if x.isdigit() else 0 for x in numbers], dtype=np.int32)
+        self.level = (self.catalog_number // 1000 * 1000).astype(np.int16)
+
+        def merged(rmp_field: str, graph_field: str) -> np.ndarray:
+            rmp = catalog.column(rmp_field)
+            graph = catalog.column(graph_field)
+            values = np.where(np.isnan(rmp), graph, rmp)
+            return np.where(np.isnan(values), NEUTRAL_SCORE, values).astype(np.float32)
+
+        self.difficulty = merged("rmp_difficulty", "difficulty_score")
+        self.enjoyment = merged("rmp_enjoyment", "enjoyment_score")
+        self.centrality = np.nan_to_num(catalog.column("centrality")).astype(np.float32)
+
+        self.has_prereq_data = bool(np.any(catalog.column("flags") & HAS_PREREQ_ENTRY))
+        if self.has_prereq_data:
+            self.in_degree = np.diff(catalog.column("prereq_offsets")).astype(np.int32)
+            self.out_degree = np.diff(catalog.column("unlock_offsets")).astype(np.int32)
+        else:
+            self.in_degree = np.maximum(catalog.column("in_degree"), 0)
+            self.out_degree = np.maximum(catalog.column("out_degree"), 0)
+
+        logger.info(f"Built course table with {n} courses")
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, course_id: str) -> bool:
+        return course_id in self._rows
+
+    def __iter__(self) -> Iterator[Course]:
+        return (Course(self, row) for row in range(len(self)))
+
+    def row(self, course_id: str) -> Optional[int]:
+        """Row index of a course, or None if it is not in the catalog"""
+        return self._rows.get(course_id)
+
+    def get(self, course_id: str) -> Optional[Course]:
+        """Course by ID, or None"""
+        row = self._rows.get(course_id)
+        return Course(self, row) if row is not None else None
+
+    def course(self, row: int) -> Course:
+        return Course(self, row)
+
+    def find(self, code: str) -> Optional[Course]:
+        """Course by ID in any spacing or case ("cs2110", "CS  2110")"""
+        row = self._rows_by_code.get(normalize_code(code))
+        return Course(self, row) if row is not None else None
+
+    def similar(self, row: int, limit: int = 10) -> List[Tuple[Course, float]]:
+        """
+        Precomputed most similar courses (see similar_courses.py).
+
+        Returns:
+            (course, score) pairs, most similar first
+        """
+        return [(Course(self, neighbor), score) for neighbor, score in self.catalog.similar(row)[:limit]]
+
+    def node(self, row: int) -> Dict:
+        """
+        Graph node dict for one course, with RMP scores and prerequisite
+        data merged in.
+        """
+        catalog = self.catalog
+        node = catalog.node(row)
+
+        rmp = catalog.rmp(row)
+        if rmp:
+            if rmp['avg_difficulty'] is not None:
+                node['difficulty_score'] = rmp['avg_difficulty']
+            if rmp['avg_enjoyment'] is not None:
+                node['enjoyment_score'] = rmp['avg_enjoyment']
+            node['score_source'] = 'rmp'
+
+        if self.has_prereq_data:
+            node['prerequisites'] = catalog.prerequisites(row)
+            node['unlocks'] = catalog.unlocks(row)
+            node['in_degree'] = len(node['prerequisites'])
+            node['out_degree'] = len(node['unlocks'])
+        return node
+
+
+_table: Optional[CourseTable] = None
+_table_lock = threading.Lock()
+
+
+def get_course_table() -> CourseTable:
+    """Shared CourseTable, built from the catalog on first use"""
+    global _table
+    if _table is None:
+        with _table_lock:
+            if _table is None:
+                _table = CourseTable(get_catalog())
+    return _table
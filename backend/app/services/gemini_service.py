@@ -2,7 +2,6 @@
 Gemini API Service for Prerequisite Parsing
 """
 
-from google import genai
 from typing import List
 import json
 import re
@@ -18,6 +17,9 @@ class GeminiPrerequisiteParser:
 
     def __init__(self):
         if settings.GEMINI_API_KEY:
+            # Imported here so the SDK only loads when Gemini is actually used
+            from google import genai
+
             os.environ['GOOGLE_API_KEY'] = settings.GEMINI_API_KEY
             self.client = genai.Client()
         else:
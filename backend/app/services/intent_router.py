@@ -0,0 +1,193 @@
+"""
+Intent Router - Answers factual course lookups locally, without the LLM
+
+Short questions like "prereqs for CS 3110?", "what does CS 2110 unlock?" or
+"how hard is MATH 2940?" are answered from the catalog indexes with templated
+responses. Anything open-ended returns None and goes to the model.
+"""
+
+import re
+from typing import Callable, Dict, List, Optional, Tuple
+import logging
+
+from app.services.rmp_service import (
+    get_course_info,
+    get_prerequisites,
+    get_unlocks,
+    get_rmp_data,
+    get_reddit_sentiment,
+)
+
+logger = logging.getLogger(__name__)
+
+COURSE_CODE_PATTERN = re.compile(r'\b(CS|MATH)\s*(\d{4})\b', re.IGNORECASE)
+
+# Longer messages are almost always open-ended, even when they contain a keyword
+MAX_ROUTABLE_WORDS = 16
+
+# Phrases that signal a question needing judgement rather than a lookup
+OPEN_ENDED_PATTERN = re.compile(
+    r'\b(should|recommend|suggest|compare|versus|vs\.?|better|worth|career|job|'
+    r'plan|why|explain|help me|instead|or)\b',
+    re.IGNORECASE
+)
+
+INTENT_PATTERNS: List[Tuple[str, re.Pattern]] = [
+    ("unlocks", re.compile(
+        r'\b(unlock\w*|lead\w* to|open\w* up|after (taking )?(cs|math)\s*\d{4}|'
+        r'(is|are) (cs|math)\s*\d{4} (a )?prereq\w*( for)?)\b',
+        re.IGNORECASE
+    )),
+    ("prerequisites", re.compile(
+        r'\b(prereq\w*|pre-req\w*|requirements? for|required (for|before)|'
+        r'need (to take )?before|take before|depend\w* on)\b',
+        re.IGNORECASE
+    )),
+    ("difficulty", re.compile(
+        r'\b(how (hard|difficult|tough|easy)|difficulty|workload|hard is|'
+        r'is (cs|math)\s*\d{4} (hard|difficult|easy))\b',
+        re.IGNORECASE
+    )),
+    ("professors", re.compile(
+        r'\b(who teaches|professors?|instructors?|taught by|rmp|rate ?my ?prof\w*)\b',
+        re.IGNORECASE
+    )),
+    ("description", re.compile(
+        r'^\s*(what(\'s| is) (cs|math)\s*\d{4}( about)?|describe (cs|math)\s*\d{4}|'
+        r'what does (cs|math)\s*\d{4} cover|tell me about (cs|math)\s*\d{4})\s*\??\s*$',
+        re.IGNORECASE
+    )),
+]
+
+
+def classify_intent(message: str) -> Optional[Tuple[str, str]]:
+    """
+    Classify a chat message as a single-course factual lookup.
+
+    Args:
+        message: Raw user message
+
+    Returns:
+        (intent, course_id) tuple, or None if the message should go to the LLM
+    """
+    if len(message.split()) > MAX_ROUTABLE_WORDS:
+        return None
+
+    codes = list(dict.fromkeys(
+        f"{subject.upper()} {number}" for subject, number in COURSE_CODE_PATTERN.findall(message)
+    ))
+    if len(codes) != 1:
+        return None
+
+    if OPEN_ENDED_PATTERN.search(message):
+        return None
+
+    for intent, pattern in INTENT_PATTERNS:
+        if pattern.search(message):
+            return intent, codes[0]
+    return None
+
+
+def _course_label(course_id: str) -> str:
+    info = get_course_info(course_id)
+    if info and info['title']:
+        return f"{course_id} ({info['title']})"
+    return course_id
+
+
+def _answer_prerequisites(course_id: str) -> Optional[str]:
+    prereqs = get_prerequisites(course_id)
+    if prereqs is None:
+        return None
+    if not prereqs:
+        return f"{_course_label(course_id)} has no listed CS or MATH prerequisites in the catalog."
+    return (
+        f"{_course_label(course_id)} requires: {', '.join(prereqs)}.\n"
+        f"Make sure these are completed in an earlier semester."
+    )
+
+
+def _answer_unlocks(course_id: str) -> Optional[str]:
+    unlocks = get_unlocks(course_id)
+    if unlocks is None:
+        return None
+    if not unlocks:
+        return f"No catalog courses list {course_id} as a direct prerequisite."
+    return (
+        f"{_course_label(course_id)} is a direct prerequisite for {len(unlocks)} "
+        f"course{'s' if len(unlocks) != 1 else ''}: {', '.join(unlocks)}."
+    )
+
+
+def _answer_difficulty(course_id: str) -> Optional[str]:
+    rmp = get_rmp_data(course_id)
+    reddit = get_reddit_sentiment(course_id)
+    lines = []
+    if rmp and rmp.get('avg_difficulty') is not None:
+        line = f"RateMyProfessor: average difficulty {rmp['avg_difficulty']}/10"
+        if rmp.get('avg_enjoyment') is not None:
+            line += f", average enjoyment {rmp['avg_enjoyment']}/10"
+        lines.append(line + ".")
+    if reddit:
+        lines.append(
+            f"Reddit reviews: difficulty {reddit['difficulty_score']}/10, "
+            f"enjoyment {reddit['enjoyment_score']}/10 "
+            f"({reddit['comment_count']} reviews, {reddit['confidence']} confidence)."
+        )
+    if not lines:
+        return None
+    return f"Here's how students rate {_course_label(course_id)}:\n" + "\n".join(lines)
+
+
+def _answer_professors(course_id: str) -> Optional[str]:
+    rmp = get_rmp_data(course_id)
+    if not rmp or not rmp.get('professors'):
+        return None
+    lines = []
+    for prof in rmp['professors'][:5]:
+        line = f"- Prof. {prof['name']}"
+        if prof.get('rating'):
+            line += f": {prof['rating']}/5 rating"
+        if prof.get('difficulty'):
+            line += f", {prof['difficulty']}/5 difficulty"
+        if prof.get('would_take_again') is not None:
+            line += f", {prof['would_take_again']}% would take again"
+        lines.append(line)
+    return f"RateMyProfessor ratings for {_course_label(course_id)} instructors:\n" + "\n".join(lines)
+
+
+def _answer_description(course_id: str) -> Optional[str]:
+    info = get_course_info(course_id)
+    if not info or not info['description']:
+        return None
+    return f"{_course_label(course_id)}: {info['description']}"
+
+
+_ANSWERERS: Dict[str, Callable[[str], Optional[str]]] = {
+    "prerequisites": _answer_prerequisites,
+    "unlocks": _answer_unlocks,
+    "difficulty": _answer_difficulty,
+    "professors": _answer_professors,
+    "description": _answer_description,
+}
+
+
+def route_message(message: str) -> Optional[str]:
+    """
+    Answer a chat message from local catalog data if it is a factual lookup.
+
+    Args:
+        message: Raw user message
+
+    Returns:
+        Templated answer, or None if the message should be sent to the LLM
+    """
+    intent = classify_intent(message)
+    if not intent:
+        return None
+
+    name, course_id = intent
+    answer = _ANSWERERS[name](course_id)
+    if answer:
+        logger.info(f"Answered '{name}' for {course_id} locally")
+    return answer
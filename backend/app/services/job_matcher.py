@@ -1,195 +1,249 @@
 import json
 import re
-from typing import Dict, Any, List
-import openai
+from typing import Dict, Any, List, Optional
+import logging
 from ..config.settings import settings
+from .llm_service import chat_completion, get_openai_client, request_key
+from .result_cache import ResultCache
+from .prereq_graph import get_prerequisite_graph, normalize_course_codes
+from .skill_index import get_skill_index
+
+logger = logging.getLogger(__name__)
+
+# Cosine similarity at which a course counts as a full match (relevance 1.0)
+SCORE_SATURATION = 0.35
+
+# Courses scoring at or below this similarity are not reported
+MIN_SIMILARITY = 0.05
+
+# Top matches used as learning-path targets, and per-course paths listed
+PATH_TARGETS = 5
+SINGLE_COURSE_PATHS = 2
+
+
+def match_postings(postings: List[str], top_k: int = 5) -> Dict[str, Any]:
+    """
+    Match many job postings at once and aggregate course demand.
+
+    CPU-bound and LLM-free; call from a worker thread in async code.
+
+    Args:
+        postings: Job description texts
+        top_k: Courses kept per posting
+
+    Returns:
+        - results: Top courses (code, relevance_score) per posting, in input order
+        - course_demand: Courses ranked by how many postings matched them,
+          with mean relevance across those postings
+        - postings: Number of postings matched
+    """
+    # NumPy and the course index load on first use to keep app startup fast
+    import numpy as np
+    from .course_index import get_course_index
+
+    index = get_course_index()
+    rows, scores = index.search_many(postings, top_k=top_k)
+    relevance = np.minimum(1.0, scores.astype(np.float64) / SCORE_SATURATION).round(2)
+    matched = scores > MIN_SIMILARITY
+
+    results = [
+        [
+            {"code": index.course_ids[row], "relevance_score": float(rel)}
+            for row, rel, ok in zip(row_list, rel_list, ok_list) if ok
+        ]
+        for row_list, rel_list, ok_list in zip(rows.tolist(), relevance.tolist(), matched.tolist())
+    ]
+
+    demand = np.bincount(rows[matched], minlength=len(index))
+    relevance_sum = np.bincount(rows[matched], weights=relevance[matched], minlength=len(index))
+    course_demand = [
+        {
+            "code": index.course_ids[row],
+            "title": index.titles[row],
+            "postings": int(demand[row]),
+            "mean_relevance": round(float(relevance_sum[row] / demand[row]), 2),
+        }
+        for row in np.argsort(-demand, kind="stable") if demand[row] > 0
+    ]
+
+    return {"results": results, "course_demand": course_demand, "postings": len(postings)}
+
 
 class JobMatcherService:
     """Service for matching job descriptions with Cornell CS/Math courses."""
 
     def __init__(self):
-        self.client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.client = get_openai_client()
+        # LLM explanations keyed by the full completion request
+        self.cache = ResultCache(namespace="job_match", max_entries=settings.JOB_MATCH_CACHE_SIZE)
 
-        # Sample Cornell CS/Math courses database (subset)
-        self.courses_db = {
-            "CS 1110": {
-                "title": "Introduction to Computing Using Python",
-                "skills": ["Python", "Programming Fundamentals", "Problem Solving"]
-            },
-            "CS 2110": {
-                "title": "Object-Oriented Programming and Data Structures",
-                "skills": ["Java", "OOP", "Data Structures", "Algorithms"]
-            },
-            "CS 2800": {
-                "title": "Discrete Structures",
-                "skills": ["Discrete Math", "Logic", "Proofs", "Graph Theory"]
-            },
-            "CS 3110": {
-                "title": "Data Structures and Functional Programming",
-                "skills": ["OCaml", "Functional Programming", "Advanced Data Structures"]
-            },
-            "CS 3410": {
-                "title": "Computer System Organization and Programming",
-                "skills": ["Computer Architecture", "Assembly", "Systems Programming"]
-            },
-            "CS 4410": {
-                "title": "Operating Systems",
-                "skills": ["OS Design", "Concurrency", "File Systems", "C Programming"]
-            },
-            "CS 4420": {
-                "title": "Computer Networks",
-                "skills": ["Networking", "TCP/IP", "Distributed Systems"]
-            },
-            "CS 4670": {
-                "title": "Introduction to Computer Vision",
-                "skills": ["Computer Vision", "Image Processing", "Machine Learning"]
-            },
-            "CS 4740": {
-                "title": "Natural Language Processing",
-                "skills": ["NLP", "Machine Learning", "Text Processing", "Python"]
-            },
-            "CS 4780": {
-                "title": "Machine Learning",
-                "skills": ["ML Algorithms", "Neural Networks", "Statistics", "Python"]
-            },
-            "CS 4820": {
-                "title": "Introduction to Algorithms",
-                "skills": ["Algorithm Design", "Complexity Analysis", "Graph Algorithms"]
-            },
-            "CS 5220": {
-                "title": "Applications of Parallel Computers",
-                "skills": ["Parallel Computing", "HPC", "Performance Optimization"]
-            },
-            "CS 5300": {
-                "title": "The Architecture of Large-Scale Information Systems",
-                "skills": ["Distributed Systems", "Scalability", "System Design"]
-            },
-            "CS 5412": {
-                "title": "Cloud Computing",
-                "skills": ["Cloud Architecture", "AWS", "Distributed Systems"]
-            },
-            "CS 5430": {
-                "title": "System Security",
-                "skills": ["Security", "Cryptography", "Network Security"]
-            },
-            "CS 5780": {
-                "title": "Machine Learning Engineering",
-                "skills": ["ML Engineering", "MLOps", "Production ML Systems"]
-            },
-            "MATH 2210": {
-                "title": "Linear Algebra",
-                "skills": ["Linear Algebra", "Matrices", "Vector Spaces"]
-            },
-            "MATH 2930": {
-                "title": "Differential Equations",
-                "skills": ["Differential Equations", "Calculus", "Mathematical Modeling"]
-            },
-            "MATH 4710": {
-                "title": "Basic Probability",
-                "skills": ["Probability Theory", "Statistics", "Stochastic Processes"]
+    def rank_courses(self, job_description: str, top_k: int = 8) -> List[Dict[str, Any]]:
+        """
+        Score a job description against every catalog course.
+
+        Args:
+            job_description: Full text of the job description
+            top_k: Maximum courses returned
+
+        Returns:
+            matched_courses entries (code, title, relevance_score, reason), best first
+        """
+        from .course_index import get_course_index
+
+        index = get_course_index()
+        titles = dict(zip(index.course_ids, index.titles))
+        matches = index.search(job_description, top_k=top_k, min_score=MIN_SIMILARITY)
+        return [
+            {
+                "code": code,
+                "title": titles[code],
+                "relevance_score": round(min(1.0, score / SCORE_SATURATION), 2),
+                "reason": f"Covers {', '.join(terms)}" if terms else "Related coursework",
             }
-        }
+            for code, score, terms in matches
+        ]
+
+    def learning_paths(self, matched_courses: List[Dict[str, Any]], completed: List[str]) -> List[Dict[str, Any]]:
+        """
+        Prerequisite-ordered paths to the top matched courses.
 
-    async def match_job_to_courses(self, job_description: str) -> Dict[str, Any]:
+        The first path reaches all top matches together; the next ones reach
+        the best individual matches. Each path holds only the courses still
+        needed after `completed`, prerequisites first.
         """
-        Match a job description to relevant courses using AI.
+        graph = get_prerequisite_graph()
+        targets = [c for c in matched_courses[:PATH_TARGETS] if c["code"] in graph]
+        if not targets:
+            return []
+
+        candidates = [(
+            "Recommended Path",
+            [c["code"] for c in targets],
+            "All top matches with their missing prerequisites",
+        )]
+        for course in targets[:SINGLE_COURSE_PATHS]:
+            candidates.append((
+                f"Path to {course['code']}",
+                [course["code"]],
+                f"Shortest route to {course['title']}",
+            ))
+
+        paths = []
+        seen = set()
+        for name, path_targets, description in candidates:
+            courses = graph.learning_path(path_targets, completed)
+            if not courses or tuple(courses) in seen:
+                continue
+            seen.add(tuple(courses))
+            paths.append({"path_name": name, "courses": courses, "description": description})
+        return paths
+
+    async def match_job_to_courses(
+        self, job_description: str, explain: bool = True, completed_courses: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Match a job description to relevant courses.
+
+        Courses are ranked locally by TF-IDF similarity over the full catalog,
+        and skill gaps come from the skill index: taxonomy skills named in the
+        posting that none of the matched courses teach. Learning paths are
+        built from the prerequisite graph. The LLM only explains the ranked
+        list when `explain` is set.
 
         Args:
             job_description: Full text of the job description
+            explain: Ask the LLM for a reason per matched course
+            completed_courses: Courses the student has already taken
 
         Returns:
             Dictionary with matched courses, paths, and skill gaps
         """
+        matched_courses = self.rank_courses(job_description)
+        completed = normalize_course_codes(completed_courses or [])
+
+        skill_index = get_skill_index()
+        required = skill_index.extractor.extract(job_description)
+        coverage = skill_index.coverage(required, [c["code"] for c in matched_courses])
+
+        if coverage["coverage"] is not None:
+            overall_match_score = round(100 * coverage["coverage"])
+        else:
+            # No recognizable skills in the posting: fall back to text similarity
+            top_scores = [c["relevance_score"] for c in matched_courses[:3]]
+            overall_match_score = round(100 * sum(top_scores) / 3) if top_scores else 0
+
+        result = {
+            "matched_courses": matched_courses,
+            "recommended_paths": self.learning_paths(matched_courses, completed),
+            "skill_gaps": coverage["gaps"],
+            "covered_skills": coverage["covered"],
+            # Other catalog courses that teach a missing skill
+            "gap_courses": {
+                skill: skill_index.skill_courses[skill]
+                for skill in coverage["gaps"] if skill in skill_index.skill_courses
+            },
+            "overall_match_score": overall_match_score,
+        }
+
+        if explain and matched_courses:
+            explanation = await self._explain_matches(job_description, matched_courses)
+            if explanation:
+                self._merge_explanation(result, explanation)
+
+        return result
 
-        # Create course database string for prompt
-        courses_info = "\n".join([
-            f"{code}: {data['title']} - Skills: {', '.join(data['skills'])}"
-            for code, data in self.courses_db.items()
-        ])
+    async def _explain_matches(self, job_description: str, matched_courses: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """Ask the LLM to explain an already ranked course list (None on failure)"""
+        courses_info = "\n".join(f"{c['code']}: {c['title']}" for c in matched_courses)
 
         system_prompt = f"""You are a course recommendation expert for Cornell CS and Math students.
 
-Available courses:
+These courses were ranked as the best catalog matches for a job description:
 {courses_info}
 
-Given a job description, analyze the required skills and recommend relevant courses.
-
 Return a JSON response with this exact structure:
 {{
-  "matched_courses": [
-    {{
-      "code": "CS 4780",
-      "title": "Machine Learning",
-      "relevance_score": 0.95,
-      "reason": "Direct match for machine learning requirements"
-    }}
-  ],
-  "recommended_paths": [
-    {{
-      "path_name": "Machine Learning Engineer Path",
-      "courses": ["CS 2110", "CS 4780", "MATH 2210"],
-      "description": "Foundation for ML engineering roles"
-    }}
-  ],
-  "skill_gaps": ["Docker", "Kubernetes"],
-  "overall_match_score": 85
+  "reasons": {{"CS 3780": "Direct match for machine learning requirements"}}
 }}
 
-Rules:
-- relevance_score is 0.0 to 1.0
-- overall_match_score is 0 to 100
-- List only courses from the provided database
-- Recommend 3-8 most relevant courses
-- Identify 1-3 learning paths
-- List skills mentioned in job but not covered by courses
-"""
+Give a one-sentence reason for each listed course."""
+
+        params = dict(
+            model="gpt-4o-mini",
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": f"Job description:\n\n{job_description[:3000]}"}
+            ],
+            temperature=0.3,
+            max_tokens=500
+        )
+        cache_key = request_key(**params)
+        cached = await self.cache.aget(cache_key)
+        if cached is not None:
+            return cached
 
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": f"Analyze this job description and recommend courses:\n\n{job_description[:3000]}"}
-                ],
-                temperature=0.3,
-                max_tokens=2000
-            )
-
-            result_text = response.choices[0].message.content.strip()
+            result_text = await chat_completion(self.client, **params)
+
+            result_text = result_text.strip()
 
             # Clean up markdown code blocks if present
             if result_text.startswith("```"):
                 result_text = re.sub(r'^```(?:json)?\n', '', result_text)
                 result_text = re.sub(r'\n```$', '', result_text)
 
-            # Parse JSON
-            result = json.loads(result_text)
-
-            # Add course titles from database
-            for course in result.get("matched_courses", []):
-                if course["code"] in self.courses_db:
-                    course["title"] = self.courses_db[course["code"]]["title"]
-
-            return result
+            explanation = json.loads(result_text)
+            await self.cache.aset(cache_key, explanation)
+            return explanation
 
         except Exception as e:
-            # Return fallback structure on error
-            return {
-                "matched_courses": [
-                    {
-                        "code": "CS 2110",
-                        "title": "Object-Oriented Programming and Data Structures",
-                        "relevance_score": 0.7,
-                        "reason": "Fundamental programming course"
-                    }
-                ],
-                "recommended_paths": [
-                    {
-                        "path_name": "General Software Engineering",
-                        "courses": ["CS 2110", "CS 3110", "CS 4820"],
-                        "description": "Core CS foundation"
-                    }
-                ],
-                "skill_gaps": [],
-                "overall_match_score": 50
-            }
+            logger.warning(f"Job match explanation failed, returning local ranking only: {e}")
+            return None
+
+    @staticmethod
+    def _merge_explanation(result: Dict[str, Any], explanation: Dict[str, Any]):
+        """Overlay LLM reasons without letting it add or reorder courses"""
+        reasons = explanation.get("reasons") or {}
+        for course in result["matched_courses"]:
+            if isinstance(reasons.get(course["code"]), str):
+                course["reason"] = reasons[course["code"]]
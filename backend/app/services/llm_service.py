@@ -0,0 +1,130 @@
+"""
+LLM Service - Shared helpers for OpenAI chat completions
+
+Identical concurrent requests (same model, messages and sampling parameters)
+are coalesced: the first caller issues the API call and every duplicate that
+arrives while it is in flight awaits the same result.
+"""
+
+import asyncio
+import hashlib
+import json
+import threading
+from typing import Any, Awaitable, Callable, Dict, Optional
+import logging
+
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class LazyOpenAI:
+    """
+    Stand-in for openai.OpenAI that builds the real client on first use.
+
+    Importing the openai package costs over half a second, so services hold
+    this proxy instead and the import happens on the first API call (or in
+    the startup warm-up), not while the app is importing.
+    """
+
+    def __init__(self, api_key: str):
+        self._api_key = api_key
+        self._client = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        """The real openai.OpenAI client"""
+        if self._client is None:
+            with self._lock:
+                if self._client is None:
+                    from openai import OpenAI
+                    self._client = OpenAI(api_key=self._api_key)
+        return self._client
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.get(), name)
+
+
+_openai_client: Optional[LazyOpenAI] = None
+
+
+def get_openai_client() -> LazyOpenAI:
+    """Shared lazily-initialized OpenAI client"""
+    global _openai_client
+    if _openai_client is None:
+        _openai_client = LazyOpenAI(settings.OPENAI_API_KEY)
+    return _openai_client
+
+
+class SingleFlight:
+    """Coalesce concurrent calls that share a key into one in-flight task"""
+
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self.calls = 0
+        self.coalesced = 0
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run `fn` once per key among concurrent callers.
+
+        The work runs in its own task and callers await it through
+        asyncio.shield, so a cancelled (disconnected) caller never cancels
+        the call for the others.
+
+        Args:
+            key: Canonical request key
+            fn: Zero-argument coroutine function producing the result
+
+        Returns:
+            The shared result (exceptions are shared too)
+        """
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+            return await asyncio.shield(task)
+
+        self.calls += 1
+        task = asyncio.ensure_future(fn())
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "in_flight": len(self._inflight),
+        }
+
+
+_single_flight = SingleFlight()
+
+
+def request_key(**params: Any) -> str:
+    """Canonical SHA-256 key for a chat completion request"""
+    canonical = json.dumps(params, sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+async def chat_completion(client, **params: Any) -> str:
+    """
+    Run an OpenAI chat completion off the event loop, coalescing duplicates.
+
+    Args:
+        client: openai.OpenAI client (or LazyOpenAI)
+        **params: Keyword arguments for client.chat.completions.create
+
+    Returns:
+        The message content of the first choice
+    """
+    async def _call() -> str:
+        response = await asyncio.to_thread(client.chat.completions.create, **params)
+        return response.choices[0].message.content
+
+    return await _single_flight.do(request_key(**params), _call)
+
+
+def get_stats() -> Dict[str, int]:
+    """Single-flight counters (total upstream calls, coalesced duplicates)"""
+    return _single_flight.stats()
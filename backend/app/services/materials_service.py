@@ -1,41 +1,94 @@
+import asyncio
 import json
 import re
-from typing import Dict, Any, List, Optional
-import openai
+import time
+import logging
+from pathlib import Path
+from typing import Dict, Any, Iterable, List, Optional, Set
 from ..config.settings import settings
+from .llm_service import chat_completion, get_openai_client
+from .result_cache import ResultCache
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).parent.parent.parent / "data"
+MATERIALS_FILE = DATA_DIR / "study_materials.json"
+
+# Bump when the materials prompt changes so cached materials are regenerated
+PROMPT_VERSION = "v1"
+
+
+def load_materials_artifact(path: Path = MATERIALS_FILE) -> Dict[str, Dict[str, Any]]:
+    """
+    Load pre-generated materials keyed by formatted course code ("CS 2110").
+
+    Entries from an older prompt version are still served; the generation
+    script replaces them on its next run.
+    """
+    if not path.exists():
+        logger.info("No pre-generated study materials found - materials are generated on demand")
+        return {}
+    try:
+        with open(path, 'r') as f:
+            courses = json.load(f).get("courses", {})
+        logger.info(f"Loaded pre-generated study materials for {len(courses)} courses")
+        return courses
+    except Exception as e:
+        logger.warning(f"Failed to load pre-generated study materials: {e}")
+        return {}
 
 class MaterialsService:
     """Service for generating and curating study materials for courses."""
 
     def __init__(self):
-        self.client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.client = get_openai_client()
+
+        # Generated materials keyed by prompt version and course code, stored
+        # with their generation time for stale-while-revalidate
+        self.soft_ttl = settings.MATERIALS_SOFT_TTL_HOURS * 3600
+        self.hard_ttl = settings.MATERIALS_HARD_TTL_HOURS * 3600
+        self.cache = ResultCache(
+            namespace="materials",
+            max_entries=settings.MATERIALS_CACHE_SIZE,
+            ttl_seconds=self.hard_ttl,
+        )
+        self._refreshing: Dict[str, asyncio.Task] = {}
+
+        # Low-priority prefetch queue, drained by a few background workers
+        self._prefetch_queue: Optional[asyncio.Queue] = None
+        self._prefetch_workers: List[asyncio.Task] = []
+        self._prefetch_queued: Set[str] = set()
+
+        # Every catalog course keyed by normalized code ("CS2110"), and
+        # pre-generated materials from scripts/generate_study_materials.py;
+        # both are loaded on first use
+        self.courses_db: Dict[str, str] = {}
+        self.pregenerated: Dict[str, Dict[str, Any]] = {}
+        self._loaded = False
 
-        # Course database with titles
+    def ensure_loaded(self):
+        """Load the catalog and pre-generated materials once"""
+        if self._loaded:
+            return
+        from .course_table import get_course_table
+
+        table = get_course_table()
         self.courses_db = {
-            "CS1110": "Introduction to Computing Using Python",
-            "CS2110": "Object-Oriented Programming and Data Structures",
-            "CS2800": "Discrete Structures",
-            "CS3110": "Data Structures and Functional Programming",
-            "CS3410": "Computer System Organization and Programming",
-            "CS4410": "Operating Systems",
-            "CS4420": "Computer Networks",
-            "CS4670": "Introduction to Computer Vision",
-            "CS4740": "Natural Language Processing",
-            "CS4780": "Machine Learning",
-            "CS4820": "Introduction to Algorithms",
-            "CS5220": "Applications of Parallel Computers",
-            "CS5300": "The Architecture of Large-Scale Information Systems",
-            "CS5412": "Cloud Computing",
-            "CS5430": "System Security",
-            "CS5780": "Machine Learning Engineering",
-            "MATH2210": "Linear Algebra",
-            "MATH2930": "Differential Equations",
-            "MATH4710": "Basic Probability",
+            course_id.replace(" ", ""): title for course_id, title in zip(table.ids, table.titles)
         }
+        self.pregenerated = load_materials_artifact()
+        self._loaded = True
 
     async def get_materials(self, course_code: str) -> Dict[str, Any]:
         """
-        Get curated study materials for a course using AI.
+        Look up curated study materials for a course.
+
+        Pre-generated materials are served from memory. Other courses use the
+        on-demand cache: fresh entries are returned as-is; entries past the
+        soft TTL are served while a background task regenerates them. For
+        missing entries and entries past the hard TTL the request waits up to
+        MATERIALS_FIRST_WAIT_SECONDS for that generation, and gets fallback
+        materials only if it is slower or fails.
 
         Args:
             course_code: Normalized course code (e.g., "CS2110")
@@ -43,6 +96,8 @@ class MaterialsService:
         Returns:
             Dictionary with course info and study materials
         """
+        self.ensure_loaded()
+
         # Check if course exists
         if course_code not in self.courses_db:
             return None
@@ -50,15 +105,67 @@ class MaterialsService:
         course_title = self.courses_db[course_code]
         formatted_code = self._format_course_code(course_code)
 
-        # Generate materials using OpenAI
-        materials = await self._generate_materials(formatted_code, course_title)
+        pregenerated = self.pregenerated.get(formatted_code)
+        if pregenerated and pregenerated.get("materials"):
+            materials, source = pregenerated["materials"], "pregenerated"
+        else:
+            entry = await self.cache.aget(self._cache_key(formatted_code))
+            age = time.time() - entry["generated_at"] if entry else None
+
+            refresh = None
+            if entry is None or age >= self.soft_ttl:
+                refresh = self._schedule_refresh(formatted_code, course_title)
+            if entry is not None and age < self.hard_ttl:
+                materials, source = entry["materials"], "cache"
+            else:
+                entry = await self._wait_for_refresh(refresh, formatted_code)
+                if entry is not None:
+                    materials, source = entry["materials"], "generated"
+                else:
+                    materials, source = self._get_fallback_materials(formatted_code, course_title), "fallback"
 
         return {
             "course_code": formatted_code,
             "course_title": course_title,
-            "materials": materials
+            "materials": materials,
+            "source": source
         }
 
+    async def _wait_for_refresh(self, refresh: asyncio.Task, formatted_code: str) -> Optional[Dict[str, Any]]:
+        """Cache entry once `refresh` finishes, or None if it takes too long or fails"""
+        try:
+            # Shielded: a slow generation keeps running for later requests
+            await asyncio.wait_for(asyncio.shield(refresh), timeout=settings.MATERIALS_FIRST_WAIT_SECONDS)
+        except asyncio.TimeoutError:
+            return None
+        return await self.cache.aget(self._cache_key(formatted_code))
+
+    def _cache_key(self, formatted_code: str) -> str:
+        return f"{PROMPT_VERSION}:{formatted_code}"
+
+    async def _refresh(self, course_code: str, course_title: str):
+        """Generate and cache materials (failures leave the cache untouched)"""
+        materials = await self.generate_materials(course_code, course_title)
+        if materials is not None:
+            await self.cache.aset(self._cache_key(course_code), {"materials": materials, "generated_at": time.time()})
+
+    def _schedule_refresh(self, course_code: str, course_title: str) -> asyncio.Task:
+        """Regenerate stale materials in the background, once per course"""
+        task = self._refreshing.get(course_code)
+        if task is not None:
+            return task
+
+        async def refresh():
+            try:
+                await self._refresh(course_code, course_title)
+            except Exception as e:
+                logger.warning(f"Background materials refresh failed for {course_code}: {e}")
+            finally:
+                self._refreshing.pop(course_code, None)
+
+        task = self._refreshing[course_code] = asyncio.create_task(refresh())
+        return task
+
     def _format_course_code(self, code: str) -> str:
         """Format course code as 'CS 2110' from 'CS2110'."""
         match = re.match(r'([A-Z]+)(\d+)', code)
@@ -66,8 +173,75 @@ class MaterialsService:
             return f"{match.group(1)} {match.group(2)}"
         return code
 
-    async def _generate_materials(self, course_code: str, course_title: str) -> List[Dict[str, Any]]:
-        """Use OpenAI to generate relevant study materials."""
+    async def needs_generation(self, course_code: str) -> bool:
+        """True if a catalog course has no pre-generated or fresh cached materials"""
+        self.ensure_loaded()
+        formatted_code = self._format_course_code(course_code)
+        if self.pregenerated.get(formatted_code, {}).get("materials"):
+            return False
+        entry = await self.cache.aget(self._cache_key(formatted_code))
+        return entry is None or time.time() - entry["generated_at"] >= self.soft_ttl
+
+    async def prefetch(self, course_codes: Iterable[str]) -> int:
+        """
+        Queue background generation for courses likely to be requested soon.
+
+        Courses that are pre-generated, fresh in the cache, already queued or
+        being generated are skipped. Prefetches run on a small worker pool so
+        they never crowd out on-demand generation.
+
+        Args:
+            course_codes: Course codes in any format ("CS 2110" or "CS2110")
+
+        Returns:
+            Number of courses queued
+        """
+        self.ensure_loaded()
+        if self._prefetch_queue is None:
+            self._prefetch_queue = asyncio.Queue(maxsize=settings.MATERIALS_PREFETCH_MAX_QUEUE)
+        if not self._prefetch_workers:
+            self._prefetch_workers = [
+                asyncio.create_task(self._prefetch_worker())
+                for _ in range(settings.MATERIALS_PREFETCH_WORKERS)
+            ]
+
+        queued = 0
+        for code in course_codes:
+            course_code = code.upper().replace(" ", "")
+            formatted_code = self._format_course_code(course_code)
+            if (
+                course_code not in self.courses_db
+                or formatted_code in self._prefetch_queued
+                or formatted_code in self._refreshing
+                or not await self.needs_generation(course_code)
+            ):
+                continue
+            try:
+                self._prefetch_queue.put_nowait((formatted_code, self.courses_db[course_code]))
+            except asyncio.QueueFull:
+                logger.info("Materials prefetch queue is full, dropping remaining courses")
+                break
+            self._prefetch_queued.add(formatted_code)
+            queued += 1
+        return queued
+
+    async def _prefetch_worker(self):
+        while True:
+            course_code, course_title = await self._prefetch_queue.get()
+            try:
+                # An on-demand request may have generated it in the meantime.
+                # Registering it in _refreshing keeps a request arriving
+                # mid-generation from starting a second one
+                if course_code not in self._refreshing and await self.needs_generation(course_code):
+                    await self._schedule_refresh(course_code, course_title)
+            except Exception as e:
+                logger.warning(f"Materials prefetch failed for {course_code}: {e}")
+            finally:
+                self._prefetch_queued.discard(course_code)
+                self._prefetch_queue.task_done()
+
+    async def generate_materials(self, course_code: str, course_title: str) -> Optional[List[Dict[str, Any]]]:
+        """Use OpenAI to generate relevant study materials (None on failure)."""
 
         system_prompt = """You are an educational resource curator for Cornell CS and Math courses.
 
@@ -100,7 +274,8 @@ Rules:
 """
 
         try:
-            response = self.client.chat.completions.create(
+            result_text = await chat_completion(
+                self.client,
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -110,7 +285,7 @@ Rules:
                 max_tokens=2000
             )
 
-            result_text = response.choices[0].message.content.strip()
+            result_text = result_text.strip()
 
             # Clean up markdown code blocks
             if result_text.startswith("```"):
@@ -119,12 +294,14 @@ Rules:
 
             # Parse JSON
             materials = json.loads(result_text)
+            if not isinstance(materials, list):
+                raise ValueError("Expected a JSON array of materials")
 
             return materials
 
         except Exception as e:
-            # Return fallback materials on error
-            return self._get_fallback_materials(course_code, course_title)
+            logger.warning(f"Study materials generation failed for {course_code}: {e}")
+            return None
 
     def _get_fallback_materials(self, course_code: str, course_title: str) -> List[Dict[str, Any]]:
         """Provide fallback study materials when AI generation fails."""
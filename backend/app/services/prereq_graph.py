@@ -0,0 +1,143 @@
+"""
+Prerequisite Graph - Ancestor bitsets over the course prerequisite DAG
+
+Courses are numbered in topological order and every course stores the
+bitmask of all its transitive prerequisites. The courses a student still
+needs for a set of targets is then an OR over the targets' masks minus the
+completed mask, and reading the set bits low to high yields a valid order.
+"""
+
+import heapq
+import re
+from typing import Dict, Iterable, List, Optional
+import logging
+
+from app.services.catalog import get_catalog
+
+logger = logging.getLogger(__name__)
+
+COURSE_CODE_PATTERN = re.compile(r'\b(CS|MATH)\s*(\d{4})\b', re.IGNORECASE)
+
+
+def normalize_course_codes(codes: Iterable[str]) -> List[str]:
+    """Canonical "CS 2110" form for user-entered codes ("cs2110", "CS  2110")"""
+    normalized = []
+    for code in codes:
+        match = COURSE_CODE_PATTERN.search(code or "")
+        if match:
+            normalized.append(f"{match.group(1).upper()} {match.group(2)}")
+    return list(dict.fromkeys(normalized))
+
+
+def _catalog_number(course_id: str) -> int:
+    digits = course_id.split()[-1]
+    return int(digits) if digits.isdigit() else 0
+
+
+class PrerequisiteGraph:
+    """
+    Prerequisite DAG with precomputed ancestor sets.
+
+    Args:
+        prereqs: Course ID -> list of prerequisite course IDs (all required)
+    """
+
+    def __init__(self, prereqs: Dict[str, List[str]]):
+        courses = set(prereqs) | {p for plist in prereqs.values() for p in plist}
+        self.prereqs = {c: [p for p in prereqs.get(c, []) if p != c] for c in courses}
+
+        self.order: List[str] = self._topological_order()
+        self._bit: Dict[str, int] = {course: 1 << i for i, course in enumerate(self.order)}
+
+        # Prerequisites come earlier in the order, so one forward pass suffices
+        self._ancestors: Dict[str, int] = {}
+        for course in self.order:
+            mask = 0
+            for prereq in self.prereqs[course]:
+                mask |= self._bit[prereq] | self._ancestors.get(prereq, 0)
+            self._ancestors[course] = mask
+
+        logger.info(f"Built prerequisite graph with {len(self.order)} courses")
+
+    def _topological_order(self) -> List[str]:
+        """Kahn's algorithm, lower catalog numbers first among ready courses"""
+        remaining = {c: len(set(plist)) for c, plist in self.prereqs.items()}
+        dependents: Dict[str, List[str]] = {}
+        for course, plist in self.prereqs.items():
+            for prereq in set(plist):
+                dependents.setdefault(prereq, []).append(course)
+
+        key = lambda c: (_catalog_number(c), c)
+        ready = [(key(c), c) for c, n in remaining.items() if n == 0]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            _, course = heapq.heappop(ready)
+            order.append(course)
+            for dependent in dependents.get(course, []):
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    heapq.heappush(ready, (key(dependent), dependent))
+
+        if len(order) < len(self.prereqs):
+            # Cyclic prerequisites (bad catalog data): drop the cyclic edges
+            placed = set(order)
+            stuck = sorted((c for c in self.prereqs if c not in placed), key=key)
+            logger.warning(f"Prerequisite cycle among {len(stuck)} courses: {stuck[:5]}")
+            for course in stuck:
+                self.prereqs[course] = [p for p in self.prereqs[course] if p in placed]
+                placed.add(course)
+            order.extend(stuck)
+        return order
+
+    def __contains__(self, course_id: str) -> bool:
+        return course_id in self._bit
+
+    def mask(self, course_ids: Iterable[str]) -> int:
+        """Bitmask of the given courses (unknown IDs are ignored)"""
+        bits = 0
+        for course_id in course_ids:
+            bits |= self._bit.get(course_id, 0)
+        return bits
+
+    def closure_mask(self, course_ids: Iterable[str]) -> int:
+        """The given courses plus all of their transitive prerequisites"""
+        bits = 0
+        for course_id in course_ids:
+            bits |= self._bit.get(course_id, 0) | self._ancestors.get(course_id, 0)
+        return bits
+
+    def courses(self, mask: int) -> List[str]:
+        """Course IDs in a bitmask, in topological order"""
+        courses = []
+        while mask:
+            low = mask & -mask
+            courses.append(self.order[low.bit_length() - 1])
+            mask ^= low
+        return courses
+
+    def learning_path(self, targets: Iterable[str], completed: Iterable[str] = ()) -> List[str]:
+        """
+        Minimal prerequisite-closed set of courses still needed for `targets`.
+
+        Completed courses count as satisfying their own prerequisites too.
+
+        Args:
+            targets: Courses the student wants to take
+            completed: Courses already taken
+
+        Returns:
+            Course IDs to take, prerequisites first
+        """
+        return self.courses(self.closure_mask(targets) & ~self.closure_mask(completed))
+
+
+_graph: Optional[PrerequisiteGraph] = None
+
+
+def get_prerequisite_graph() -> PrerequisiteGraph:
+    """Shared PrerequisiteGraph, built from the catalog's prerequisites on first use"""
+    global _graph
+    if _graph is None:
+        _graph = PrerequisiteGraph(get_catalog().prerequisite_map())
+    return _graph
@@ -0,0 +1,241 @@
+"""
+Result Cache - Bounded in-memory LRU in front of a shared cache backend
+
+Values must be JSON-serializable. Reads return a fresh copy so callers can
+mutate results without corrupting the cache. Each process keeps its own
+LRU; misses fall through to the backend shared by all workers (see
+cache_backends.py), and hits there are copied into the local tier.
+
+Async code should use aget/aset, which make backend calls from a worker
+thread so a slow or unreachable backend never stalls the event loop.
+"""
+
+import asyncio
+import copy
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+import logging
+
+from app.config.settings import settings
+from app.services.cache_backends import CacheBackend, get_shared_backend
+
+logger = logging.getLogger(__name__)
+
+# Every cache by namespace, for snapshotting (see cache_snapshot.py)
+_registry: Dict[str, "ResultCache"] = {}
+
+
+def registered_caches() -> Dict[str, "ResultCache"]:
+    """All ResultCache instances created in this process, by namespace"""
+    return dict(_registry)
+
+
+class ResultCache:
+    """
+    Two-tier cache: an in-memory LRU in front of an optional shared backend.
+
+    Args:
+        namespace: Key prefix separating services that share a backend
+        max_entries: In-memory LRU capacity
+        ttl_seconds: Entry lifetime in both tiers (None uses CACHE_TTL_HOURS, 0 never expires)
+        max_shared: Entries kept in the shared tier for this namespace
+            (None uses CACHE_SHARED_MAX_ENTRIES)
+        backend: Shared tier (None uses the one configured by CACHE_BACKEND)
+        shared: False keeps this cache process-local
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        max_entries: int = 256,
+        ttl_seconds: Optional[float] = None,
+        max_shared: Optional[int] = None,
+        backend: Optional[CacheBackend] = None,
+        shared: bool = True,
+    ):
+        self.namespace = namespace
+        self.max_entries = max_entries
+        self.ttl = settings.CACHE_TTL_HOURS * 3600 if ttl_seconds is None else ttl_seconds
+        self.max_shared = max_shared or settings.CACHE_SHARED_MAX_ENTRIES
+        self._backend = backend
+        self._shared = shared
+        # key -> (value, expires_at or None)
+        self._entries: "OrderedDict[str, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.shared_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        _registry[namespace] = self
+
+    @property
+    def backend(self) -> Optional[CacheBackend]:
+        # Resolved on first use so importing a module that defines a cache stays cheap
+        if self._backend is None and self._shared:
+            self._backend = get_shared_backend()
+            self._shared = self._backend is not None
+        return self._backend
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a copy of the cached value, or None on a miss"""
+        found, value = self._get_local(key)
+        if found:
+            return value
+        return self._got_shared(key, self._load(key) if self._use_backend() else None)
+
+    async def aget(self, key: str) -> Optional[Any]:
+        """get() for async code: the shared tier is read from a worker thread"""
+        found, value = self._get_local(key)
+        if found:
+            return value
+        loaded = await asyncio.to_thread(self._load, key) if self._use_backend() else None
+        return self._got_shared(key, loaded)
+
+    def set(self, key: str, value: Any):
+        """Store a value locally and in the shared tier"""
+        value = self._set_local(key, value)
+        if self._use_backend():
+            self._save(key, value)
+
+    async def aset(self, key: str, value: Any):
+        """set() for async code: the shared tier is written from a worker thread"""
+        value = self._set_local(key, value)
+        if self._use_backend():
+            await asyncio.to_thread(self._save, key, value)
+
+    def clear(self):
+        """Drop every entry in both tiers"""
+        with self._lock:
+            self._entries.clear()
+        if self.backend:
+            self.backend.clear(self.namespace)
+
+    def export_entries(self, limit: int) -> List[Tuple[str, Any, Optional[float]]]:
+        """
+        Up to `limit` hottest unexpired in-memory entries, least recently used first.
+
+        Returns:
+            (key, value, expires_at) tuples; expires_at is None for entries that never expire
+        """
+        now = time.time()
+        with self._lock:
+            items = [
+                (key, value, expires_at) for key, (value, expires_at) in self._entries.items()
+                if expires_at is None or expires_at > now
+            ]
+        return items[-limit:] if limit > 0 else []
+
+    def import_entries(self, entries: List[Tuple[str, Any, Optional[float]]]) -> int:
+        """
+        Load entries into memory (not written through to the shared tier).
+
+        Entries should be ordered least recently used first, as returned by
+        export_entries. They keep their original expiry, so a restart never
+        extends an entry's life; expired entries and keys already in memory
+        are skipped.
+        """
+        loaded = 0
+        now = time.time()
+        with self._lock:
+            # Insert at the cold end, newest first, so restored entries keep
+            # their relative order and stay colder than live ones
+            for key, value, expires_at in reversed(entries):
+                if expires_at is not None and expires_at <= now:
+                    continue
+                if key not in self._entries:
+                    self._entries[key] = (value, expires_at)
+                    self._entries.move_to_end(key, last=False)
+                    loaded += 1
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return loaded
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache metrics.
+
+        Returns:
+            - entries: Values in this process's LRU
+            - hits / misses: Lookups answered by either tier, or by neither
+            - shared_hits: Hits served by the shared tier
+            - evictions: Local LRU evictions
+            - backend: Shared tier name, or None
+            - backend_available: False while the shared tier is being skipped after a failure
+        """
+        return {
+            "namespace": self.namespace,
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "shared_hits": self.shared_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "backend": self.backend.name if self.backend else None,
+            "backend_available": self.backend.available if self.backend else False,
+            "ttl_seconds": self.ttl or None,
+        }
+
+    def _use_backend(self) -> bool:
+        backend = self.backend
+        return backend is not None and backend.available
+
+    def _get_local(self, key: str) -> Tuple[bool, Optional[Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires_at = entry
+                if expires_at is None or expires_at > time.time():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, copy.deepcopy(value)
+                del self._entries[key]
+        return False, None
+
+    def _got_shared(self, key: str, value: Optional[Any]) -> Optional[Any]:
+        with self._lock:
+            if value is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self.shared_hits += 1
+            self._remember(key, value)
+            return copy.deepcopy(value)
+
+    def _set_local(self, key: str, value: Any) -> Any:
+        value = copy.deepcopy(value)
+        with self._lock:
+            self._remember(key, value)
+        return value
+
+    def _remember(self, key: str, value: Any):
+        self._entries[key] = (value, time.time() + self.ttl if self.ttl else None)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def _load(self, key: str) -> Optional[Any]:
+        encoded = self.backend.get(self.namespace, key)
+        if encoded is None:
+            return None
+        try:
+            return json.loads(encoded)
+        except ValueError as e:
+            logger.warning(f"Corrupt cache entry ({self.namespace}): {e}")
+            return None
+
+    def _save(self, key: str, value: Any):
+        try:
+            encoded = json.dumps(value)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Cache value not serializable ({self.namespace}): {e}")
+            return
+        self.backend.set(self.namespace, key, encoded, self.ttl or None, self.max_shared)
+
+
+def cache_stats() -> List[Dict[str, Any]]:
+    """stats() of every registered cache"""
+    return [cache.stats() for cache in registered_caches().values()]
@@ -1,112 +1,137 @@
 import re
-import os
-from typing import Dict, Any, List
-import PyPDF2
-import docx
-import openai
+import hashlib
+import logging
+from typing import Dict, Any, List, Optional, Tuple
 from ..config.settings import settings
+from .llm_service import chat_completion, get_openai_client
+from .text_extraction import extraction_pool
+from .result_cache import ResultCache
+from .skill_extractor import get_skill_extractor
+
+logger = logging.getLogger(__name__)
+
+# Bump when the parsed result or analysis prompt changes to invalidate caches
+CACHE_VERSION = "v2"
 
 class ResumeParser:
     """Service for parsing and analyzing resume files using OpenAI."""
 
     def __init__(self):
-        self.client = openai.OpenAI(api_key=settings.OPENAI_API_KEY)
-
-        # Common technical skills to look for
-        self.tech_skills = [
-            "Python", "Java", "C++", "C", "JavaScript", "TypeScript", "React", "Node.js",
-            "Machine Learning", "Deep Learning", "NLP", "Computer Vision", "SQL", "NoSQL",
-            "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Git", "Linux", "Algorithms",
-            "Data Structures", "Web Development", "Mobile Development", "Android", "iOS",
-            "TensorFlow", "PyTorch", "scikit-learn", "Pandas", "NumPy", "R", "Matlab",
-            "Network Security", "Cryptography", "Distributed Systems", "Cloud Computing"
-        ]
+        self.client = get_openai_client()
+
+        # Local skill matcher over data/skill_taxonomy.json (always-on fast path)
+        self.skill_extractor = get_skill_extractor()
 
         # Cornell CS/Math course patterns
-        self.course_pattern = re.compile(r'\b(CS|MATH)\s*\d{4}\b', re.IGNORECASE)
+        self.course_pattern = re.compile(r'\b(CS|MATH)\s*(\d{4})\b', re.IGNORECASE)
 
-    async def parse_resume(self, file_path: str, content_type: str) -> Dict[str, Any]:
+        # Parsed results keyed by content type and SHA-256 of the upload ("file:") and
+        # LLM analyses keyed by SHA-256 of the extracted text ("text:")
+        self.cache = ResultCache(
+            namespace="resume",
+            max_entries=settings.RESUME_CACHE_SIZE,
+        )
+
+    async def parse_resume(self, data: bytes, content_type: str, bulk: bool = False) -> Dict[str, Any]:
         """
         Parse a resume file and extract relevant information.
 
         Args:
-            file_path: Path to the uploaded file
+            data: Raw file contents
             content_type: MIME type of the file
+            bulk: Part of a bulk upload (extraction yields to interactive uploads)
 
         Returns:
             Dictionary containing parsed resume data
         """
-        # Extract text based on file type
-        if content_type == "application/pdf":
-            text = self._extract_pdf_text(file_path)
-        elif content_type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-            text = self._extract_docx_text(file_path)
-        else:  # text/plain
-            text = self._extract_txt_text(file_path)
-
-        # Use OpenAI to analyze resume
+        # Identical uploads return the cached result without any work
+        file_key = self.file_cache_key(data, content_type)
+        cached = await self.cache.aget(file_key)
+        if cached is not None:
+            return cached
+
+        extracted = await self.extract_local(data, content_type, bulk=bulk)
+        analysis, analyzed = await self.analyze(extracted["text"])
+        result = self.build_result(extracted, analysis)
+
+        # Fallback results are not cached so a later upload can retry the LLM
+        if analyzed:
+            await self.cache.aset(file_key, result)
+
+        return result
+
+    def file_cache_key(self, data: bytes, content_type: str) -> str:
+        """
+        Cache key for a full parsed result (SHA-256 of the upload).
+
+        The content type picks the parser, so the same bytes uploaded as
+        another type get their own entry.
+        """
+        return f"file:{CACHE_VERSION}:{content_type}:{hashlib.sha256(data).hexdigest()}"
+
+    async def extract_local(self, data: bytes, content_type: str, bulk: bool = False) -> Dict[str, Any]:
+        """
+        Fast, LLM-free stage: text extraction plus skill and course matching.
+
+        Returns:
+            Dictionary with text, skills and courses
+        """
+        # Extract text in the process pool (CPU-bound, must not block the loop)
+        text = await extraction_pool.extract(data, content_type, bulk=bulk)
+
+        # Skills and courses come from the local matchers, never the LLM
+        return {
+            "text": text,
+            "skills": self.skill_extractor.extract(text),
+            "courses": self._extract_courses(text),
+        }
+
+    async def analyze(self, text: str) -> Tuple[Dict[str, Any], bool]:
+        """
+        LLM stage: summary, career goal, interests and level.
+
+        Returns:
+            (analysis, analyzed) where analyzed is False for the fallback
+        """
+        # Reuse analyses of identical text
+        text_key = f"text:{CACHE_VERSION}:{hashlib.sha256(text.encode('utf-8')).hexdigest()}"
+        analysis = await self.cache.aget(text_key)
+        if analysis is not None:
+            return analysis, True
+
         analysis = await self._analyze_with_openai(text)
+        if analysis is None:
+            return self._fallback_analysis(), False
 
-        # Extract course codes from text
-        courses = self._extract_courses(text)
+        await self.cache.aset(text_key, analysis)
+        return analysis, True
 
+    def build_result(self, extracted: Dict[str, Any], analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """Combine the local and LLM stages into the API response shape."""
         return {
-            "skills": analysis.get("skills", []),
-            "courses": courses,
+            "skills": extracted["skills"],
+            "courses": extracted["courses"],
             "experience_years": analysis.get("experience_years", 0),
             "summary": analysis.get("summary", ""),
             "career_goal": analysis.get("career_goal", ""),
             "interests": analysis.get("interests", []),
             "current_level": analysis.get("current_level", "sophomore"),
-            "raw_text": text[:500]  # First 500 chars for preview
+            "raw_text": extracted["text"][:500]  # First 500 chars for preview
         }
 
-    def _extract_pdf_text(self, file_path: str) -> str:
-        """Extract text from PDF file."""
-        text = ""
-        try:
-            with open(file_path, 'rb') as file:
-                pdf_reader = PyPDF2.PdfReader(file)
-                for page in pdf_reader.pages:
-                    text += page.extract_text() + "\n"
-        except Exception as e:
-            raise Exception(f"Failed to extract PDF text: {str(e)}")
-        return text
-
-    def _extract_docx_text(self, file_path: str) -> str:
-        """Extract text from DOCX file."""
-        try:
-            doc = docx.Document(file_path)
-            text = "\n".join([paragraph.text for paragraph in doc.paragraphs])
-        except Exception as e:
-            raise Exception(f"Failed to extract DOCX text: {str(e)}")
-        return text
-
-    def _extract_txt_text(self, file_path: str) -> str:
-        """Extract text from TXT file."""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as file:
-                text = file.read()
-        except Exception as e:
-            raise Exception(f"Failed to read text file: {str(e)}")
-        return text
-
     def _extract_courses(self, text: str) -> List[str]:
         """Extract Cornell CS/MATH course codes from text."""
         courses = self.course_pattern.findall(text)
-        # Format as "CS 2110" style
-        formatted_courses = [f"{match[0].upper()} {match[1]}" if isinstance(match, tuple) else match.upper()
-                           for match in courses]
-        return list(set(formatted_courses))  # Remove duplicates
+        # Format as "CS 2110" style, de-duplicated in order of appearance
+        return list(dict.fromkeys(f"{subject.upper()} {number}" for subject, number in courses))
 
-    async def _analyze_with_openai(self, text: str) -> Dict[str, Any]:
-        """Use OpenAI to analyze resume and extract structured information."""
+    async def _analyze_with_openai(self, text: str) -> Optional[Dict[str, Any]]:
+        """Use OpenAI to analyze resume and extract structured information (None on failure)."""
 
         system_prompt = """You are a resume analysis expert specializing in Computer Science and technical resumes.
 Analyze the provided resume and extract the following information in JSON format:
 
 {
-  "skills": ["skill1", "skill2", ...],  // List of technical skills found
   "experience_years": 0,  // Estimated years of relevant experience (integer)
   "summary": "brief summary",  // 1-2 sentence summary of candidate's background
   "career_goal": "inferred career goal",  // Inferred career objective/goal from resume (e.g., "Machine Learning Engineer", "Software Developer", "Data Scientist")
@@ -115,7 +140,6 @@ Analyze the provided resume and extract the following information in JSON format
 }
 
 Focus on:
-- Technical skills (programming languages, frameworks, tools, technologies)
 - Years of experience (estimate based on work history and education)
 - Academic background and relevant coursework
 - Projects and achievements
@@ -126,7 +150,8 @@ Focus on:
 Return ONLY valid JSON."""
 
         try:
-            response = self.client.chat.completions.create(
+            result_text = await chat_completion(
+                self.client,
                 model="gpt-4o-mini",
                 messages=[
                     {"role": "system", "content": system_prompt},
@@ -136,7 +161,7 @@ Return ONLY valid JSON."""
                 max_tokens=600  # Reduced from 1000 to 600 for faster generation
             )
 
-            result_text = response.choices[0].message.content.strip()
+            result_text = result_text.strip()
 
             # Remove markdown code blocks if present
             if result_text.startswith("```"):
@@ -150,23 +175,15 @@ Return ONLY valid JSON."""
             return analysis
 
         except Exception as e:
-            # Return default structure on error
-            return {
-                "skills": self._extract_skills_basic(text),
-                "experience_years": 0,
-                "summary": "Unable to generate summary",
-                "career_goal": "",
-                "interests": [],
-                "current_level": "sophomore"
-            }
-
-    def _extract_skills_basic(self, text: str) -> List[str]:
-        """Basic skill extraction without AI (fallback)."""
-        found_skills = []
-        text_lower = text.lower()
-
-        for skill in self.tech_skills:
-            if skill.lower() in text_lower:
-                found_skills.append(skill)
-
-        return found_skills
+            logger.warning(f"Resume analysis failed: {e}")
+            return None
+
+    def _fallback_analysis(self) -> Dict[str, Any]:
+        """Default structure used when the LLM analysis fails."""
+        return {
+            "experience_years": 0,
+            "summary": "Unable to generate summary",
+            "career_goal": "",
+            "interests": [],
+            "current_level": "sophomore"
+        }
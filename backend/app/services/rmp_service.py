@@ -1,65 +1,20 @@
 """
 Rate My Professor Data Service
-Loads pre-scraped RMP data and provides course-level lookups
+Course-level lookups of pre-scraped RMP data, Reddit sentiment and
+prerequisites, read from the shared memory-mapped catalog
 """
 
-import json
-from pathlib import Path
 from typing import Dict, List, Optional
 import logging
 
+from app.services.catalog import get_catalog
+
 logger = logging.getLogger(__name__)
 
-# Path to pre-scraped RMP data
-DATA_DIR = Path(__file__).parent.parent.parent / "data"
-RMP_FILE = DATA_DIR / "rmp_data.json"
-GRAPH_FILE = DATA_DIR / "graph_data.json"
-
-# Cached data (loaded once at import time)
-_rmp_data: Dict = {}
-_graph_nodes: Dict = {}
-
-
-def _load_rmp_data():
-    """Load RMP data from JSON file"""
-    global _rmp_data
-    if RMP_FILE.exists():
-        try:
-            with open(RMP_FILE, 'r') as f:
-                _rmp_data = json.load(f)
-            logger.info(f"Loaded RMP data for {len(_rmp_data)} courses")
-        except Exception as e:
-            logger.warning(f"Failed to load RMP data: {e}")
-            _rmp_data = {}
-    else:
-        logger.info("No RMP data file found - RMP features will be unavailable")
-        _rmp_data = {}
-
-
-def _load_graph_data():
-    """Load graph data to get Reddit sentiment scores per course"""
-    global _graph_nodes
-    if GRAPH_FILE.exists():
-        try:
-            with open(GRAPH_FILE, 'r') as f:
-                graph = json.load(f)
-            # Index nodes by course ID for fast lookup
-            for node in graph.get('nodes', []):
-                node_id = node.get('id', '')
-                if node_id:
-                    _graph_nodes[node_id] = node
-            logger.info(f"Loaded graph data for {len(_graph_nodes)} courses")
-        except Exception as e:
-            logger.warning(f"Failed to load graph data: {e}")
-            _graph_nodes = {}
-    else:
-        logger.info("No graph data file found")
-        _graph_nodes = {}
-
-
-# Load data at module import
-_load_rmp_data()
-_load_graph_data()
+
+def ensure_loaded():
+    """Map the shared catalog on first use (keeps app import fast)"""
+    get_catalog()
 
 
 def get_rmp_data(course_id: str) -> Optional[Dict]:
@@ -72,7 +27,9 @@ def get_rmp_data(course_id: str) -> Optional[Dict]:
     Returns:
         Dictionary with professor data, or None if not available
     """
-    return _rmp_data.get(course_id)
+    catalog = get_catalog()
+    row = catalog.row(course_id)
+    return catalog.rmp(row) if row is not None else None
 
 
 def get_reddit_sentiment(course_id: str) -> Optional[Dict]:
@@ -85,19 +42,22 @@ def get_reddit_sentiment(course_id: str) -> Optional[Dict]:
     Returns:
         Dictionary with difficulty_score, enjoyment_score, comment_count, confidence
     """
-    node = _graph_nodes.get(course_id)
-    if not node:
+    catalog = get_catalog()
+    row = catalog.row(course_id)
+    if row is None:
         return None
 
-    comment_count = node.get('comment_count', 0)
+    comment_count = catalog.value('comment_count', row) or 0
     if comment_count == 0:
         return None
 
+    difficulty = catalog.value('difficulty_score', row)
+    enjoyment = catalog.value('enjoyment_score', row)
     return {
-        "difficulty_score": node.get('difficulty_score', 5.0),
-        "enjoyment_score": node.get('enjoyment_score', 5.0),
+        "difficulty_score": difficulty if difficulty is not None else 5.0,
+        "enjoyment_score": enjoyment if enjoyment is not None else 5.0,
         "comment_count": comment_count,
-        "confidence": node.get('confidence', 'none'),
+        "confidence": catalog.text('confidence', row) or 'none',
     }
 
 
@@ -111,15 +71,46 @@ def get_course_info(course_id: str) -> Optional[Dict]:
     Returns:
         Dictionary with title and description
     """
-    node = _graph_nodes.get(course_id)
-    if not node:
+    catalog = get_catalog()
+    row = catalog.row(course_id)
+    if row is None:
         return None
     return {
-        "title": node.get('title', ''),
-        "description": node.get('description', ''),
+        "title": catalog.text('title', row),
+        "description": catalog.text('description', row),
     }
 
 
+def get_prerequisites(course_id: str) -> Optional[List[str]]:
+    """
+    Get the direct prerequisites of a course.
+
+    Args:
+        course_id: Course ID (e.g., "CS 3110")
+
+    Returns:
+        List of prerequisite course IDs, or None if the course is unknown
+    """
+    catalog = get_catalog()
+    row = catalog.row(course_id)
+    return catalog.prerequisites(row) if row is not None else None
+
+
+def get_unlocks(course_id: str) -> Optional[List[str]]:
+    """
+    Get the courses that list this course as a direct prerequisite.
+
+    Args:
+        course_id: Course ID (e.g., "CS 2110")
+
+    Returns:
+        Sorted list of course IDs, or None if the course is unknown
+    """
+    catalog = get_catalog()
+    row = catalog.row(course_id)
+    return sorted(catalog.unlocks(row)) if row is not None else None
+
+
 def get_course_difficulty_enjoyment(course_id: str) -> Optional[Dict]:
     """
     Get average difficulty and enjoyment scores for a course from RMP data
@@ -0,0 +1,96 @@
+"""
+Similar Courses - Precomputed nearest-neighbor table for the catalog
+
+build_graph.py scores every pair of courses once. The score blends the
+cosine similarity of their TF-IDF description vectors with the Jaccard
+overlap of their direct prerequisites, and each course keeps only its best
+few neighbors. The table is stored on the graph nodes and packed into the
+binary catalog, so serving "courses like X" is a lookup.
+"""
+
+from typing import Dict, List
+import logging
+
+import numpy as np
+
+from app.services.course_index import CourseIndex
+
+logger = logging.getLogger(__name__)
+
+# Neighbors stored per course
+SIMILAR_COURSES_K = 10
+
+# Share of the score that comes from prerequisite overlap
+PREREQ_WEIGHT = 0.25
+
+
+def compute_similar_courses(
+    nodes: List[Dict],
+    prereqs: Dict[str, List[str]],
+    k: int = SIMILAR_COURSES_K,
+    prereq_weight: float = PREREQ_WEIGHT,
+    chunk_size: int = 1024,
+) -> Dict[str, List[Dict]]:
+    """
+    Top-k most similar courses for every course.
+
+    Args:
+        nodes: Graph nodes with "id", "title" and "description"
+        prereqs: Course ID -> direct prerequisite course IDs
+        k: Neighbors kept per course
+        prereq_weight: Weight of prerequisite overlap vs. description similarity
+        chunk_size: Courses scored per block
+
+    Returns:
+        Course ID -> [{"id", "score"}], most similar first
+    """
+    nodes = [n for n in nodes if n.get("id")]
+    n = len(nodes)
+    k = min(k, n - 1)
+    if k <= 0:
+        return {node["id"]: [] for node in nodes}
+
+    from scipy import sparse
+
+    index = CourseIndex(nodes)
+
+    # Direct prerequisites as a sparse 0/1 course x course matrix
+    rows = {course_id: i for i, course_id in enumerate(index.course_ids)}
+    edges = [
+        (rows[course_id], rows[prereq])
+        for course_id, prereq_list in prereqs.items() if course_id in rows
+        for prereq in set(prereq_list) if prereq in rows
+    ]
+    requires = sparse.csr_matrix(
+        (np.ones(len(edges), dtype=np.float32), ([e[0] for e in edges], [e[1] for e in edges])),
+        shape=(n, n),
+    )
+    sizes = np.asarray(requires.sum(axis=1)).ravel()
+
+    top = np.zeros((n, k), dtype=np.int64)
+    top_scores = np.zeros((n, k), dtype=np.float64)
+    # Score in row blocks so the dense block stays chunk_size x courses
+    for start in range(0, n, chunk_size):
+        block = slice(start, min(start + chunk_size, n))
+        description_similarity = index.matrix[block] @ index.matrix.T
+        shared = (requires[block] @ requires.T).toarray()
+        union = sizes[block, None] + sizes[None, :] - shared
+        prereq_overlap = np.divide(shared, union, out=np.zeros_like(shared), where=union > 0)
+
+        scores = (1 - prereq_weight) * description_similarity + prereq_weight * prereq_overlap
+        scores[np.arange(scores.shape[0]), np.arange(block.start, block.stop)] = -np.inf
+
+        candidates = np.argpartition(-scores, k - 1, axis=1)[:, :k]
+        candidate_scores = np.take_along_axis(scores, candidates, axis=1)
+        order = np.argsort(-candidate_scores, axis=1, kind="stable")
+        top[block] = np.take_along_axis(candidates, order, axis=1)
+        top_scores[block] = np.take_along_axis(candidate_scores, order, axis=1)
+
+    similar = {}
+    for row, course_id in enumerate(index.course_ids):
+        similar[course_id] = [
+            {"id": index.course_ids[neighbor], "score": round(float(score), 4)}
+            for neighbor, score in zip(top[row], top_scores[row]) if score > 0
+        ]
+    logger.info(f"Computed {k} similar courses for {n} courses")
+    return similar
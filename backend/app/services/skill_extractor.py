@@ -0,0 +1,143 @@
+"""
+Skill Extractor - Fast local skill matching against the skill taxonomy
+
+All aliases from data/skill_taxonomy.json are compiled into two prefix-factored
+regexes (case-insensitive, plus case-sensitive for ambiguous names such as
+"C", "R" or "Go"), so one pass over the text finds every skill.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+DATA_DIR = Path(__file__).parent.parent.parent / "data"
+TAXONOMY_FILE = DATA_DIR / "skill_taxonomy.json"
+
+# A skill must not be glued to other identifier characters ("R" in "React",
+# "C" in "C#", "Java" in "JavaScript"); "." and "/" are allowed after a match
+_LEFT_BOUNDARY = r'(?<![A-Za-z0-9_+#&])'
+_RIGHT_BOUNDARY = r'(?![A-Za-z0-9_+#&])'
+
+
+def _trie_regex(aliases: List[str]) -> str:
+    """
+    Build a prefix-factored regex from aliases.
+
+    A flat alternation of hundreds of words makes the regex engine retry
+    every alternative at every position; factoring shared prefixes into a
+    trie keeps each position to a handful of character checks. Longer
+    continuations are tried before ending a word, so "C++" wins over "C"
+    and "React Native" over "React".
+    """
+    trie: Dict = {}
+    for alias in aliases:
+        node = trie
+        for char in alias:
+            node = node.setdefault(char, {})
+        node[''] = {}
+
+    def build(node: Dict) -> str:
+        branches = []
+        for char in sorted(k for k in node if k):
+            atom = r'[\s\-]+' if char == ' ' else re.escape(char)
+            branches.append(atom + build(node[char]))
+        if '' in node:
+            branches.append('')
+        if not branches:
+            return ''
+        if len(branches) == 1:
+            return branches[0]
+        return '(?:' + '|'.join(branches) + ')'
+
+    return build(trie)
+
+
+def _compile(aliases: List[str], flags: int) -> Optional[re.Pattern]:
+    if not aliases:
+        return None
+    body = _trie_regex(sorted(set(aliases)))
+    return re.compile(f"{_LEFT_BOUNDARY}{body}{_RIGHT_BOUNDARY}", flags)
+
+
+class SkillExtractor:
+    """Compiled multi-pattern matcher over a skill taxonomy"""
+
+    def __init__(self, taxonomy: Dict):
+        self.skills: List[Dict] = taxonomy.get('skills', [])
+        self.categories: Dict[str, str] = {}
+        self._folded: Dict[str, str] = {}
+        self._exact: Dict[str, str] = {}
+
+        for skill in self.skills:
+            name = skill['name']
+            self.categories[name] = skill.get('category', '')
+            exact = skill.get('exact', [])
+            for alias in skill.get('aliases', []) + ([] if name in exact else [name]):
+                self._folded[self._normalize(alias).lower()] = name
+            for alias in exact:
+                self._exact[self._normalize(alias)] = name
+
+        self._folded_pattern = _compile(list(self._folded), re.IGNORECASE)
+        self._exact_pattern = _compile(list(self._exact), 0)
+
+    @staticmethod
+    def _normalize(alias: str) -> str:
+        return re.sub(r'[\s\-]+', ' ', alias.strip())
+
+    def find(self, text: str) -> List[Tuple[int, str]]:
+        """All (position, canonical skill) matches in text order"""
+        matches = []
+        if self._folded_pattern:
+            for m in self._folded_pattern.finditer(text):
+                name = self._folded.get(self._normalize(m.group(0)).lower())
+                if name:
+                    matches.append((m.start(), name))
+        if self._exact_pattern:
+            for m in self._exact_pattern.finditer(text):
+                name = self._exact.get(self._normalize(m.group(0)))
+                if name:
+                    matches.append((m.start(), name))
+        matches.sort()
+        return matches
+
+    def extract(self, text: str) -> List[str]:
+        """
+        Extract canonical skill names from text.
+
+        Args:
+            text: Resume, job posting or course description text
+
+        Returns:
+            Unique skill names in order of first appearance
+        """
+        return list(dict.fromkeys(name for _, name in self.find(text)))
+
+    def canonicalize(self, skill: str) -> str:
+        """Map a free-form skill name (e.g. from the LLM) to its taxonomy name"""
+        normalized = self._normalize(skill)
+        return self._exact.get(normalized) or self._folded.get(normalized.lower()) or skill.strip()
+
+
+_extractor: Optional[SkillExtractor] = None
+
+
+def get_skill_extractor() -> SkillExtractor:
+    """Shared SkillExtractor, compiled on first use"""
+    global _extractor
+    if _extractor is None:
+        taxonomy = {}
+        if TAXONOMY_FILE.exists():
+            try:
+                with open(TAXONOMY_FILE, 'r') as f:
+                    taxonomy = json.load(f)
+                logger.info(f"Loaded skill taxonomy with {len(taxonomy.get('skills', []))} skills")
+            except Exception as e:
+                logger.warning(f"Failed to load skill taxonomy: {e}")
+        else:
+            logger.warning("No skill taxonomy file found - skill extraction disabled")
+        _extractor = SkillExtractor(taxonomy)
+    return _extractor
@@ -0,0 +1,95 @@
+"""
+Skill Index - Which catalog courses teach which taxonomy skills
+
+Built once from course titles and descriptions with the skill extractor.
+Each course's skills are stored as an integer bitmask over the taxonomy, so
+coverage and gap questions are a few bitwise operations.
+"""
+
+from typing import Dict, Iterable, List, Optional
+import logging
+
+from app.services.catalog import load_catalog_nodes
+from app.services.skill_extractor import SkillExtractor, get_skill_extractor
+
+logger = logging.getLogger(__name__)
+
+
+class SkillIndex:
+    """
+    Two-way index between taxonomy skills and catalog courses.
+
+    Args:
+        courses: Graph nodes with "id", "title" and "description"
+        extractor: Skill extractor defining the taxonomy
+    """
+
+    def __init__(self, courses: List[Dict], extractor: SkillExtractor):
+        self.extractor = extractor
+        self.skills: List[str] = [skill['name'] for skill in extractor.skills]
+        self._bit: Dict[str, int] = {name: 1 << i for i, name in enumerate(self.skills)}
+
+        self.course_skills: Dict[str, List[str]] = {}
+        self.skill_courses: Dict[str, List[str]] = {}
+        self._course_masks: Dict[str, int] = {}
+
+        for course in courses:
+            found = extractor.extract(f"{course.get('title', '')}\n{course.get('description', '')}")
+            self.course_skills[course['id']] = found
+            self._course_masks[course['id']] = self.mask(found)
+            for skill in found:
+                self.skill_courses.setdefault(skill, []).append(course['id'])
+
+        logger.info(
+            f"Built skill index: {len(self.skill_courses)} skills taught across "
+            f"{sum(1 for s in self.course_skills.values() if s)} courses"
+        )
+
+    def mask(self, skills: Iterable[str]) -> int:
+        """Bitmask for a set of skill names (names outside the taxonomy are ignored)"""
+        bits = 0
+        for skill in skills:
+            bits |= self._bit.get(skill, 0)
+        return bits
+
+    def courses_mask(self, course_ids: Iterable[str]) -> int:
+        """Union of the skills taught by the given courses"""
+        bits = 0
+        for course_id in course_ids:
+            bits |= self._course_masks.get(course_id, 0)
+        return bits
+
+    def coverage(self, required: List[str], course_ids: Iterable[str]) -> Dict:
+        """
+        Compare required skills against what a set of courses teaches.
+
+        Args:
+            required: Canonical skill names, e.g. extracted from a job posting
+                (names outside the taxonomy are dropped)
+            course_ids: Courses the student takes or is recommended
+
+        Returns:
+            - required / covered / gaps: Skill names in the order given
+            - coverage: Fraction of required skills covered (None if none required)
+        """
+        required = [s for s in dict.fromkeys(required) if s in self._bit]
+        required_mask = self.mask(required)
+        covered_mask = required_mask & self.courses_mask(course_ids)
+        total = bin(required_mask).count("1")
+        return {
+            "required": required,
+            "covered": [s for s in required if self._bit[s] & covered_mask],
+            "gaps": [s for s in required if not self._bit[s] & covered_mask],
+            "coverage": bin(covered_mask).count("1") / total if total else None,
+        }
+
+
+_index: Optional[SkillIndex] = None
+
+
+def get_skill_index() -> SkillIndex:
+    """Shared SkillIndex, built from graph_data.json on first use"""
+    global _index
+    if _index is None:
+        _index = SkillIndex(load_catalog_nodes(), get_skill_extractor())
+    return _index
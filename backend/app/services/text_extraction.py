@@ -0,0 +1,288 @@
+"""
+Resume Text Extraction - CPU-bound PDF/DOCX/TXT parsing in a process pool
+
+PyPDF2 and python-docx are pure Python and CPU-bound, so running them inside
+a coroutine freezes the event loop for every other request. Extraction jobs
+are instead submitted to a bounded ProcessPoolExecutor with a per-job timeout
+and a cap on queued jobs. A job that hangs retires its pool rather than
+killing it, so other uploads running alongside it are unaffected. If a
+worker dies (parser crash, OOM kill) the broken pool is retired and the
+job retried once on a fresh one.
+"""
+
+import asyncio
+import io
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.process import BaseProcess
+from typing import Dict, Iterator, List, Optional, Set
+import logging
+
+from app.config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+PDF_CONTENT_TYPE = "application/pdf"
+DOCX_CONTENT_TYPE = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+
+class ExtractionQueueFull(Exception):
+    """Raised when too many extraction jobs are already queued"""
+
+
+class ExtractionTimeout(Exception):
+    """Raised when a single extraction job exceeds its time limit"""
+
+
+def iter_pdf_pages(data: bytes, max_pages: int) -> Iterator[str]:
+    """Lazily yield the text of each page of an in-memory PDF."""
+    import PyPDF2
+
+    pdf_reader = PyPDF2.PdfReader(io.BytesIO(data))
+    for page in pdf_reader.pages[:max_pages]:
+        yield page.extract_text() or ""
+
+
+def iter_docx_paragraphs(data: bytes) -> Iterator[str]:
+    """Lazily yield the paragraphs of an in-memory DOCX file."""
+    import docx
+
+    doc = docx.Document(io.BytesIO(data))
+    for paragraph in doc.paragraphs:
+        yield paragraph.text
+
+
+def collect_text(chunks: Iterator[str], max_chars: int) -> str:
+    """
+    Join text chunks, stopping once `max_chars` characters are collected.
+
+    Later pages are never parsed, so a 40-page paper costs about the same
+    as a one-page resume.
+    """
+    parts = []
+    total = 0
+    for chunk in chunks:
+        parts.append(chunk)
+        total += len(chunk) + 1
+        if total >= max_chars:
+            break
+    return "\n".join(parts)[:max_chars]
+
+
+def extract_pdf_text(data: bytes, max_pages: int, max_chars: int) -> str:
+    """Extract up to `max_chars` of text from an in-memory PDF."""
+    try:
+        return collect_text(iter_pdf_pages(data, max_pages), max_chars)
+    except Exception as e:
+        raise Exception(f"Failed to extract PDF text: {str(e)}")
+
+
+def extract_docx_text(data: bytes, max_chars: int) -> str:
+    """Extract up to `max_chars` of text from an in-memory DOCX file."""
+    try:
+        return collect_text(iter_docx_paragraphs(data), max_chars)
+    except Exception as e:
+        raise Exception(f"Failed to extract DOCX text: {str(e)}")
+
+
+def extract_txt_text(data: bytes, max_chars: int) -> str:
+    """Decode up to `max_chars` of an in-memory text file."""
+    try:
+        # UTF-8 uses at most 4 bytes per character
+        text = data[:max_chars * 4].decode('utf-8', errors='ignore')
+    except Exception as e:
+        raise Exception(f"Failed to read text file: {str(e)}")
+    return text[:max_chars]
+
+
+def extract_text(data: bytes, content_type: str, max_pages: int, max_chars: int) -> str:
+    """Dispatch on content type (runs inside a worker process)."""
+    if content_type == PDF_CONTENT_TYPE:
+        return extract_pdf_text(data, max_pages, max_chars)
+    if content_type == DOCX_CONTENT_TYPE:
+        return extract_docx_text(data, max_chars)
+    return extract_txt_text(data, max_chars)
+
+
+class ExtractionPool:
+    """
+    Bounded process pool for resume text extraction.
+
+    Args:
+        max_workers: Worker processes (0 runs jobs in a thread instead)
+        timeout: Seconds allowed per job, including time spent queued
+        max_queue: Maximum jobs queued or running before new ones are rejected
+        max_bulk: Maximum bulk jobs queued or running (capped below max_queue);
+            further bulk jobs wait rather than being rejected, so a bulk
+            upload never takes the slots interactive uploads rely on
+        max_pages: Maximum PDF pages read per document
+        max_chars: Extraction stops once this many characters are collected
+    """
+
+    def __init__(
+        self, max_workers: int, timeout: float, max_queue: int, max_bulk: int, max_pages: int, max_chars: int
+    ):
+        self.max_workers = max_workers
+        self.timeout = timeout
+        self.max_queue = max_queue
+        self.max_bulk = max(1, min(max_bulk, max_queue - 1))
+        self._bulk_slots: Optional[asyncio.Semaphore] = None
+        self.max_pages = max_pages
+        self.max_chars = max_chars
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # In-flight jobs and the pool running each; timed-out jobs still running
+        # are abandoned and keep their retired pool alive until it is reaped
+        self._jobs: Dict[Future, ProcessPoolExecutor] = {}
+        self._abandoned: Set[Future] = set()
+        self._retired: Dict[ProcessPoolExecutor, List[BaseProcess]] = {}
+
+        # Metrics
+        self.pending = 0
+        self.completed = 0
+        self.failed = 0
+        self.timed_out = 0
+        self.rejected = 0
+        self.total_seconds = 0.0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            logger.info(f"Started resume extraction pool with {self.max_workers} workers")
+        return self._executor
+
+    def _abandon(self, future: Future):
+        """
+        Give up on a job that outlived its timeout.
+
+        A job that never started was already cancelled by wait_for. One that
+        is still running has a stuck worker, so its pool is retired: new jobs
+        go to a fresh pool, jobs already running there finish normally, and
+        its processes are killed once only abandoned jobs are left.
+        """
+        if future.done():
+            self._jobs.pop(future, None)
+            return
+        self._abandoned.add(future)
+        if self._retire(self._jobs[future]):
+            logger.warning("Resume extraction worker is stuck; retiring its pool")
+
+    def _retire(self, executor: ProcessPoolExecutor) -> bool:
+        """Stop sending jobs to a pool (False if it was already retired)"""
+        if executor is not self._executor:
+            return False
+        self._executor = None
+        # shutdown() drops the process table, so keep it for the reaper
+        self._retired[executor] = list((getattr(executor, '_processes', None) or {}).values())
+        executor.shutdown(wait=False)
+        return True
+
+    def _reap_retired(self):
+        """Kill retired pools whose remaining jobs have all been abandoned"""
+        for executor, processes in list(self._retired.items()):
+            jobs = [future for future, owner in self._jobs.items() if owner is executor]
+            if any(future not in self._abandoned for future in jobs):
+                continue
+            for process in processes:
+                process.terminate()
+            for future in jobs:
+                del self._jobs[future]
+                self._abandoned.discard(future)
+            del self._retired[executor]
+
+    async def extract(self, data: bytes, content_type: str, bulk: bool = False) -> str:
+        """
+        Extract text from an uploaded file without blocking the event loop.
+
+        Args:
+            data: Raw file contents
+            content_type: MIME type of the file
+            bulk: Part of a bulk upload (waits for one of max_bulk slots first)
+
+        Returns:
+            Extracted text
+
+        Raises:
+            ExtractionQueueFull: If max_queue jobs are already pending
+            ExtractionTimeout: If the job exceeds the timeout
+        """
+        if bulk:
+            if self._bulk_slots is None:
+                self._bulk_slots = asyncio.Semaphore(self.max_bulk)
+            async with self._bulk_slots:
+                return await self.extract(data, content_type)
+
+        if self.pending >= self.max_queue:
+            self.rejected += 1
+            raise ExtractionQueueFull("Resume extraction queue is full, please retry shortly")
+
+        self.pending += 1
+        started = time.perf_counter()
+        future: Optional[Future] = None
+        try:
+            if self.max_workers > 0:
+                for attempt in range(2):
+                    executor = self._get_executor()
+                    future = None
+                    try:
+                        future = executor.submit(extract_text, data, content_type, self.max_pages, self.max_chars)
+                        self._jobs[future] = executor
+                        remaining = started + self.timeout - time.perf_counter()
+                        text = await asyncio.wait_for(asyncio.wrap_future(future), timeout=max(remaining, 0))
+                        break
+                    except BrokenProcessPool:
+                        # A worker died and took the pool with it; this job may
+                        # not be the one that killed it, so retry once
+                        self._retire(executor)
+                        if future is not None:
+                            self._jobs.pop(future, None)
+                            future = None
+                        if attempt:
+                            raise
+                        logger.warning("Resume extraction pool broke; retrying on a fresh pool")
+            else:
+                job = asyncio.to_thread(extract_text, data, content_type, self.max_pages, self.max_chars)
+                text = await asyncio.wait_for(job, timeout=self.timeout)
+            self.completed += 1
+            return text
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            if future is not None:
+                self._abandon(future)
+            raise ExtractionTimeout(f"Resume text extraction exceeded {self.timeout:.0f}s")
+        except Exception:
+            self.failed += 1
+            raise
+        finally:
+            if future is not None:
+                if future not in self._abandoned:
+                    self._jobs.pop(future, None)
+                self._reap_retired()
+            self.pending -= 1
+            self.total_seconds += time.perf_counter() - started
+
+    def stats(self) -> Dict[str, float]:
+        """Queue depth and job counters"""
+        finished = self.completed + self.failed + self.timed_out
+        return {
+            "workers": self.max_workers,
+            "queue_depth": self.pending,
+            "max_queue": self.max_queue,
+            "max_bulk": self.max_bulk,
+            "completed": self.completed,
+            "failed": self.failed,
+            "timed_out": self.timed_out,
+            "rejected": self.rejected,
+            "retired_pools": len(self._retired),
+            "avg_seconds": round(self.total_seconds / finished, 4) if finished else 0.0,
+        }
+
+
+extraction_pool = ExtractionPool(
+    max_workers=settings.RESUME_EXTRACT_WORKERS,
+    timeout=settings.RESUME_EXTRACT_TIMEOUT,
+    max_queue=settings.RESUME_EXTRACT_MAX_QUEUE,
+    max_bulk=settings.RESUME_EXTRACT_MAX_BULK,
+    max_pages=settings.RESUME_MAX_PDF_PAGES,
+    max_chars=settings.RESUME_MAX_TEXT_CHARS,
+)
@@ -2,12 +2,15 @@
 Timeline Planner Service - Generates 3 career path timelines using OpenAI
 """
 
-from openai import OpenAI
-from typing import List, Dict, Any
+from typing import TYPE_CHECKING, List, Dict, Any
 import json
 import os
 import logging
 from app.config.settings import settings
+from app.services.llm_service import chat_completion, get_openai_client
+
+if TYPE_CHECKING:
+    from app.services.course_table import Course
 
 logger = logging.getLogger(__name__)
 
@@ -17,18 +20,18 @@ class TimelinePlanner:
 
     def __init__(self):
         if settings.OPENAI_API_KEY:
-            self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+            self.client = get_openai_client()
         else:
             self.client = None
             logger.error("OpenAI API key not configured")
             raise ValueError("OpenAI API key required for timeline planning")
 
-    def generate_timelines(
+    async def generate_timelines(
         self,
         career_goal: str,
         completed_courses: List[str],
         current_semester: str = "Sophomore Fall",
-        available_courses: List[Dict[str, Any]] = None,
+        available_courses: List["Course"] = None,
         prerequisites: Dict[str, List[str]] = None
     ) -> Dict[str, Any]:
         """
@@ -38,7 +41,7 @@ class TimelinePlanner:
             career_goal: User's career objective (e.g., "work at NVIDIA on self-driving cars")
             completed_courses: List of course codes already taken (e.g., ["CS 2110", "MATH 1920"])
             current_semester: Current academic standing
-            available_courses: List of all available courses with metadata
+            available_courses: Catalog courses (CourseTable records)
             prerequisites: Dict mapping course code to list of prerequisite course codes
 
         Returns:
@@ -53,7 +56,8 @@ class TimelinePlanner:
         )
 
         try:
-            response = self.client.chat.completions.create(
+            response_text = await chat_completion(
+                self.client,
                 model='gpt-4o-mini',
                 messages=[
                     {"role": "system", "content": "You are a Cornell CS course advisor. Return ONLY valid JSON, no markdown."},
@@ -64,7 +68,7 @@ class TimelinePlanner:
             )
 
             # Parse the JSON response
-            result = self._parse_timeline_response(response.choices[0].message.content)
+            result = self._parse_timeline_response(response_text)
             return result
 
         except Exception as e:
@@ -76,7 +80,7 @@ class TimelinePlanner:
         career_goal: str,
         completed_courses: List[str],
         current_semester: str,
-        available_courses: List[Dict[str, Any]],
+        available_courses: List["Course"],
         prerequisites: Dict[str, List[str]] = None
     ) -> str:
         """Build the prompt for OpenAI to generate timelines"""
@@ -84,7 +88,7 @@ class TimelinePlanner:
         # Extract valid course codes from available courses
         valid_course_codes = []
         if available_courses:
-            valid_course_codes = [c.get('id', '') for c in available_courses if c.get('id')]
+            valid_course_codes = [c.id for c in available_courses]
 
         cs_courses = sorted([c for c in valid_course_codes if c.startswith('CS')])
         math_courses = sorted([c for c in valid_course_codes if c.startswith('MATH')])
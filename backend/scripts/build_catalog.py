@@ -0,0 +1,38 @@
+"""
+Catalog Builder - Packs the JSON data files into the shared binary catalog
+
+Runs after build_graph.py and the RMP scraper (build_graph.py calls it
+itself). The backend memory-maps the resulting catalog.bin in every worker;
+until it is rebuilt after a data change, workers fall back to parsing JSON.
+
+Usage:
+    python scripts/build_catalog.py
+"""
+
+import argparse
+from pathlib import Path
+import sys
+import logging
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.catalog import CATALOG_BIN, build_catalog_file
+from app.services.catalog_file import CatalogFile
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the memory-mapped course catalog")
+    parser.add_argument("--output", type=Path, default=CATALOG_BIN, help="Output binary catalog")
+    args = parser.parse_args()
+
+    build_catalog_file(args.output)
+    catalog = CatalogFile.open(args.output)
+    logger.info(f"✅ {len(catalog)} courses, built from data version {catalog.source_version}")
+
+
+if __name__ == "__main__":
+    main()
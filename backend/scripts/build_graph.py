@@ -11,7 +11,9 @@ import logging
 # Add parent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
+from app.services.catalog import build_catalog_file
 from app.services.gemini_service import GeminiPrerequisiteParser
+from app.services.similar_courses import compute_similar_courses
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -21,6 +23,7 @@ DATA_DIR = Path(__file__).parent.parent / "data"
 COURSES_FILE = DATA_DIR / "raw_courses.json"
 SENTIMENT_FILE = DATA_DIR / "sentiment_scores.json"
 OUTPUT_FILE = DATA_DIR / "graph_data.json"
+PREREQ_FILE = DATA_DIR / "prerequisites.json"
 
 
 def load_data():
@@ -137,6 +140,24 @@ def build_graph(courses: list, sentiment_scores: dict) -> nx.DiGraph:
     return G
 
 
+def add_similar_courses(G: nx.DiGraph):
+    """Store each course's nearest neighbors (description + prerequisite similarity) on its node"""
+    logger.info("Computing similar courses...")
+
+    # prerequisites.json is what the app serves; fall back to the parsed graph edges
+    if PREREQ_FILE.exists():
+        with open(PREREQ_FILE, 'r') as f:
+            prereqs = json.load(f)
+    else:
+        prereqs = {node: list(G.predecessors(node)) for node in G.nodes()}
+
+    nodes = [dict(G.nodes[node], id=node) for node in G.nodes()]
+    for course_id, neighbors in compute_similar_courses(nodes, prereqs).items():
+        G.nodes[course_id]['similar'] = neighbors
+
+    logger.info(f"✓ Stored similar courses for {G.number_of_nodes()} courses")
+
+
 def export_graph(G: nx.DiGraph, output_path: Path = OUTPUT_FILE):
     """Export graph to JSON (node-link format)"""
     data = nx.node_link_data(G)
@@ -157,10 +178,14 @@ def main():
 
     # Build graph
     G = build_graph(courses, sentiment_scores)
+    add_similar_courses(G)
 
     # Export to JSON
     export_graph(G)
 
+    # Workers memory-map the binary catalog rather than parsing the JSON
+    build_catalog_file()
+
     logger.info("\n✅ Graph construction completed!")
 
 
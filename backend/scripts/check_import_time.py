@@ -0,0 +1,89 @@
+"""
+Import Time Check - Fails if importing the FastAPI app exceeds a time budget
+
+Imports app.main in a fresh interpreter with `python -X importtime`, takes
+the best of a few runs, and lists the slowest imports. Heavy dependencies
+(openai, numpy, PyPDF2, docx) and data files should load lazily, so a
+regression here usually means one of them moved back to module level.
+
+Usage:
+    python scripts/check_import_time.py --budget-ms 1200
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+BACKEND_DIR = Path(__file__).parent.parent
+DEFAULT_BUDGET_MS = float(os.environ.get("IMPORT_TIME_BUDGET_MS", 1200))
+
+# Modules that must never be imported at startup
+FORBIDDEN_AT_STARTUP = ("openai", "numpy", "scipy", "PyPDF2", "docx", "google.genai")
+
+
+def measure(module: str) -> Tuple[float, Dict[str, float]]:
+    """
+    Import `module` in a fresh interpreter.
+
+    Returns:
+        (total milliseconds, cumulative milliseconds per imported module)
+    """
+    env = dict(os.environ, WARMUP_ON_STARTUP="false")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR, env=env, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+
+    cumulative: Dict[str, float] = {}
+    for line in result.stderr.splitlines():
+        # "import time:  self [us] | cumulative | imported package"
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, total_us, name = line[len("import time:"):].split("|")
+        cumulative[name.strip()] = int(total_us) / 1000
+    return cumulative.get(module, 0.0), cumulative
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the app import time against a budget")
+    parser.add_argument("--budget-ms", type=float, default=DEFAULT_BUDGET_MS, help="Maximum import time")
+    parser.add_argument("--runs", type=int, default=3, help="Best of this many runs is compared")
+    parser.add_argument("--module", default="app.main", help="Module to import")
+    args = parser.parse_args()
+
+    runs: List[Tuple[float, Dict[str, float]]] = [measure(args.module) for _ in range(args.runs)]
+    total, modules = min(runs, key=lambda run: run[0])
+
+    logger.info(f"import {args.module}: {total:.0f} ms (best of {args.runs}, budget {args.budget_ms:.0f} ms)")
+    slowest = sorted(
+        ((ms, name) for name, ms in modules.items() if name != args.module and "." not in name),
+        reverse=True,
+    )[:8]
+    for ms, name in slowest:
+        logger.info(f"  {ms:8.1f} ms  {name}")
+
+    failed = False
+    eager = [name for name in FORBIDDEN_AT_STARTUP if name in modules]
+    if eager:
+        logger.error(f"❌ Imported at startup but should load lazily: {', '.join(eager)}")
+        failed = True
+    if total > args.budget_ms:
+        logger.error(f"❌ Import time {total:.0f} ms exceeds the {args.budget_ms:.0f} ms budget")
+        failed = True
+
+    if failed:
+        sys.exit(1)
+    logger.info("✅ Import time within budget")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Study Materials Generator - Pre-generates materials for every catalog course
+
+Runs after build_graph.py. Each course in graph_data.json gets LLM-curated
+study materials, generated with bounded concurrency and checkpointed to
+study_materials.json as it goes. Re-running resumes where the last run
+stopped: courses already generated with the current prompt version are
+skipped, and failed courses are retried.
+
+Usage:
+    python scripts/generate_study_materials.py --concurrency 8
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import time
+from pathlib import Path
+import sys
+import logging
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.catalog import load_catalog_nodes
+from app.services.materials_service import MaterialsService, MATERIALS_FILE, PROMPT_VERSION
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+
+def load_checkpoint(path: Path) -> dict:
+    """Existing artifact, or an empty one"""
+    if path.exists():
+        with open(path, 'r') as f:
+            return json.load(f)
+    return {"courses": {}}
+
+
+def save_checkpoint(artifact: dict, path: Path):
+    """Write atomically so an interrupted run never leaves a truncated file"""
+    artifact["updated_at"] = time.time()
+    tmp_path = path.with_suffix(".json.tmp")
+    with open(tmp_path, 'w') as f:
+        json.dump(artifact, f, indent=2)
+    os.replace(tmp_path, path)
+
+
+async def generate_all(courses, artifact: dict, output: Path, concurrency: int, checkpoint_every: int):
+    """Generate materials for `courses`, checkpointing every few completions"""
+    service = MaterialsService()
+    slots = asyncio.Semaphore(concurrency)
+    counts = {"done": 0, "failed": 0}
+
+    async def generate(course):
+        async with slots:
+            materials = await service.generate_materials(course["id"], course.get("title", ""))
+
+        if materials is None:
+            counts["failed"] += 1
+            logger.warning(f"  ✗ {course['id']} - will retry on the next run")
+            return
+
+        artifact["courses"][course["id"]] = {
+            "course_title": course.get("title", ""),
+            "materials": materials,
+            "prompt_version": PROMPT_VERSION,
+            "generated_at": time.time(),
+        }
+        counts["done"] += 1
+        logger.info(f"  ✓ {course['id']} ({counts['done']}/{len(courses)})")
+        if counts["done"] % checkpoint_every == 0:
+            save_checkpoint(artifact, output)
+
+    try:
+        await asyncio.gather(*(generate(course) for course in courses))
+    finally:
+        # Keep whatever finished, even on Ctrl-C
+        save_checkpoint(artifact, output)
+
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Pre-generate study materials for every catalog course")
+    parser.add_argument("--output", type=Path, default=MATERIALS_FILE, help="Output JSON artifact")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent LLM requests")
+    parser.add_argument("--checkpoint-every", type=int, default=10, help="Save after this many courses")
+    parser.add_argument("--force", action="store_true", help="Regenerate courses that are already done")
+    parser.add_argument("--limit", type=int, default=0, help="Only generate this many courses (0 = all)")
+    args = parser.parse_args()
+
+    catalog = load_catalog_nodes()
+    if not catalog:
+        logger.error("No courses found. Please run build_graph.py first.")
+        sys.exit(1)
+
+    artifact = load_checkpoint(args.output)
+    artifact["prompt_version"] = PROMPT_VERSION
+    done = {
+        code for code, entry in artifact["courses"].items()
+        if entry.get("prompt_version") == PROMPT_VERSION and entry.get("materials")
+    }
+    pending = [c for c in catalog if args.force or c["id"] not in done]
+    if args.limit:
+        pending = pending[:args.limit]
+
+    logger.info(f"{len(catalog)} catalog courses, {len(catalog) - len(pending)} already generated, {len(pending)} to go")
+    if not pending:
+        return
+
+    started = time.perf_counter()
+    counts = asyncio.run(generate_all(pending, artifact, args.output, args.concurrency, args.checkpoint_every))
+
+    logger.info(
+        f"\n✅ Generated {counts['done']} courses in {time.perf_counter() - started:.1f}s "
+        f"({counts['failed']} failed) -> {args.output}"
+    )
+    logger.info("  Restart your backend to serve the new materials.")
+
+
+if __name__ == "__main__":
+    main()
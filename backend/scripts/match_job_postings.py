@@ -0,0 +1,93 @@
+"""
+Job Posting Matcher - Batch-match scraped job postings against the catalog
+
+Reads postings from a .json file (a list of strings or objects) or a .jsonl
+file (one string or object per line), scores them all against the course
+TF-IDF index with sparse matrix products, and writes per-posting top courses
+plus aggregate course demand.
+
+Usage:
+    python scripts/match_job_postings.py postings.jsonl --top-k 5 --output data/course_demand.json
+"""
+
+import argparse
+import json
+import time
+from pathlib import Path
+import sys
+import logging
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.job_matcher import match_postings
+
+logger = logging.getLogger(__name__)
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+OUTPUT_FILE = DATA_DIR / "course_demand.json"
+
+# Object fields checked, in order, for the posting text
+TEXT_FIELDS = ("job_description", "description", "text")
+
+
+def posting_text(item) -> str:
+    """Posting text from a raw string or a scraped posting object"""
+    if isinstance(item, str):
+        return item
+    if isinstance(item, dict):
+        for field in TEXT_FIELDS:
+            if isinstance(item.get(field), str):
+                title = item.get("title")
+                return f"{title}\n{item[field]}" if isinstance(title, str) else item[field]
+    return ""
+
+
+def load_postings(path: Path):
+    """Load posting texts from a .json or .jsonl file"""
+    with open(path, 'r') as f:
+        if path.suffix == ".jsonl":
+            items = [json.loads(line) for line in f if line.strip()]
+        else:
+            items = json.load(f)
+    texts = [posting_text(item) for item in items]
+    skipped = sum(1 for t in texts if not t.strip())
+    if skipped:
+        logger.warning(f"Skipping {skipped} postings without text")
+    return [t for t in texts if t.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Match job postings against the course catalog")
+    parser.add_argument("postings", type=Path, help=".json or .jsonl file of job postings")
+    parser.add_argument("--top-k", type=int, default=5, help="Courses kept per posting")
+    parser.add_argument("--output", type=Path, default=OUTPUT_FILE, help="Output JSON file")
+    parser.add_argument("--demand-only", action="store_true", help="Omit per-posting results")
+    args = parser.parse_args()
+
+    postings = load_postings(args.postings)
+    logger.info(f"Loaded {len(postings)} job postings from {args.postings}")
+
+    started = time.perf_counter()
+    result = match_postings(postings, top_k=args.top_k)
+    logger.info(f"Matched {len(postings)} postings in {time.perf_counter() - started:.2f}s")
+
+    if args.demand_only:
+        result.pop("results")
+
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, 'w') as f:
+        json.dump(result, f, indent=2)
+    logger.info(f"Wrote results to {args.output}")
+
+    logger.info("\nMost in-demand courses:")
+    for course in result["course_demand"][:10]:
+        logger.info(
+            f"  {course['code']:10} | {course['postings']:6} postings | "
+            f"relevance {course['mean_relevance']:.2f} | {course['title'][:50]}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -10,7 +10,7 @@ import { chatAPI } from '@/lib/api';
 import { extractCourseCodes } from '@/lib/graphUtils';
 
 export function ChatOverlay() {
-  const { messages, isOpen, isTyping, toggleChat, addMessage, setTyping } = useChatStore();
+  const { messages, isOpen, isTyping, sessionId, toggleChat, addMessage, setTyping, setSessionId } = useChatStore();
   const { highlightNodes } = useGraphStore();
   const messagesEndRef = useRef<HTMLDivElement>(null);
 
@@ -29,7 +29,10 @@ export function ChatOverlay() {
 
     setTyping(true);
     try {
-      const response = await chatAPI.sendMessage(content, messages.slice(-5));
+      const { response, session_id } = await chatAPI.sendMessage(content, sessionId);
+      if (session_id) {
+        setSessionId(session_id);
+      }
       const courseCodes = extractCourseCodes(response);
 
       const aiMessage = {
@@ -17,6 +17,8 @@ interface ResumeData {
 
 export default function ResumeToTimelineForm() {
   const [file, setFile] = useState<File | null>(null);
+  const [careerGoal, setCareerGoal] = useState('');
+  const [currentSemester, setCurrentSemester] = useState('');
   const [uploading, setUploading] = useState(false);
   const [parsing, setParsing] = useState(false);
   const [generating, setGenerating] = useState(false);
@@ -71,93 +73,72 @@ export default function ResumeToTimelineForm() {
     const API_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
 
     try {
-      // Step 1: Upload and parse resume
+      // Resume parsing and timeline planning run server-side as one pipeline;
+      // progress arrives as NDJSON events (extracted -> resume -> timeline)
       const formData = new FormData();
       formData.append('file', file);
+      // With a goal and semester up front the server plans while the resume is
+      // still being analyzed; otherwise it waits for what the analysis infers
+      if (careerGoal.trim()) {
+        formData.append('career_goal', careerGoal.trim());
+      }
+      if (currentSemester) {
+        formData.append('current_semester', currentSemester);
+      }
 
-      const response = await fetch(`${API_URL}/api/upload-resume`, {
+      const response = await fetch(`${API_URL}/api/resume-to-timeline`, {
         method: 'POST',
         body: formData,
       });
 
-      if (!response.ok) {
+      if (!response.ok || !response.body) {
         throw new Error('Failed to parse resume');
       }
 
-      const data: ResumeData = await response.json();
-      setParsedData(data);
-      setParsing(false);
-
-      // Step 2: Automatically generate timeline if we have career goal
-      if (data.career_goal) {
-        await generateTimeline(data);
-      } else {
-        setUploading(false);
-      }
-    } catch (err) {
-      setError(err instanceof Error ? err.message : 'Failed to process resume');
-      setUploading(false);
-      setParsing(false);
-    }
-  };
-
-  const generateTimeline = async (resumeData: ResumeData) => {
-    setGenerating(true);
-    setTimelineGenerating(true);
-
-    const API_URL = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000';
-
-    try {
-      // Map academic level to semester
-      const semesterMap: Record<string, string> = {
-        freshman: 'Freshman Spring',
-        sophomore: 'Sophomore Fall',
-        junior: 'Junior Fall',
-        senior: 'Senior Fall',
-        graduate: 'Graduate Fall',
+      const reader = response.body.getReader();
+      const decoder = new TextDecoder();
+      let buffer = '';
+      let timelineReceived = false;
+
+      const handleEvent = (event: any) => {
+        if (event.stage === 'resume') {
+          setParsedData(event.resume as ResumeData);
+          setParsing(false);
+          setGenerating(true);
+          setTimelineGenerating(true);
+        } else if (event.stage === 'timeline') {
+          setTimelineData({ analysis: event.analysis, paths: event.paths });
+          timelineReceived = true;
+        } else if (event.stage === 'error') {
+          throw new Error(event.detail || 'Failed to generate timeline');
+        }
       };
 
-      const currentSemester =
-        semesterMap[resumeData.current_level.toLowerCase()] || 'Sophomore Fall';
-
-      // Create career goal text enriched with interests
-      let enrichedCareerGoal = resumeData.career_goal;
-      if (resumeData.interests && resumeData.interests.length > 0) {
-        enrichedCareerGoal += `. Interested in: ${resumeData.interests.join(', ')}`;
+      while (true) {
+        const { done, value } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+        const lines = buffer.split('\n');
+        buffer = lines.pop() || '';
+        for (const line of lines) {
+          if (line.trim()) handleEvent(JSON.parse(line));
+        }
       }
+      if (buffer.trim()) handleEvent(JSON.parse(buffer));
 
-      const requestBody = {
-        career_goal: enrichedCareerGoal,
-        completed_courses: resumeData.courses || [],
-        current_semester: currentSemester,
-        resume_data: resumeData,
-      };
-
-      const response = await fetch(`${API_URL}/api/plan-timeline`, {
-        method: 'POST',
-        headers: {
-          'Content-Type': 'application/json',
-        },
-        body: JSON.stringify(requestBody),
-      });
+      if (timelineReceived) {
+        // Small delay to ensure state is updated before navigation
+        await new Promise(resolve => setTimeout(resolve, 300));
 
-      if (!response.ok) {
-        throw new Error('Failed to generate timeline');
+        // Navigate to timeline view
+        router.push('/');
       }
-
-      const timelineData = await response.json();
-      setTimelineData(timelineData);
-
-      // Small delay to ensure state is updated before navigation
-      await new Promise(resolve => setTimeout(resolve, 300));
-
-      // Navigate to timeline view
-      router.push('/');
     } catch (err) {
-      const errorMsg = err instanceof Error ? err.message : 'Failed to generate timeline';
+      const errorMsg = err instanceof Error ? err.message : 'Failed to process resume';
       setError(errorMsg);
       setTimelineError(errorMsg);
     } finally {
+      setParsing(false);
       setGenerating(false);
       setUploading(false);
       setTimelineGenerating(false);
@@ -287,6 +268,47 @@ export default function ResumeToTimelineForm() {
                   </div>
                 </div>
 
+                {/* Career Goal Input */}
+                <div>
+                  <label className="block text-dark-700 text-sm font-semibold mb-2">
+                    What&apos;s your career goal? (optional)
+                  </label>
+                  <input
+                    type="text"
+                    value={careerGoal}
+                    onChange={(e) => setCareerGoal(e.target.value)}
+                    placeholder="Example: Machine learning engineer at a robotics startup"
+                    disabled={uploading}
+                    className="w-full px-4 py-3 bg-white/60 border border-gray-200/80 rounded-xl text-dark-900 placeholder-gray-400 focus:outline-none focus:ring-2 focus:ring-cornell-red focus:border-transparent transition-all shadow-sm"
+                  />
+                  <p className="text-dark-500 text-xs mt-1">
+                    Leave blank to use the goal found in your resume
+                  </p>
+                </div>
+
+                {/* Current Semester Input */}
+                <div>
+                  <label className="block text-dark-700 text-sm font-semibold mb-2">
+                    Where are you in your studies? (optional)
+                  </label>
+                  <select
+                    value={currentSemester}
+                    onChange={(e) => setCurrentSemester(e.target.value)}
+                    disabled={uploading}
+                    className="w-full px-4 py-3 bg-white/60 border border-gray-200/80 rounded-xl text-dark-900 focus:outline-none focus:ring-2 focus:ring-cornell-red focus:border-transparent transition-all shadow-sm"
+                  >
+                    <option value="">Detect from my resume</option>
+                    <option value="Freshman Spring">Freshman</option>
+                    <option value="Sophomore Fall">Sophomore</option>
+                    <option value="Junior Fall">Junior</option>
+                    <option value="Senior Fall">Senior</option>
+                    <option value="Graduate Fall">Graduate</option>
+                  </select>
+                  <p className="text-dark-500 text-xs mt-1">
+                    Giving both a goal and your year lets planning start sooner
+                  </p>
+                </div>
+
                 <button
                   onClick={handleUploadAndParse}
                   disabled={uploading}
@@ -18,9 +18,9 @@ export const graphAPI = {
 };
 
 export const chatAPI = {
-  sendMessage: async (message: string, history: any[] = []): Promise<string> => {
-    const { data } = await api.post<ChatResponse>('/api/chat', { message, history });
-    return data.response;
+  sendMessage: async (message: string, sessionId: string | null = null): Promise<ChatResponse> => {
+    const { data } = await api.post<ChatResponse>('/api/chat', { message, session_id: sessionId });
+    return data;
   },
 };
 
@@ -5,10 +5,12 @@ interface ChatStore {
   messages: ChatMessage[];
   isOpen: boolean;
   isTyping: boolean;
+  sessionId: string | null;
 
   addMessage: (msg: ChatMessage) => void;
   toggleChat: () => void;
   setTyping: (typing: boolean) => void;
+  setSessionId: (id: string | null) => void;
   clearMessages: () => void;
 }
 
@@ -16,11 +18,13 @@ export const useChatStore = create<ChatStore>((set) => ({
   messages: [],
   isOpen: false,
   isTyping: false,
+  sessionId: null,
 
   addMessage: (msg) => set((state) => ({
     messages: [...state.messages, msg]
   })),
   toggleChat: () => set((state) => ({ isOpen: !state.isOpen })),
   setTyping: (typing) => set({ isTyping: typing }),
-  clearMessages: () => set({ messages: [] }),
+  setSessionId: (id) => set({ sessionId: id }),
+  clearMessages: () => set({ messages: [], sessionId: null }),
 }));
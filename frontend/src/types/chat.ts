@@ -8,9 +8,11 @@ export interface ChatMessage {
 
 export interface ChatRequest {
   message: string;
+  session_id?: string | null;
   history?: Array<{role: string; content: string}>;
 }
 
 export interface ChatResponse {
   response: string;
+  session_id?: string | null;
 }